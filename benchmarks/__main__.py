@@ -0,0 +1,71 @@
+"""Suite de benchmarks du moteur.
+
+Usage :
+  python -m benchmarks run [--output FICHIER] [--group micro|macro] [--repeat N] [MOTIF ...]
+  python -m benchmarks compare REFERENCE [ACTUEL] [--threshold 0.10]
+
+`compare` sans fichier ACTUEL relance les benchmarks présents dans la
+référence. Le code de sortie vaut 1 si un benchmark ralentit de plus que
+le seuil (0.10 = 10 %).
+"""
+import argparse
+import sys
+import benchmarks.micro  # noqa: F401  (enregistrement des benchmarks)
+import benchmarks.macro  # noqa: F401
+from benchmarks.suite import (BENCHMARKS, DEFAULT_THRESHOLD, compare, format_time,
+                              load_results, run_suite, save_results, select)
+
+
+def print_result(name: str, result: dict):
+    print(f"{name:40s} {format_time(result['seconds_per_op']):>12s}/op "
+          f"{result['ops_per_second']:14,.1f} op/s")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="exécute les benchmarks")
+    run.add_argument("patterns", nargs="*", help="ne garder que les noms contenant un motif")
+    run.add_argument("--output", "-o", help="fichier de résultats JSON")
+    run.add_argument("--group", choices=("micro", "macro"))
+    run.add_argument("--repeat", type=int, default=5)
+
+    cmp = commands.add_parser("compare", help="compare à une référence")
+    cmp.add_argument("baseline", help="résultats de référence (JSON)")
+    cmp.add_argument("current", nargs="?", help="résultats à comparer (relancés sinon)")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp.add_argument("--repeat", type=int, default=5)
+    cmp.add_argument("--output", "-o", help="fichier où écrire les résultats relancés")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run_suite(select(args.patterns, args.group), args.repeat, print_result)
+        if args.output:
+            save_results(document, args.output)
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        names = [name for name in sorted(baseline['results']) if name in BENCHMARKS]
+        current = run_suite(names, args.repeat, print_result)
+        if args.output:
+            save_results(current, args.output)
+
+    slowdowns = 0
+    print(f"\n{'benchmark':40s} {'rapport':>8s}")
+    for name, ratio, slower in compare(baseline, current, args.threshold):
+        flag = "  RALENTI" if slower else ""
+        print(f"{name:40s} {ratio:8.2f}x{flag}")
+        slowdowns += slower
+    if slowdowns:
+        print(f"\n{slowdowns} benchmark(s) au-delà du seuil de {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Coût de préparation d'une partie : nouveau GameManager (et Deck) à chaque
+partie, comparé à GameManager.reset() ; durée et mémoire allouée mesurée
+avec tracemalloc (pic pendant la préparation, distribution comprise).
+
+Usage : python -m benchmarks.bench_game_setup [--iterations N]
+"""
+import argparse
+import time
+import tracemalloc
+from src.game.deck import Deck
+from src.game.game_manager import GameManager
+
+
+def new_game(seed: int):
+    GameManager("moyen", headless=True, ai_only=True, seed=seed).start_game()
+
+
+def reset_game(game: GameManager):
+    def setup(seed: int):
+        game.reset(seed)
+        game.start_game()
+    return setup
+
+
+def new_deck(seed: int):
+    Deck()
+
+
+def reset_deck(deck: Deck):
+    def setup(seed: int):
+        deck.reset()
+    return setup
+
+
+def per_setup(setup, iterations: int):
+    """(µs, octets alloués au pic, blocs restant alloués) par préparation"""
+    for seed in range(10):  # mise en route
+        setup(seed)
+    start = time.perf_counter()
+    for seed in range(iterations):
+        setup(seed)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    peak = 0
+    before = tracemalloc.take_snapshot()
+    samples = min(iterations, 200)
+    for seed in range(samples):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        setup(seed)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename')
+                 if 'tracemalloc' not in stat.traceback[0].filename)
+    return 1e6 * elapsed / iterations, peak / samples, blocks / samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    results = {
+        'Deck()': per_setup(new_deck, args.iterations),
+        'Deck.reset()': per_setup(reset_deck(Deck()), args.iterations),
+        'GameManager() + start': per_setup(new_game, args.iterations),
+        'reset() + start': per_setup(
+            reset_game(GameManager("moyen", headless=True, ai_only=True)), args.iterations),
+    }
+    print(f"{'':24s} {'µs':>8s} {'octets (pic)':>14s} {'blocs gardés':>14s}")
+    for name, (micros, peak, blocks) in results.items():
+        print(f"{name:24s} {micros:8.1f} {peak:14,.0f} {blocks:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
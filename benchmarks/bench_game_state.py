@@ -0,0 +1,65 @@
+"""Débit de GameState : clones par seconde et coups par seconde, comparés à
+un copy.deepcopy de GameManager.
+
+Usage : python -m benchmarks.bench_game_state [--iterations N] [--turns T]
+"""
+import argparse
+import copy
+import random
+import time
+from src.game.game_manager import GameManager
+from src.game.game_state import GameState
+
+
+def mid_game(turns: int) -> GameManager:
+    random.seed(0)
+    game = GameManager("moyen", headless=True, ai_only=True)
+    game.start_game()
+    for _ in range(turns):
+        if game.is_game_over():
+            break
+        game.play_turn()
+    return game
+
+
+def rate(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def moves_per_second(state: GameState, iterations: int) -> float:
+    """Parties jouées au hasard depuis des clones de `state`"""
+    rng = random.Random(0)
+    moves = 0
+    start = time.perf_counter()
+    while moves < iterations:
+        game = state.clone()
+        game.rng = rng
+        while game.winner is None and moves < iterations:
+            game.apply_move(rng.choice(game.legal_moves()))
+            moves += 1
+    return moves / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--turns", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    game = mid_game(args.turns)
+    state = GameState.from_game(game)
+    deepcopies = max(args.iterations // 100, 1)
+    results = {
+        'GameState.clone': rate(state.clone, args.iterations),
+        'deepcopy(GameManager)': rate(lambda: copy.deepcopy(game), deepcopies),
+        'GameState.apply_move': moves_per_second(state, args.iterations),
+    }
+    for name, per_second in results.items():
+        print(f"{name:24s} {per_second:12,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Comparaison du format binaire (v2) et du format JSON historique (v1).
+
+Usage : python -m benchmarks.bench_save_format [--iterations N] [--turns T]
+"""
+import argparse
+import random
+import tempfile
+import time
+from src.game.game_manager import GameManager
+from src.game.save_manager import SaveManager
+
+
+def legacy_state(game: GameManager) -> dict:
+    """État tel que l'écrivait save_current_game avant le format binaire"""
+    def card_dict(card):
+        return {'color': card.color.value, 'type': card.card_type.value, 'value': card.value}
+
+    return {
+        'difficulty': game.difficulty,
+        'current_player': game.current_player_index,
+        'direction': game.direction,
+        'scores': game.scores,
+        'stats': game.game_stats,
+        'players': [
+            {'name': p.name, 'is_ai': p.is_ai, 'hand': [card_dict(c) for c in p.hand]}
+            for p in game.players
+        ],
+        'discard_pile': [card_dict(c) for c in game.deck.discard_pile],
+        'achievements': list(game.achievements.unlocked),
+        'game_stats': game.game_stats
+    }
+
+
+def mid_game(turns: int) -> GameManager:
+    random.seed(0)
+    game = GameManager("moyen", headless=True, ai_only=True)
+    game.start_game()
+    for _ in range(turns):
+        if game.is_game_over():
+            break
+        game.play_turn()
+    return game
+
+
+def bench(save_format: str, build_state, iterations: int) -> dict:
+    with tempfile.TemporaryDirectory() as save_dir:
+        manager = SaveManager(save_dir, save_format=save_format)
+        manager.max_saves = iterations + 1
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            manager.save_game(build_state())
+        save_time = (time.perf_counter() - start) / iterations
+
+        save = manager.list_saves()[0]
+        start = time.perf_counter()
+        for _ in range(iterations):
+            manager.load_game(save['filename'])
+        load_time = (time.perf_counter() - start) / iterations
+        return {'save_us': save_time * 1e6, 'load_us': load_time * 1e6, 'size': save['size']}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    game = mid_game(args.turns)
+    results = {
+        'json (v1)': bench("json", lambda: legacy_state(game), args.iterations),
+        'binaire (v2)': bench("binary", game.snapshot_state, args.iterations),
+    }
+    print(f"{'format':14s} {'sauvegarde':>12s} {'chargement':>12s} {'taille':>9s}")
+    for name, r in results.items():
+        print(f"{name:14s} {r['save_us']:10.0f}µs {r['load_us']:10.0f}µs {r['size']:7d} o")
+
+
+if __name__ == "__main__":
+    main()
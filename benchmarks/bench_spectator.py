@@ -0,0 +1,52 @@
+"""Diffusion aux spectateurs : N abonnés en mémoire à une partie, deltas
+encodés une fois par coup comparés à l'envoi de l'état complet à chacun.
+
+Usage : python -m benchmarks.bench_spectator [--subscribers N] [--games G]
+"""
+import argparse
+import time
+from src.game.game_manager import GameManager
+from src.server.protocol import encode
+from src.server.spectator import SpectatorFeed
+
+
+def play(seed: int, subscribers: int, full_state: bool):
+    """Joue une partie suivie par `subscribers` spectateurs ; (coups, octets, secondes)"""
+    game = GameManager("moyen", headless=True, ai_only=True, seed=seed)
+    game.start_game()
+    feed = SpectatorFeed(game, queue_limit=1 << 20)
+    queues = [] if full_state else [feed.subscribe() for _ in range(subscribers)]
+    moves = 0
+    sent = 0
+    start = time.perf_counter()
+    while not game.is_game_over():
+        game.play_turn()
+        moves += 1
+        if full_state:
+            # Référence : l'état public re-sérialisé pour chaque spectateur
+            for _ in range(subscribers):
+                sent += len(encode(feed.snapshot()))
+        for queue in queues:
+            sent += sum(len(data) for data in queue.take())
+    game.end_game()
+    elapsed = time.perf_counter() - start
+    return moves, sent // max(subscribers, 1), elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for name, full_state in (("deltas", False), ("état complet", True)):
+        moves = sent = elapsed = 0
+        for seed in range(args.games):
+            m, s, e = play(seed, args.subscribers, full_state)
+            moves, sent, elapsed = moves + m, sent + s, elapsed + e
+        print(f"{name:14s} {moves / elapsed:10,.0f} coups/s  "
+              f"{sent / moves:8,.1f} octets/coup/spectateur  ({args.subscribers} spectateurs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""StatsStore : débit d'écriture (lignes/s, par lots) puis latence des
+requêtes de classement et de carrière sur une base de --rows résultats
+(une partie = une ligne `games` et quatre lignes `results`).
+
+Usage : python -m benchmarks.bench_stats_store [--rows 10000000] [--batch 5000] [--db FICHIER]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from src.game.stats_store import StatsStore
+
+DIFFICULTIES = ("facile", "moyen", "difficile", "expert")
+PROFILES = [f"IA {i}" for i in range(1, 200)] + ["Joueur"]
+
+
+def synthetic_games(count: int, seed: int = 0):
+    """Parties factices : quatre profils tirés au hasard, un gagnant"""
+    rng = random.Random(seed)
+    now = time.time()
+    for i in range(count):
+        names = rng.sample(PROFILES, 4)
+        winner = rng.randrange(4)
+        score = rng.randrange(20, 300)
+        turns = rng.randrange(10, 120)
+        game = (now + i, rng.choice(DIFFICULTIES), rng.getrandbits(32), winner, score,
+                turns - 5, turns, rng.randrange(60), rng.randrange(20), rng.randrange(7, 20))
+        players = [(seat, name, name != "Joueur", seat == winner,
+                    score if seat == winner else 0, 0 if seat == winner else rng.randrange(1, 15))
+                   for seat, name in enumerate(names)]
+        yield game, players
+
+
+def ingest(store: StatsStore, games: int) -> float:
+    """Lignes (games + results) écrites par seconde"""
+    rows = list(synthetic_games(games, seed=store.games_written))
+    start = time.perf_counter()
+    for game, players in rows:
+        store.record(game, players)
+    store.flush()
+    return games * 5 / (time.perf_counter() - start)
+
+
+def latency(func, repeat: int = 20) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000, help="lignes de résultats")
+    parser.add_argument("--batch", type=int, default=5000, help="parties par transaction")
+    parser.add_argument("--db", default=None, help="base à utiliser (conservée)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.db or os.path.join(temp_dir, "stats.db")
+        store = StatsStore(path, batch_size=args.batch)
+        games = max(args.rows // 4 - store.games_written, 0)
+        rates = []
+        chunk = max(games // 10, 1)
+        while games > 0:
+            count = min(chunk, games)
+            rates.append(ingest(store, count))
+            games -= count
+        if rates:
+            print(f"Écriture : {statistics.mean(rates):12,.0f} lignes/s "
+                  f"(premier dixième {rates[0]:,.0f}, dernier {rates[-1]:,.0f})")
+        rows = store.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        print(f"Requêtes sur {rows:,} résultats (médiane, ms) :")
+        queries = {
+            'leaderboard()': store.leaderboard,
+            'leaderboard("difficile")': lambda: store.leaderboard("difficile"),
+            'career("Joueur")': lambda: store.career("Joueur"),
+            'recent_games("Joueur")': lambda: store.recent_games("Joueur"),
+            'recent_games("Joueur", "moyen")': lambda: store.recent_games("Joueur", "moyen"),
+            'difficulty_summary("moyen")': lambda: store.difficulty_summary("moyen"),
+        }
+        for name, query in queries.items():
+            print(f"  {name:34s} {latency(query):10.3f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
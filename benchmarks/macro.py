@@ -0,0 +1,40 @@
+"""Macrobenchmarks : parties complètes IA contre IA par seconde"""
+import random
+from functools import partial
+from benchmarks.suite import benchmark
+from src.game.game_manager import GameManager
+from src.sim.batch import DIFFICULTIES as BATCH_DIFFICULTIES, BatchSimulator
+from src.sim.headless import play_headless_game
+
+DIFFICULTIES = ("facile", "moyen", "difficile")
+BATCH_GAMES = 1000
+
+
+def bench_game(difficulty: str):
+    rng = random.Random(0)
+    yield lambda: play_headless_game(difficulty, seed=rng.getrandbits(32))
+
+
+def bench_game_achievements(difficulty: str):
+    # Succès de la première IA suivis, remis à zéro à chaque partie
+    rng = random.Random(0)
+    game = GameManager(difficulty, headless=True, ai_only=True)
+    game.achievements.attach(game.events, game.players[0])
+
+    def run():
+        game.achievements.reset()
+        play_headless_game(difficulty, seed=rng.getrandbits(32), game=game)
+    yield run
+
+
+def bench_batch(difficulty: str):
+    rng = random.Random(0)
+    yield lambda: BatchSimulator(BATCH_GAMES, difficulty, seed=rng.getrandbits(32)).run()
+
+for _difficulty in DIFFICULTIES:
+    benchmark(f"game.full_game[{_difficulty}]", group="macro")(partial(bench_game, _difficulty))
+    benchmark(f"game.full_game_achievements[{_difficulty}]", group="macro")(
+        partial(bench_game_achievements, _difficulty))
+    if _difficulty in BATCH_DIFFICULTIES:
+        benchmark(f"batch.full_game[{_difficulty}]", group="macro", inner=BATCH_GAMES)(
+            partial(bench_batch, _difficulty))
@@ -0,0 +1,171 @@
+"""Microbenchmarks des chemins critiques du moteur"""
+import io
+import os
+import random
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from functools import partial
+from pathlib import Path
+from benchmarks.suite import benchmark
+from src.game.ai_strategy import AIStrategy
+from src.game.card import Card, Color, CardType, ALL_CARDS
+from src.game.decision_cache import DecisionCache
+from src.game.deck import Deck, DECK_TEMPLATE
+from src.game.game_manager import GameManager
+from src.game.save_format import encode_state
+from src.game.save_manager import SaveManager
+from src.ui.console_ui import ConsoleUI
+
+SAVE_COUNTS = (1, 100, 10000)
+
+_FULL_DECK = list(DECK_TEMPLATE)
+_HAND = [
+    Card(Color.RED, CardType.NUMBER, 3),
+    Card(Color.BLUE, CardType.NUMBER, 7),
+    Card(Color.GREEN, CardType.SKIP),
+    Card(Color.RED, CardType.DRAW_TWO),
+    Card(Color.YELLOW, CardType.NUMBER, 1),
+    Card(Color.BLUE, CardType.REVERSE),
+    Card(Color.BLACK, CardType.WILD)
+]
+_TOP = Card(Color.RED, CardType.NUMBER, 7)
+
+
+def mid_game(turns: int = 30) -> GameManager:
+    game = GameManager("moyen", headless=True, ai_only=True, seed=0)
+    game.start_game()
+    for _ in range(turns):
+        if game.is_game_over():
+            break
+        game.play_turn()
+    return game
+
+
+_PAIRS = [(random.Random(0).choice(ALL_CARDS), top) for top in ALL_CARDS] * 2
+
+@benchmark("card.can_be_played_on", inner=len(_PAIRS))
+def bench_can_be_played_on():
+    def run():
+        for card, top in _PAIRS:
+            card.can_be_played_on(top)
+    yield run
+
+
+@benchmark("deck.init")
+def bench_deck_init():
+    yield Deck
+
+
+@benchmark("deck.reset")
+def bench_deck_reset():
+    yield Deck(random.Random(0)).reset
+
+
+@benchmark("deck.shuffle")
+def bench_deck_shuffle():
+    yield Deck(random.Random(0)).shuffle
+
+
+@benchmark("deck.draw_card", inner=len(_FULL_DECK))
+def bench_deck_draw_card():
+    deck = Deck(random.Random(0))
+
+    def run():
+        deck.cards = list(_FULL_DECK)
+        for _ in _FULL_DECK:
+            deck.draw_card()
+    yield run
+
+
+@benchmark("deck.reshuffle_discard_pile")
+def bench_deck_reshuffle():
+    deck = Deck(random.Random(0))
+
+    def run():
+        deck.cards = []
+        deck.discard_pile = list(_FULL_DECK)
+        deck._reshuffle_discard_pile()
+    yield run
+
+
+def bench_ai_strategy(difficulty: str, cached: bool = False):
+    others = {"IA 2": 5, "IA 3": 2, "IA 4": 9}
+    cache = DecisionCache() if cached else None
+    yield partial(AIStrategy.choose_card, difficulty, _HAND, _TOP, others, cache)
+
+for _difficulty in ("facile", "moyen", "difficile"):
+    benchmark(f"ai_strategy.choose_card[{_difficulty}]")(partial(bench_ai_strategy, _difficulty))
+    benchmark(f"ai_strategy.choose_card[{_difficulty},cache]")(
+        partial(bench_ai_strategy, _difficulty, True))
+
+
+@benchmark("game_manager.reset")
+def bench_game_reset():
+    game = mid_game()
+
+    def run():
+        game.reset(0)
+        game.start_game()
+    yield run
+
+
+@benchmark("game_manager.calculate_round_score")
+def bench_round_score():
+    game = mid_game()
+    yield partial(game.calculate_round_score, game.players[0])
+
+
+def bench_display_game_state(full: bool):
+    game = mid_game()
+    game.players[0].is_ai = False  # affichage de la main
+    ui = ConsoleUI()
+    ui.renderer.stream = io.StringIO()
+    ui.renderer._rows = lambda: 100
+
+    def run():
+        if full:
+            ui.renderer.invalidate()
+        ui.display_game_state(game.players[0], game.top_card, game)
+        ui.renderer.stream.seek(0)
+        ui.renderer.stream.truncate()
+    yield run
+
+for _mode, _full in (("diff", False), ("full", True)):
+    benchmark(f"console_ui.display_game_state[{_mode}]")(partial(bench_display_game_state, _full))
+
+
+@contextmanager
+def save_dir(count: int):
+    """Répertoire temporaire contenant `count` sauvegardes binaires indexées"""
+    with tempfile.TemporaryDirectory() as directory:
+        data = encode_state(mid_game().snapshot_state())
+        for i in range(count):
+            (Path(directory) / f"uno_save_{i:08d}.uno").write_bytes(data)
+        manager = SaveManager(directory)
+        manager.max_saves = count + 1
+        manager.list_saves()
+        # load_game et save_game affichent des messages de debug
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            yield manager
+
+
+def bench_save_game(count: int):
+    state = mid_game().snapshot_state()
+    with save_dir(count) as manager:
+        yield partial(manager.save_game, state)
+
+
+def bench_load_game(count: int):
+    with save_dir(count) as manager:
+        yield partial(manager.load_game, manager.list_saves()[0]['filename'])
+
+
+def bench_list_saves(count: int):
+    # Listage depuis un SaveManager neuf (menu de chargement) : lecture de l'index
+    with save_dir(count) as manager:
+        yield lambda: SaveManager(manager.save_dir).list_saves()
+
+for _count in SAVE_COUNTS:
+    benchmark(f"save_manager.save_game[{_count}]")(partial(bench_save_game, _count))
+    benchmark(f"save_manager.load_game[{_count}]")(partial(bench_load_game, _count))
+    benchmark(f"save_manager.list_saves[{_count}]")(partial(bench_list_saves, _count))
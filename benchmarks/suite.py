@@ -0,0 +1,114 @@
+"""Suite de benchmarks : enregistrement, mesure, résultats JSON et comparaison.
+
+Un benchmark est une fonction génératrice décorée par @benchmark : elle
+prépare ses données, produit (yield) la fonction à chronométrer, puis
+nettoie après le yield. Les mesures suivent timeit : nombre d'appels
+calibré (autorange) puis meilleure de plusieurs séries.
+"""
+import json
+import platform
+import sys
+import timeit
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.10  # ralentissement toléré (10 %)
+
+
+class Benchmark:
+    def __init__(self, name: str, group: str, factory: Callable[[], Iterator[Callable]],
+                 inner: int = 1):
+        self.name = name
+        self.group = group  # "micro" ou "macro"
+        self.factory = contextmanager(factory)
+        self.inner = inner  # opérations par appel de la fonction chronométrée
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str = "micro", inner: int = 1):
+    """Enregistre un benchmark (nom unique, de la forme module.opération[paramètre])"""
+    def register(factory):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark déjà enregistré : {name}")
+        BENCHMARKS[name] = Benchmark(name, group, factory, inner)
+        return factory
+    return register
+
+
+def measure(bench: Benchmark, repeat: int = 5) -> dict:
+    with bench.factory() as func:
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        times = timer.repeat(repeat, number)
+    per_op = min(times) / number / bench.inner
+    return {
+        'group': bench.group,
+        'seconds_per_op': per_op,
+        'ops_per_second': 1 / per_op if per_op else float('inf'),
+        'number': number * bench.inner,
+        'repeat': repeat
+    }
+
+
+def run_suite(names: Optional[List[str]] = None, repeat: int = 5,
+              report: Optional[Callable[[str, dict], None]] = None) -> dict:
+    """Exécute les benchmarks demandés (tous par défaut) et renvoie le document JSON"""
+    results = {}
+    for name in names if names is not None else sorted(BENCHMARKS):
+        results[name] = measure(BENCHMARKS[name], repeat)
+        if report is not None:
+            report(name, results[name])
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results
+    }
+
+
+def select(patterns: Optional[List[str]] = None, group: Optional[str] = None) -> List[str]:
+    """Noms des benchmarks dont le nom contient un des motifs (et du groupe demandé)"""
+    return [
+        name for name in sorted(BENCHMARKS)
+        if (group is None or BENCHMARKS[name].group == group)
+        and (not patterns or any(pattern in name for pattern in patterns))
+    ]
+
+
+def save_results(document: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if document.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Version de résultats inconnue : {document.get('version')}")
+    return document
+
+
+def compare(baseline: dict, current: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, bool]]:
+    """(nom, rapport actuel/référence du temps par opération, ralentissement) pour
+    chaque benchmark présent dans les deux résultats"""
+    rows = []
+    for name, result in sorted(current['results'].items()):
+        reference = baseline['results'].get(name)
+        if reference is None or not reference['seconds_per_op']:
+            continue
+        ratio = result['seconds_per_op'] / reference['seconds_per_op']
+        rows.append((name, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
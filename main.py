@@ -1,30 +1,57 @@
 from src.ui.menu import Menu
 from src.game.game_manager import GameManager
 from src.game.save_manager import SaveManager
+from src.game.journal import MoveJournal
+from src.game.stats_store import StatsStore
 
 def main():
     menu = Menu()
     save_manager = SaveManager()
+    # Sauvegarde automatique à chaque coup
+    journal = MoveJournal(save_manager.save_dir / "journal")
+    game = None
 
-    saves = save_manager.list_saves()
-    if saves and menu.ask_load_game():
-        game = GameManager("facile") 
-        save_file = menu.ui.choose_save_file(saves)
-        if save_file and game.load_game(save_file):
-            menu.ui.show_message("Partie chargée avec succès !")
+    if journal.exists() and menu.ask_resume_game():
+        game = GameManager("facile")
+        if game.resume_journal(journal):
+            menu.ui.show_message("Partie reprise avec succès !")
         else:
-            difficulty = menu.choose_difficulty()
-            game = GameManager(difficulty)
-    else:
+            game = None
+
+    if game is None:
+        saves = save_manager.list_saves()
+        if saves and menu.ask_load_game():
+            game = GameManager("facile") 
+            save_file = menu.ui.choose_save_file(saves)
+            if save_file and game.load_game(save_file):
+                menu.ui.show_message("Partie chargée avec succès !")
+                game.enable_journal(journal)
+                journal.start(game.snapshot_state())
+            else:
+                game = None
+
+    if game is None:
         difficulty = menu.choose_difficulty()
         game = GameManager(difficulty)
+        game.enable_journal(journal)
+        game.start_game()
     
-    game.start_game()
-    
+    # Succès conservés d'une partie à l'autre
+    game.achievements.load_profile(save_manager.save_dir / "profils" / "Joueur.json")
+    # Résultats et statistiques de carrière
+    game.stats_store = StatsStore(save_manager.save_dir / "stats.db")
+    # Animations jouées en parallèle de la partie (une touche passe l'animation en cours)
+    game.ui.animation_enabled = True
+    # Durée des phases de chaque tour, visible avec !stats
+    game.enable_profiling()
     while not game.is_game_over():
         game.play_turn()
     
     game.end_game()
+    game.stats_store.close()
+    if game.record is not None:
+        # Graine et décisions : python -m src.game.replay <fichier> rejoue la partie
+        game.record.save(save_manager.save_dir / "replays" / f"partie_{game.seed}.json")
 
 if __name__ == "__main__":
     main()
@@ -1,53 +1,233 @@
-from typing import Dict, Set
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from .card import CardType
+from .events import (AchievementUnlocked, CardPlayed, CardsDrawn, EventStream, GameEvent,
+                     GameOver, GameStarted, Subscription)
+from .player import Player
+
+PROFILE_VERSION = 1
+
+# (compteurs du succès, événement, joueur suivi) -> True si le succès est débloqué
+Update = Callable[[dict, GameEvent, Player], bool]
+
+
+class AchievementRule:
+    """Succès déclaré par les événements qui le font progresser.
+
+    `on` associe à chaque type d'événement une mise à jour de compteurs ;
+    elle n'est appelée que lorsque cet événement est publié et, s'il
+    concerne un joueur (carte posée, pioche), que c'est le joueur suivi. Les compteurs
+    d'un succès `per_game` repartent de zéro à chaque partie, les autres
+    sont conservés dans le profil du joueur.
+    """
+    __slots__ = ('id', 'name', 'description', 'icon', 'on', 'per_game')
+
+    def __init__(self, achievement_id: str, name: str, description: str, icon: str,
+                 on: Dict[type, Update], per_game: bool = True):
+        self.id = achievement_id
+        self.name = name
+        self.description = description
+        self.icon = icon
+        self.on = on
+        self.per_game = per_game
+
+
+# Succès connus, par identifiant
+ACHIEVEMENT_RULES: Dict[str, AchievementRule] = {}
+
+
+def register_achievement(rule: AchievementRule) -> AchievementRule:
+    ACHIEVEMENT_RULES[rule.id] = rule
+    return rule
+
+
+def _won(counters: dict, event: GameOver, player: Player) -> bool:
+    return event.winner is player
+
+
+def _count_drawn(counters: dict, event: CardsDrawn, player: Player) -> bool:
+    counters['drawn'] = counters.get('drawn', 0) + event.count
+    counters['max_hand'] = max(counters.get('max_hand', 0), len(player.hand))
+    return False
+
+
+def _count_special(counters: dict, event: CardPlayed, player: Player) -> bool:
+    if event.card.card_type != CardType.NUMBER:
+        counters['special'] = counters.get('special', 0) + 1
+        return counters['special'] >= 5
+    return False
+
+
+def _count_wins(counters: dict, event: GameOver, player: Player) -> bool:
+    if event.winner is player:
+        counters['wins'] = counters.get('wins', 0) + 1
+    return counters.get('wins', 0) >= 10
+
+
+register_achievement(AchievementRule(
+    'first_win', "Premier Succès", "Gagner votre première partie", "🏆",
+    {GameOver: _won}, per_game=False
+))
+register_achievement(AchievementRule(
+    'perfect_game', "Partie Parfaite", "Gagner sans piocher de carte", "⭐",
+    {CardsDrawn: _count_drawn,
+     GameOver: lambda counters, event, player: event.winner is player and not counters.get('drawn')}
+))
+register_achievement(AchievementRule(
+    'comeback', "Retour Victorieux", "Gagner après avoir eu 10 cartes en main ou plus", "🔄",
+    {CardsDrawn: _count_drawn,
+     GameOver: lambda counters, event, player: (event.winner is player
+                                                and counters.get('max_hand', 0) >= 10)}
+))
+register_achievement(AchievementRule(
+    'special_master', "Maître des Cartes Spéciales", "Jouer 5 cartes spéciales dans une partie", "✨",
+    {CardPlayed: _count_special}
+))
+register_achievement(AchievementRule(
+    'veteran', "Vétéran", "Gagner 10 parties", "🎖",
+    {GameOver: _count_wins}, per_game=False
+))
+
 
 class Achievements:
-    def __init__(self):
+    """Succès d'un joueur, évalués à partir des événements de sa partie.
+
+    Seuls les événements dont dépend un succès encore verrouillé sont
+    suivis : un succès débloqué cesse d'être évalué, et une partie sans
+    joueur suivi (simulations) ne coûte rien.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, AchievementRule]] = None):
+        self.rules = rules if rules is not None else ACHIEVEMENT_RULES
         self.unlocked: Set[str] = set()
-        self.achievements: Dict[str, dict] = {
-            'first_win': {
-                'name': "Premier Succès",
-                'description': "Gagner votre première partie",
-                'icon': "🏆"
-            },
-            'perfect_game': {
-                'name': "Partie Parfaite",
-                'description': "Gagner sans piocher de carte",
-                'icon': "⭐"
-            },
-            'comeback': {
-                'name': "Retour Victorieux",
-                'description': "Gagner avec plus de 10 cartes en main",
-                'icon': "🔄"
-            },
-            'special_master': {
-                'name': "Maître des Cartes Spéciales",
-                'description': "Jouer 5 cartes spéciales dans une partie",
-                'icon': "✨"
-            }
-        }
-        
-    def check_achievement(self, achievement_id: str, game_state: dict) -> bool:
-        if achievement_id in self.unlocked:
+        self.progress: Dict[str, dict] = {}  # compteurs par succès
+        self.profile_path: Optional[Path] = None
+        self._events: Optional[EventStream] = None
+        self._player: Optional[Player] = None
+        self._subscriptions: List[Subscription] = []
+        self._dispatch: Dict[type, Tuple[AchievementRule, ...]] = {}
+
+    @property
+    def player(self) -> Optional[Player]:
+        """Joueur dont les succès sont suivis"""
+        return self._player
+
+    def attach(self, events: EventStream, player: Optional[Player]):
+        """Suit les succès de `player` dans la partie qui publie `events`"""
+        self.detach()
+        self._events = events
+        self._player = player
+        if player is None:
+            return
+        dispatch: Dict[type, Tuple[AchievementRule, ...]] = {}
+        per_game = False
+        for rule in self.rules.values():
+            if rule.id in self.unlocked:
+                continue
+            self.progress.setdefault(rule.id, {})
+            per_game = per_game or rule.per_game
+            for event_type in rule.on:
+                dispatch[event_type] = dispatch.get(event_type, ()) + (rule,)
+        self._dispatch = dispatch
+        for event_type in dispatch:
+            self._subscribe(event_type, self._handler(event_type))
+        if per_game:
+            self._subscribe(GameStarted, self._on_game_started)
+
+    def detach(self):
+        if self._events is not None:
+            self._events.disconnect(self._subscriptions)
+        self._subscriptions = []
+        self._dispatch = {}
+
+    def reset(self):
+        """Oublie les succès débloqués et leur progression"""
+        self.unlocked.clear()
+        self.progress.clear()
+        if self._events is not None:
+            self.attach(self._events, self._player)
+
+    def _subscribe(self, event_type: type, handler: Callable[[GameEvent], None]):
+        self._events.subscribe(event_type, handler)
+        self._subscriptions.append((event_type, handler))
+
+    def _on_game_started(self, event: GameStarted):
+        for rules in self._dispatch.values():
+            for rule in rules:
+                if rule.per_game:
+                    self.progress[rule.id].clear()
+
+    def _handler(self, event_type: type) -> Callable[[GameEvent], None]:
+        # Les cartes posées et piochées par les autres joueurs ne sont pas évaluées
+        return self._on_player_event if 'player' in event_type.__slots__ else self._on_event
+
+    def _on_player_event(self, event: GameEvent):
+        if event.player is self._player:
+            self._on_event(event)
+
+    def _on_event(self, event: GameEvent):
+        player = self._player
+        for rule in self._dispatch.get(type(event), ()):
+            if rule.id not in self.unlocked \
+                    and rule.on[type(event)](self.progress[rule.id], event, player):
+                self._unlock(rule)
+
+    def _unlock(self, rule: AchievementRule):
+        self.unlocked.add(rule.id)
+        self.progress.pop(rule.id, None)
+        # Le succès n'est plus évalué ; un événement sans succès à suivre n'est plus écouté
+        for event_type in rule.on:
+            rules = tuple(r for r in self._dispatch.get(event_type, ()) if r is not rule)
+            if rules:
+                self._dispatch[event_type] = rules
+                continue
+            self._dispatch.pop(event_type, None)
+            handler = self._handler(event_type)
+            self._events.unsubscribe(event_type, handler)
+            self._subscriptions.remove((event_type, handler))
+        self._events.publish(AchievementUnlocked(rule.id))
+
+    def load_profile(self, path: Union[str, Path]):
+        """Succès et progression conservés d'une partie à l'autre (fichier JSON)"""
+        self.profile_path = Path(path)
+        try:
+            data = json.loads(self.profile_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la lecture du profil : {e}")
+            return
+        self.unlocked |= set(data.get('unlocked', []))
+        for achievement_id, counters in data.get('progress', {}).items():
+            rule = self.rules.get(achievement_id)
+            if rule is not None and not rule.per_game and achievement_id not in self.unlocked:
+                self.progress[achievement_id] = dict(counters)
+        if self._events is not None:
+            self.attach(self._events, self._player)
+
+    def save_profile(self) -> bool:
+        if self.profile_path is None:
             return False
-            
-        if self._conditions_met(achievement_id, game_state):
-            self.unlocked.add(achievement_id)
+        data = {
+            'version': PROFILE_VERSION,
+            'unlocked': sorted(self.unlocked),
+            'progress': {achievement_id: counters for achievement_id, counters in self.progress.items()
+                         if counters and not self.rules[achievement_id].per_game}
+        }
+        try:
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.profile_path.with_suffix('.tmp')
+            temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_path, self.profile_path)
             return True
-        return False
-        
-    def _conditions_met(self, achievement_id: str, game_state: dict) -> bool:
-        if achievement_id == 'first_win':
-            return game_state.get('games_won', 0) == 1
-        elif achievement_id == 'perfect_game':
-            return game_state.get('cards_drawn', 0) == 0
-        elif achievement_id == 'comeback':
-            return game_state.get('max_cards_in_hand', 0) >= 10
-        elif achievement_id == 'special_master':
-            return game_state.get('special_cards_played', 0) >= 5
-        return False
-        
+        except OSError as e:
+            print(f"Erreur lors de l'écriture du profil : {e}")
+            return False
+
     def display_achievement(self, achievement_id: str):
-        achievement = self.achievements[achievement_id]
+        rule = self.rules[achievement_id]
         print(f"\n🎉 SUCCÈS DÉBLOQUÉ ! 🎉")
-        print(f"{achievement['icon']} {achievement['name']}")
-        print(f"➤ {achievement['description']}") 
\ No newline at end of file
+        print(f"{rule.icon} {rule.name}")
+        print(f"➤ {rule.description}")
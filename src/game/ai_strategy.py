@@ -1,10 +1,151 @@
-from typing import List
-from .card import Card, CardType, Color
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING
+from .card import Card, CardType, Color, PLAYABLE_COLORS
+from .decision_cache import DecisionCache, hand_key
+from .hand import playable_cards
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+    from .player import Player
+
+# (partie, joueur, cartes jouables non vides) -> carte à poser, ou sa variante
+# à couleur annoncée pour un Joker/+4 (sinon l'IA annonce sa couleur la plus présente)
+Strategy = Callable[['GameManager', 'Player', List[Card]], Card]
+
+# Stratégies des IA par nom ; les niveaux de difficulté en sont les premières
+STRATEGIES: Dict[str, Strategy] = {}
+# Stratégies dont le choix ne dépend que des cartes jouables et de la carte
+# visible : leurs décisions peuvent être mises en cache (voir decision_key)
+CACHEABLE_STRATEGIES: Set[Strategy] = set()
+# Stratégies qui comptent les cartes : la partie suit pour elles ce que
+# révèlent les événements (game.beliefs, voir beliefs.CardBeliefs)
+BELIEF_STRATEGIES: Set[Strategy] = set()
+
+
+def register_strategy(name: str, cacheable: bool = False,
+                      beliefs: bool = False) -> Callable[[Strategy], Strategy]:
+    """Décorateur : enregistre une stratégie sous `name` (tournois, Player.strategy)"""
+    def register(strategy: Strategy) -> Strategy:
+        CACHEABLE_STRATEGIES.discard(STRATEGIES.get(name))
+        BELIEF_STRATEGIES.discard(STRATEGIES.get(name))
+        STRATEGIES[name] = strategy
+        if cacheable:
+            CACHEABLE_STRATEGIES.add(strategy)
+        if beliefs:
+            BELIEF_STRATEGIES.add(strategy)
+        return strategy
+    return register
+
+
+def decision_key(strategy: Strategy, playable: List[Card], top_card: Card) -> tuple:
+    """Clé d'une décision d'une stratégie de CACHEABLE_STRATEGIES ; les cartes
+    jouables sont dans l'ordre canonique des identifiants (Hand.playable)"""
+    return (strategy, tuple(card.id for card in playable), top_card.id)
+
+
+@register_strategy("facile", cacheable=True)
+def first_playable(game: 'GameManager', player: 'Player', playable: List[Card]) -> Card:
+    return playable[0]
+
+
+@register_strategy("moyen", cacheable=True)
+def same_color_first(game: 'GameManager', player: 'Player', playable: List[Card]) -> Card:
+    # Jouer les cartes de même couleur en priorité
+    color = game.top_card.color
+    for card in playable:
+        if card.color == color:
+            return card
+    return playable[0]
+
+
+def specials_first(game: 'GameManager', player: 'Player', playable: List[Card]) -> Card:
+    # Priorité aux cartes spéciales
+    for card in playable:
+        if card.card_type != CardType.NUMBER:
+            return card
+    return same_color_first(game, player, playable)
+
+
+# Une carte spéciale compte pour une carte de moins chez l'adversaire qui la subit
+# (entre 0,5 et 2, l'écart reste dans l'intervalle de confiance d'un tournoi de 12 000 parties)
+SPECIAL_BONUS = 1.0
+
+
+def facing_seat(game: 'GameManager', card: Card) -> int:
+    """Place du joueur qui devra jouer sur `card` une fois posée"""
+    index, direction, seats = game.current_player_index, game.direction, len(game.players)
+    if card.card_type in (CardType.SKIP, CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR):
+        return (index + 2 * direction) % seats
+    if card.card_type == CardType.REVERSE:
+        return (index - direction) % seats
+    return (index + direction) % seats
+
+
+@register_strategy("difficile", beliefs=True)
+def card_counting(game: 'GameManager', player: 'Player', playable: List[Card]) -> Card:
+    # La couleur que l'adversaire suivant a le moins de chances d'avoir ; les cartes noires en dernier
+    beliefs = game.beliefs
+    if beliefs is None:
+        return specials_first(game, player, playable)
+    if len(playable) == 1:
+        return playable[0]
+    top_color = game.top_card.color
+    known: Dict[tuple, float] = {}  # (place, couleur) -> cartes attendues
+
+    def risk(card: Card):
+        if card.color == Color.BLACK:
+            return (1, 0.0, False)
+        key = (facing_seat(game, card), card.color)
+        expected = known.get(key)
+        if expected is None:
+            expected = known[key] = beliefs.expected_color(player, key[0], card.color)
+        if card.card_type != CardType.NUMBER:
+            expected -= SPECIAL_BONUS
+        return (0, expected, card.color != top_color)
+
+    return min(playable, key=risk)
+
+
+def counting_color(game: 'GameManager', player: 'Player', card: Card) -> Color:
+    """Couleur annoncée sur un Joker/+4 par une stratégie qui compte les cartes :
+    la plus présente dans la main, puis la moins probable chez l'adversaire suivant"""
+    facing = facing_seat(game, card)
+    return max(PLAYABLE_COLORS, key=lambda color: (
+        player.hand.color_count(color), -game.beliefs.expected_color(player, facing, color)))
+
+
+@register_strategy("expert")
+def expert_search(game: 'GameManager', player: 'Player', playable: List[Card]) -> Card:
+    # La recherche est bornée en temps : son coup est enregistré pour le replay
+    return Card.from_id(game._decide(game._expert_move))
+
 
 class AIStrategy:
+    # Taille de main adverse à partir de laquelle la stratégie difficile joue ses cartes d'action
+    danger_threshold = 2
+    # Incrémentée à chaque changement de paramètre : les décisions en cache ne servent plus
+    version = 0
+
+    @classmethod
+    def configure(cls, danger_threshold: Optional[int] = None):
+        if danger_threshold is not None:
+            cls.danger_threshold = danger_threshold
+        cls.version += 1
+
     @staticmethod
     def choose_card(difficulty: str, hand: List[Card], top_card: Card, 
-                   other_players_cards: dict) -> Card:
+                   other_players_cards: dict, cache: Optional[DecisionCache] = None) -> Card:
+        if cache is not None:
+            # La main compte comme multiensemble ; les adversaires, par la plus petite
+            # main, confondue au-delà du seuil (la stratégie ne les distingue pas).
+            # Le seuil fait partie de la clé, même modifié sans passer par configure
+            threshold = AIStrategy.danger_threshold
+            bucket = 0
+            if difficulty not in ("facile", "moyen"):
+                bucket = min(min(other_players_cards.values()), threshold + 1)
+            key = (AIStrategy, AIStrategy.version, threshold, difficulty, hand_key(hand),
+                   top_card.id, bucket)
+            return cache.decide(key, lambda: AIStrategy.choose_card(
+                difficulty, hand, top_card, other_players_cards))
         if difficulty == "facile":
             return AIStrategy._easy_strategy(hand, top_card)
         elif difficulty == "moyen":
@@ -14,12 +155,12 @@ class AIStrategy:
             
     @staticmethod
     def _easy_strategy(hand: List[Card], top_card: Card) -> Card:
-        playable = [c for c in hand if c.can_be_played_on(top_card)]
+        playable = playable_cards(hand, top_card)
         return playable[0] if playable else None
         
     @staticmethod
     def _medium_strategy(hand: List[Card], top_card: Card) -> Card:
-        playable = [c for c in hand if c.can_be_played_on(top_card)]
+        playable = playable_cards(hand, top_card)
         if not playable:
             return None
             
@@ -33,7 +174,7 @@ class AIStrategy:
     @staticmethod
     def _hard_strategy(hand: List[Card], top_card: Card, 
                       other_players_cards: dict) -> Card:
-        playable = [c for c in hand if c.can_be_played_on(top_card)]
+        playable = playable_cards(hand, top_card)
         if not playable:
             return None
             
@@ -42,7 +183,7 @@ class AIStrategy:
                              key=lambda x: x[1])[0]
         
         # Si un joueur est proche de gagner, priorité aux cartes d'action
-        if min(other_players_cards.values()) <= 2:
+        if min(other_players_cards.values()) <= AIStrategy.danger_threshold:
             action_cards = [c for c in playable 
                           if c.card_type != CardType.NUMBER]
             if action_cards:
@@ -0,0 +1,191 @@
+"""Comptage des cartes : où sont les cartes qu'une IA n'a pas vues.
+
+Tout ce que le suivi apprend est public : cartes posées (défausse),
+couleurs annoncées, et surtout les pioches d'une IA à son tour : elle ne
+pioche que sans carte jouable, donc sans carte de la couleur demandée ni
+carte noire. Un joueur humain peut piocher par choix : sa pioche ne
+prouve rien.
+Le seul savoir privé d'une IA est sa main, lue au moment de la question :
+un même suivi sert donc toutes les IA de la partie (`observer`).
+
+Chaque événement coûte O(1) (au plus une opération par couleur) ; les
+probabilités sont calculées à la demande. Une copie non vue d'une carte
+de couleur c se trouve chez un adversaire ou dans la pioche, avec une
+probabilité proportionnelle au nombre de cartes de ce détenteur pouvant
+être de couleur c : toute sa main, ou seulement les cartes reçues depuis
+qu'il a montré ne pas en avoir.
+"""
+from typing import List, Optional, TYPE_CHECKING
+from .card import ALL_CARDS, Card, Color
+from .deck import DECK_TEMPLATE
+from .events import CardPlayed, CardsDrawn, DeckReshuffled, EventStream, GameStarted
+from .player import Player
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+PILE = -1  # détenteur : la pioche
+
+# Une couleur annoncée par un adversaire compte double dans sa main
+DECLARED_WEIGHT = 2.0
+
+_COLORS = list(Color)
+_COLOR_INDEX = {color: i for i, color in enumerate(_COLORS)}
+_BLACK = _COLOR_INDEX[Color.BLACK]
+_CARD_COLOR = tuple(_COLOR_INDEX[card.color] for card in ALL_CARDS)
+_DECK_COUNTS = [0] * len(ALL_CARDS)
+_DECK_COLORS = [0] * len(_COLORS)
+for _card in DECK_TEMPLATE:
+    _DECK_COUNTS[_card.id] += 1
+    _DECK_COLORS[_CARD_COLOR[_card.id]] += 1
+
+
+class CardBeliefs:
+    """Ce que les événements d'une partie révèlent des mains adverses"""
+
+    def __init__(self):
+        self._game: Optional['GameManager'] = None
+        self._events: Optional[EventStream] = None
+        self._discard = [0] * len(ALL_CARDS)  # cartes de la défausse, par id
+        self._discard_colors = [0] * len(_COLORS)
+        # Par place : couleurs dont le joueur n'avait aucune carte à sa dernière
+        # pioche forcée, cartes reçues depuis, dernière couleur annoncée
+        self._void: List[List[bool]] = []
+        self._fresh: List[List[int]] = []
+        self._declared: List[Optional[int]] = []
+        self._sizes: List[int] = []  # cartes en main, par place
+        self._seats = {}  # id(joueur) -> place
+
+    def attach(self, game: 'GameManager'):
+        """Suit les événements de `game` (avant start_game, ou suivi de sync)"""
+        self.detach()
+        self._game = game
+        self._events = game.events
+        game.events.subscribe(GameStarted, self._on_game_started)
+        game.events.subscribe(CardPlayed, self._on_card_played)
+        game.events.subscribe(CardsDrawn, self._on_cards_drawn)
+        game.events.subscribe(DeckReshuffled, self._on_deck_reshuffled)
+
+    def detach(self):
+        if self._events is not None:
+            self._events.unsubscribe(GameStarted, self._on_game_started)
+            self._events.unsubscribe(CardPlayed, self._on_card_played)
+            self._events.unsubscribe(CardsDrawn, self._on_cards_drawn)
+            self._events.unsubscribe(DeckReshuffled, self._on_deck_reshuffled)
+        self._events = None
+
+    def sync(self):
+        """Repart de l'état visible de la partie (reprise d'une sauvegarde) :
+        la défausse est connue, l'historique des pioches est perdu"""
+        game = self._game
+        players = game.players
+        self._seats = {id(player): seat for seat, player in enumerate(players)}
+        self._void = [[False] * len(_COLORS) for _ in players]
+        self._fresh = [[0] * len(_COLORS) for _ in players]
+        self._declared = [None] * len(players)
+        self._sizes = [len(player.hand) for player in players]
+        self._discard = [0] * len(ALL_CARDS)
+        self._discard_colors = [0] * len(_COLORS)
+        for card in game.deck.discard_pile:
+            self._discard[card.id] += 1
+            self._discard_colors[_CARD_COLOR[card.id]] += 1
+
+    # Événements
+
+    def _on_game_started(self, event: GameStarted):
+        self.sync()
+
+    def _on_card_played(self, event: CardPlayed):
+        card_id = event.card.id
+        color = _CARD_COLOR[card_id]
+        self._discard[card_id] += 1
+        self._discard_colors[color] += 1
+        seat = self._seats[id(event.player)]
+        fresh = self._fresh[seat]
+        if self._void[seat][color] and fresh[color]:
+            fresh[color] -= 1  # la carte posée était l'une des cartes reçues
+        left = self._sizes[seat] = event.cards_left
+        for c in range(len(_COLORS)):
+            if fresh[c] > left:
+                fresh[c] = left
+        if event.color is not None:
+            self._declared[seat] = _COLOR_INDEX[event.color]
+
+    def _on_cards_drawn(self, event: CardsDrawn):
+        game = self._game
+        player = event.player
+        seat = self._seats[id(player)]
+        void = self._void[seat]
+        fresh = self._fresh[seat]
+        self._sizes[seat] += event.count
+        if player.is_ai and player is game.players[game.current_player_index]:
+            # Pioche forcée : aucune carte de la couleur visible ni de carte noire
+            # avant la pioche ; seule la carte piochée peut en être
+            top = _COLOR_INDEX[game.top_card.color]
+            for c in range(len(_COLORS)):
+                if c == top or c == _BLACK:
+                    void[c] = True
+                    fresh[c] = event.count
+                elif void[c]:
+                    fresh[c] += event.count
+            if self._declared[seat] == top:
+                self._declared[seat] = None
+            return
+        for c in range(len(_COLORS)):
+            if void[c]:
+                fresh[c] += event.count
+
+    def _on_deck_reshuffled(self, event: DeckReshuffled):
+        # Toute la défausse, sauf la carte visible, est repartie dans la pioche
+        top = self._game.deck.discard_pile[-1]
+        self._discard = [0] * len(ALL_CARDS)
+        self._discard_colors = [0] * len(_COLORS)
+        self._discard[top.id] = 1
+        self._discard_colors[_CARD_COLOR[top.id]] = 1
+
+    # Questions d'une IA (observer)
+
+    def unseen(self, observer: Player, card: Card) -> int:
+        """Copies de `card` ni dans la main de l'IA ni dans la défausse"""
+        card = card.base
+        return _DECK_COUNTS[card.id] - observer.hand.count(card) - self._discard[card.id]
+
+    def unseen_color(self, observer: Player, color: Color) -> int:
+        c = _COLOR_INDEX[color]
+        return _DECK_COLORS[c] - observer.hand.color_count(color) - self._discard_colors[c]
+
+    def _share(self, observer: Player, holder: int, color: int) -> float:
+        """Probabilité qu'une copie non vue de couleur `color` soit chez `holder`"""
+        observer_seat = self._seats[id(observer)]
+        void, fresh, declared = self._void, self._fresh, self._declared
+        total = float(len(self._game.deck.cards))
+        held = total if holder == PILE else 0.0
+        for seat, size in enumerate(self._sizes):
+            if seat == observer_seat:
+                continue
+            # Cartes de ce joueur pouvant être de cette couleur
+            if void[seat][color] and fresh[seat][color] < size:
+                size = fresh[seat][color]
+            weight = size * DECLARED_WEIGHT if declared[seat] == color else size
+            total += weight
+            if seat == holder:
+                held = weight
+        return held / total if total else 0.0
+
+    def probability(self, observer: Player, card: Card, holder: int) -> float:
+        """Probabilité qu'une copie non vue de `card` soit dans la main de la place
+        `holder` (ou dans la pioche : PILE), selon ce que sait `observer`"""
+        if holder == self._seats[id(observer)]:
+            return 0.0
+        return self._share(observer, holder, _CARD_COLOR[card.base.id])
+
+    def expected_color(self, observer: Player, holder: int, color: Color) -> float:
+        """Nombre attendu de cartes de `color` chez `holder` (ou dans la pioche)"""
+        if holder == self._seats[id(observer)]:
+            return float(observer.hand.color_count(color))
+        return self.unseen_color(observer, color) * self._share(observer, holder, _COLOR_INDEX[color])
+
+    def lacks(self, holder: int, color: Color) -> bool:
+        """`holder` a montré ne pas avoir `color` et n'a rien reçu depuis"""
+        c = _COLOR_INDEX[color]
+        return self._void[holder][c] and self._fresh[holder][c] == 0
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict, List, Optional, Tuple
 
 class Color(Enum):
     RED = "rouge"
@@ -15,23 +16,120 @@ class CardType(Enum):
     WILD = "joker"
     WILD_DRAW_FOUR = "+4"
 
+# Couleurs « jouables » (une carte noire reçoit l'une d'elles une fois posée)
+PLAYABLE_COLORS = (Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW)
+ACTION_TYPES = (CardType.SKIP, CardType.REVERSE, CardType.DRAW_TWO)
+WILD_TYPES = (CardType.WILD, CardType.WILD_DRAW_FOUR)
+
 class Card:
-    def __init__(self, color: Color, card_type: CardType, value: int = None):
-        self.color = color
-        self.card_type = card_type
-        self.value = value  # None pour les cartes spéciales
-        
+    """Carte immuable et unique par valeur (flyweight).
+
+    `Card(color, type, value)` renvoie toujours la même instance ; chaque
+    carte porte un identifiant entier compact :
+      - 0 à 51 : cartes de couleur (13 par couleur : 0-9, passer, inverse, +2)
+      - 52, 53 : Joker et +4 noirs
+      - 54 à 61 : Joker et +4 avec couleur annoncée (uniquement en haut de la
+        défausse, la couleur annoncée étant portée par l'état de la partie)
+    """
+    __slots__ = ('color', 'card_type', 'value', 'id', 'base')
+
+    _registry: Dict[Tuple[Color, CardType, Optional[int]], 'Card'] = {}
+    _by_id: List['Card'] = []
+
+    def __new__(cls, color: Color, card_type: CardType, value: int = None):
+        try:
+            return cls._registry[(color, card_type, value)]
+        except KeyError:
+            raise ValueError(f"Carte invalide : {color} {card_type} {value}") from None
+
+    @classmethod
+    def _create(cls, color: Color, card_type: CardType, value: Optional[int],
+                base: Optional['Card'] = None) -> 'Card':
+        card = object.__new__(cls)
+        object.__setattr__(card, 'color', color)
+        object.__setattr__(card, 'card_type', card_type)
+        object.__setattr__(card, 'value', value)  # None pour les cartes spéciales
+        object.__setattr__(card, 'id', len(cls._by_id))
+        object.__setattr__(card, 'base', base if base is not None else card)
+        cls._registry[(color, card_type, value)] = card
+        cls._by_id.append(card)
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> 'Card':
+        return cls._by_id[card_id]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Les cartes sont immuables")
+
+    def __delattr__(self, name):
+        raise AttributeError("Les cartes sont immuables")
+
+    def __reduce__(self):
+        return (_card_from_id, (self.id,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"Card({self.color.name}, {self.card_type.name}, {self.value})"
+
     def __str__(self):
         if self.card_type == CardType.NUMBER:
             return f"{self.color.value} {self.value}"
         return f"{self.color.value} {self.card_type.value}"
-        
+
+    def with_declared_color(self, color: Color) -> 'Card':
+        """Variante d'une carte noire portant la couleur annoncée"""
+        return Card(color, self.card_type)
+
     def can_be_played_on(self, other_card: 'Card') -> bool:
-        if self.color == Color.BLACK:  # Joker et +4 peuvent toujours être joués
-            return True
-        return (self.color == other_card.color or 
-                (self.card_type == other_card.card_type and 
-                 self.card_type != CardType.NUMBER) or
-                (self.card_type == CardType.NUMBER and 
-                 other_card.card_type == CardType.NUMBER and 
-                 self.value == other_card.value))
+        return _PLAYABLE[self.id][other_card.id]
+
+
+def _card_from_id(card_id: int) -> Card:
+    return Card.from_id(card_id)
+
+
+def _compute_playable(card: Card, top: Card) -> bool:
+    if card.color == Color.BLACK:  # Joker et +4 peuvent toujours être joués
+        return True
+    return (card.color == top.color or
+            (card.card_type == top.card_type and
+             card.card_type != CardType.NUMBER) or
+            (card.card_type == CardType.NUMBER and
+             top.card_type == CardType.NUMBER and
+             card.value == top.value))
+
+
+for _color in PLAYABLE_COLORS:
+    for _value in range(10):
+        Card._create(_color, CardType.NUMBER, _value)
+    for _card_type in ACTION_TYPES:
+        Card._create(_color, _card_type, None)
+for _card_type in WILD_TYPES:
+    Card._create(Color.BLACK, _card_type, None)
+
+# Nombre de cartes distinctes réellement présentes dans un paquet
+CARD_KINDS = len(Card._by_id)
+
+for _color in PLAYABLE_COLORS:
+    for _card_type in WILD_TYPES:
+        Card._create(_color, _card_type, None, base=Card(Color.BLACK, _card_type))
+
+ALL_CARDS: Tuple[Card, ...] = tuple(Card._by_id)
+
+# Table de jouabilité précalculée : _PLAYABLE[carte.id][carte_visible.id]
+_PLAYABLE: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(_compute_playable(card, top) for top in ALL_CARDS)
+    for card in ALL_CARDS
+)
+
+# Identifiants des cartes d'un paquet jouables sur chaque carte visible, par id croissant
+PLAYABLE_ON: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(card.id for card in ALL_CARDS[:CARD_KINDS] if _PLAYABLE[card.id][top.id])
+    for top in ALL_CARDS
+)
@@ -0,0 +1,63 @@
+"""Cache des décisions des IA.
+
+Le choix d'une stratégie déterministe ne dépend que de quelques éléments
+de la partie (cartes jouables, carte visible, taille de la plus petite
+main adverse...) : réunis sous une forme canonique, indépendante de
+l'ordre des cartes dans la main, ils forment la clé d'une décision déjà
+prise. La stratégie (ou sa version, pour AIStrategy) fait partie de la
+clé : une stratégie remplacée ou reparamétrée ne réutilise jamais les
+décisions de la précédente, qui sortent du cache à leur tour.
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional
+from .card import Card
+
+# Décisions conservées (une entrée : une clé courte et une carte partagée)
+CACHE_SIZE = 65536
+
+_MISSING = object()
+
+
+def hand_key(cards: Iterable[Card]) -> tuple:
+    """Multiensemble des cartes d'une main : identifiants triés, doublons compris"""
+    return tuple(sorted(card.id for card in cards))
+
+
+class DecisionCache:
+    """Décisions les plus récemment utilisées, au plus `maxsize` (LRU)"""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Optional[Card]]" = OrderedDict()
+
+    def decide(self, key: Hashable, choose: Callable[[], Optional[Card]]) -> Optional[Card]:
+        """Décision enregistrée sous `key`, sinon celle de `choose`, enregistrée"""
+        entries = self._entries
+        card = entries.get(key, _MISSING)
+        if card is not _MISSING:
+            entries.move_to_end(key)
+            self.hits += 1
+            return card
+        self.misses += 1
+        card = choose()
+        entries[key] = card
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return card
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,39 +1,55 @@
-from typing import List
+from typing import List, Optional, Tuple
 import random
 from .card import Card, Color, CardType
 
+def _build_template() -> Tuple[Card, ...]:
+    cards: List[Card] = []
+    # Cartes numériques (0-9)
+    for color in [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]:
+        # Un seul 0 par couleur
+        cards.append(Card(color, CardType.NUMBER, 0))
+        # Deux cartes de chaque numéro 1-9
+        for value in range(1, 10):
+            cards.extend([Card(color, CardType.NUMBER, value)] * 2)
+        
+        # Cartes spéciales (2 de chaque par couleur)
+        special_cards = [
+            Card(color, CardType.SKIP),
+            Card(color, CardType.REVERSE),
+            Card(color, CardType.DRAW_TWO)
+        ]
+        cards.extend(special_cards * 2)
+    
+    # Cartes noires (4 +4 et 4 Jokers)
+    black_cards = [
+        Card(Color.BLACK, CardType.WILD),
+        Card(Color.BLACK, CardType.WILD_DRAW_FOUR)
+    ]
+    cards.extend(black_cards * 4)
+    return tuple(cards)
+
+
+# Paquet complet dans l'ordre de distribution, construit une seule fois
+# (les cartes sont partagées : un paquet n'en copie que les références)
+DECK_TEMPLATE = _build_template()
+
+
 class Deck:
-    def __init__(self):
-        self.cards: List[Card] = []
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Générateur propre à la partie (GameManager), pour pouvoir la rejouer
+        self.rng = rng or random.Random()
+        self.cards: List[Card] = list(DECK_TEMPLATE)
         self.discard_pile: List[Card] = []
-        self._initialize_deck()
+        self.reshuffles = 0  # Nombre de remélanges de la défausse
         
-    def _initialize_deck(self):
-        # Cartes numériques (0-9)
-        for color in [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]:
-            # Un seul 0 par couleur
-            self.cards.append(Card(color, CardType.NUMBER, 0))
-            # Deux cartes de chaque numéro 1-9
-            for value in range(1, 10):
-                self.cards.extend([Card(color, CardType.NUMBER, value)] * 2)
-            
-            # Cartes spéciales (2 de chaque par couleur)
-            special_cards = [
-                Card(color, CardType.SKIP),
-                Card(color, CardType.REVERSE),
-                Card(color, CardType.DRAW_TWO)
-            ]
-            self.cards.extend(special_cards * 2)
-        
-        # Cartes noires (4 +4 et 4 Jokers)
-        black_cards = [
-            Card(Color.BLACK, CardType.WILD),
-            Card(Color.BLACK, CardType.WILD_DRAW_FOUR)
-        ]
-        self.cards.extend(black_cards * 4)
+    def reset(self):
+        """Remet le paquet complet, non mélangé, en réutilisant ses listes"""
+        self.cards[:] = DECK_TEMPLATE
+        self.discard_pile.clear()
+        self.reshuffles = 0
         
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         
     def draw_card(self) -> Card:
         if not self.cards:
@@ -47,3 +63,4 @@ class Deck:
         self.cards = self.discard_pile
         self.discard_pile = [top_card]
         self.shuffle()
+        self.reshuffles += 1
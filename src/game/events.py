@@ -0,0 +1,154 @@
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from .card import Card, Color
+from .player import Player
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+
+class GameEvent:
+    """Événement publié par le moteur ; `handler` est le nom de la méthode
+    appelée sur les interfaces abonnées (voir EventStream.connect)"""
+    __slots__ = ()
+    handler = ''
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class GameStarted(GameEvent):
+    """Cartes mélangées et distribuées"""
+    __slots__ = ('game',)
+    handler = 'on_game_started'
+
+    def __init__(self, game: 'GameManager'):
+        self.game = game
+
+
+class TurnStarted(GameEvent):
+    __slots__ = ('game', 'player', 'top_card', 'turn')
+    handler = 'on_turn_started'
+
+    def __init__(self, game: 'GameManager', player: Player, top_card: Card, turn: int):
+        self.game = game
+        self.player = player
+        self.top_card = top_card
+        self.turn = turn
+
+
+class CardPlayed(GameEvent):
+    """Carte posée ; `color` est la couleur annoncée sur une carte noire"""
+    __slots__ = ('player', 'card', 'color', 'cards_left')
+    handler = 'on_card_played'
+
+    def __init__(self, player: Player, card: Card, color: Optional[Color], cards_left: int):
+        self.player = player
+        self.card = card
+        self.color = color
+        self.cards_left = cards_left
+
+
+class CardsDrawn(GameEvent):
+    """Pioche volontaire (une carte) ou pénalité d'un +2/+4"""
+    __slots__ = ('player', 'count')
+    handler = 'on_cards_drawn'
+
+    def __init__(self, player: Player, count: int):
+        self.player = player
+        self.count = count
+
+
+class DeckReshuffled(GameEvent):
+    """Défausse remélangée dans la pioche épuisée ; `draw_pile` cartes à piocher"""
+    __slots__ = ('draw_pile',)
+    handler = 'on_deck_reshuffled'
+
+    def __init__(self, draw_pile: int):
+        self.draw_pile = draw_pile
+
+
+class CardEffect(GameEvent):
+    """Effet d'une carte spéciale (voir Rules) : 'skip', 'reverse', 'draw_two'
+    ou 'draw_four' ; `target` est le joueur passé ou pénalisé"""
+    __slots__ = ('card', 'effect', 'target')
+    handler = 'on_card_effect'
+
+    def __init__(self, card: Card, effect: str, target: Optional[Player]):
+        self.card = card
+        self.effect = effect
+        self.target = target
+
+
+class AchievementUnlocked(GameEvent):
+    __slots__ = ('name',)
+    handler = 'on_achievement_unlocked'
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class GameOver(GameEvent):
+    __slots__ = ('winner', 'round_score', 'scores')
+    handler = 'on_game_over'
+
+    def __init__(self, winner: Player, round_score: int, scores: Dict[str, int]):
+        self.winner = winner
+        self.round_score = round_score
+        self.scores = scores
+
+
+EVENT_TYPES = (GameStarted, TurnStarted, CardPlayed, CardsDrawn, DeckReshuffled, CardEffect,
+               AchievementUnlocked, GameOver)
+
+Subscription = Tuple[type, Callable[[GameEvent], None]]
+
+
+class EventStream:
+    """Diffusion des événements d'une partie à leurs abonnés.
+
+    Le moteur teste `wants` avant de construire un événement : sans
+    abonné à ce type (NullUI, simulations), publier ne coûte rien.
+    """
+
+    def __init__(self):
+        self.active = False
+        # Tuples remplacés à chaque (dés)abonnement : un abonné peut se
+        # désabonner pendant la diffusion d'un événement
+        self._handlers: Dict[type, Tuple[Callable[[GameEvent], None], ...]] = {}
+
+    def subscribe(self, event_type: type, handler: Callable[[GameEvent], None]):
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+        self.active = True
+
+    def unsubscribe(self, event_type: type, handler: Callable[[GameEvent], None]):
+        handlers = list(self._handlers.get(event_type, ()))
+        if handler in handlers:
+            handlers.remove(handler)
+        if handlers:
+            self._handlers[event_type] = tuple(handlers)
+        else:
+            self._handlers.pop(event_type, None)
+        self.active = bool(self._handlers)
+
+    def wants(self, event_type: type) -> bool:
+        """Un abonné attend ce type d'événement (sinon inutile de le construire)"""
+        return event_type in self._handlers
+
+    def connect(self, backend) -> List[Subscription]:
+        """Abonne les méthodes on_<événement> que l'interface définit"""
+        subscriptions = []
+        for event_type in EVENT_TYPES:
+            handler = getattr(backend, event_type.handler, None)
+            if callable(handler):
+                self.subscribe(event_type, handler)
+                subscriptions.append((event_type, handler))
+        return subscriptions
+
+    def disconnect(self, subscriptions: List[Subscription]):
+        for event_type, handler in subscriptions:
+            self.unsubscribe(event_type, handler)
+
+    def publish(self, event: GameEvent):
+        for handler in self._handlers.get(type(event), ()):
+            handler(event)
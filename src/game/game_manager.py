@@ -1,25 +1,79 @@
-from typing import List
+import queue
+import random
+from typing import Callable, Iterator, List, Optional
 from .player import Player
 from .deck import Deck
-from .card import Card, Color, CardType
+from .card import Card, Color, CardType, PLAYABLE_COLORS
+from ..ui.backend import UIBackend
 from ..ui.console_ui import ConsoleUI
+from ..ui.null_ui import NullUI
 from .rules import Rules
-from .save_manager import SaveManager
+from .save_manager import SaveManager, SAVE_SUFFIXES
+from .save_format import card_from_data
 from .achievements import Achievements
-import json
+from .journal import MoveJournal, JournalRecord
+from .save_writer import SaveWriter
+from .ismcts import ExpertAI, Observation
+from .ai_strategy import (BELIEF_STRATEGIES, CACHEABLE_STRATEGIES, STRATEGIES, counting_color,
+                          decision_key, same_color_first)
+from .beliefs import CardBeliefs
+from .decision_cache import DecisionCache
+from .replay import ReplayRecord
+from .profiler import TurnProfiler
+from .stats_store import StatsStore
+from .events import (EventStream, Subscription, GameStarted, TurnStarted, CardPlayed, CardsDrawn,
+                     DeckReshuffled, GameOver)
+from concurrent.futures import Future
+from collections import Counter
+
+# La graine de l'IA experte est dérivée de celle de la partie : elle ne tire
+# rien de self.rng, qu'un replay (coups lus, sans recherche) doit suivre à l'identique
+EXPERT_SEED_SALT = 0x9E3779B9
 
 class GameManager:
-    def __init__(self, difficulty: str):
+    def __init__(self, difficulty: str, headless: bool = False, ai_only: bool = False,
+                 seed: Optional[int] = None, ui: Optional[UIBackend] = None):
         self.difficulty = difficulty
-        self.deck = Deck()
+        # Mode sans interface ni accès disque (simulations IA contre IA)
+        self.headless = headless
+        self.ai_only = ai_only
+        # Tout le hasard de la partie vient de ce générateur : la graine et
+        # les décisions enregistrées suffisent à la rejouer (voir replay.py)
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.record: Optional[ReplayRecord] = ReplayRecord(self.seed, difficulty, ai_only)
+        self.replaying: Optional[Iterator[int]] = None  # décisions lues au lieu d'être demandées
+        self.deck = Deck(self.rng)
         self.players: List[Player] = []
         self.current_player_index = 0
         self.direction = 1  # 1 pour sens horaire, -1 pour anti-horaire
-        self.ui = ConsoleUI()
+        self.declared_color: Optional[Color] = None  # Couleur annoncée sur un Joker/+4
+        # L'affichage suit les événements de la partie : sans abonné, aucun n'est construit
+        self.events = EventStream()
+        self._ui: Optional[UIBackend] = None
+        self._ui_subscriptions: List[Subscription] = []
+        if ui is None:
+            ui = NullUI() if headless else ConsoleUI()
+        self.ui = ui
         self._initialize_players()
         self.scores = {player.name: 0 for player in self.players}
-        self.save_manager = SaveManager()
+        self.save_manager = None if headless else SaveManager()
+        self.journal: Optional[MoveJournal] = None
+        self.save_writer: Optional[SaveWriter] = None  # Créé à la première sauvegarde
+        # Résultats des sauvegardes en arrière-plan, affichés par le thread de la partie
+        # (créé avec save_writer : une partie jamais sauvegardée reste copiable)
+        self._save_results: "Optional[queue.SimpleQueue[bool]]" = None
+        self.quit_game = False
+        self.expert_ai: Optional[ExpertAI] = None  # Créée au premier coup « expert »
+        self.expert_workers = 1  # processus de recherche de l'IA experte
+        self.profiler: Optional[TurnProfiler] = None  # Voir enable_profiling
+        self.stats_store: Optional[StatsStore] = None  # résultats enregistrés par end_game
+        self.decision_cache: Optional[DecisionCache] = None  # décisions des IA réutilisées
+        self.beliefs: Optional[CardBeliefs] = None  # cartes comptées, si une IA s'en sert
+        self._turn_move: list = [None, None, 0]  # carte posée, couleur annoncée, cartes piochées
+        # Succès du joueur humain, débloqués par les événements de la partie
         self.achievements = Achievements()
+        self._track_achievements()
         self.game_stats = {
             'cards_played': 0,
             'turns_played': 0,
@@ -30,6 +84,9 @@ class GameManager:
         }
         
     def _initialize_players(self):
+        if self.ai_only:
+            self.players = [Player(f"IA {i}", True) for i in range(1, 5)]
+            return
         self.players = [
             Player("Joueur", False),
             Player("IA 1", True),
@@ -37,8 +94,38 @@ class GameManager:
             Player("IA 3", True)
         ]
         
+    @property
+    def ui(self) -> UIBackend:
+        return self._ui
+
+    @ui.setter
+    def ui(self, ui: UIBackend):
+        """Change d'interface : ses méthodes on_<événement> remplacent celles de la précédente"""
+        self.events.disconnect(self._ui_subscriptions)
+        self._ui = ui
+        self._ui_subscriptions = self.events.connect(ui)
+
+    def reset(self, seed: Optional[int] = None):
+        """Prépare une nouvelle partie en réutilisant le paquet, les joueurs et
+        l'interface (simulations, parties enchaînées) ; scores et succès sont conservés"""
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng.seed(self.seed)
+        self.record = ReplayRecord(self.seed, self.difficulty, self.ai_only)
+        self.replaying = None
+        self.deck.reset()
+        for player in self.players:
+            player.hand.clear()
+        self.current_player_index = 0
+        self.direction = 1
+        self.declared_color = None
+        self.quit_game = False
+        self._close_expert()  # recréée depuis la graine, comme dans une nouvelle partie
+        self._turn_move[:] = (None, None, 0)
+        for stat in self.game_stats:
+            self.game_stats[stat] = 0
+        
     def start_game(self):
-        self.ui.animate_shuffle()
+        self._track_beliefs()
         self.deck.shuffle()
         # Distribution des cartes
         for _ in range(7):
@@ -48,134 +135,270 @@ class GameManager:
         # Première carte
         initial_card = self.deck.draw_card()
         while initial_card.color == Color.BLACK:
-            self.deck.cards.append(initial_card)
+            # Remettre la carte noire sous le paquet, sinon elle serait repiochée
+            self.deck.cards.insert(0, initial_card)
             initial_card = self.deck.draw_card()
         self.deck.discard_pile.append(initial_card)
+        self.declared_color = None
+        self.game_stats['max_cards_in_hand'] = max(
+            self.game_stats['max_cards_in_hand'],
+            max(len(p.hand) for p in self.players)
+        )
+        if self.events.wants(GameStarted):
+            self.events.publish(GameStarted(self))
+        if self.journal is not None:
+            self.journal.start(self.snapshot_state())
+            
+    def enable_profiling(self) -> TurnProfiler:
+        """Mesure la durée de chaque phase des tours (à appeler une fois
+        l'interface choisie) ; sans profileur, aucun code de mesure n'est exécuté"""
+        if self.profiler is None:
+            self.profiler = TurnProfiler()
+            self.profiler.attach(self)
+        return self.profiler
+        
+    def enable_journal(self, journal: MoveJournal):
+        """Active la sauvegarde automatique à chaque coup (avant start_game)"""
+        self.journal = journal
+        
+    @property
+    def top_card(self) -> Card:
+        """Carte visible, avec la couleur annoncée si c'est une carte noire"""
+        card = self.deck.discard_pile[-1]
+        if self.declared_color is not None and card.color == Color.BLACK:
+            return card.with_declared_color(self.declared_color)
+        return card
         
     def play_turn(self):
-        current_player = self.players[self.current_player_index]
-        top_card = self.deck.discard_pile[-1]
+        player_index = self.current_player_index
+        current_player = self.players[player_index]
+        top_card = self.top_card
+        self._turn_move = [None, None, 0]
+        reshuffles = self.deck.reshuffles
         
-        self.ui.display_game_state(current_player, top_card, self)
+        if self.events.wants(TurnStarted):
+            self.events.publish(TurnStarted(self, current_player, top_card,
+                                            self.game_stats['turns_played']))
+        self.game_stats['turns_played'] += 1
+        if self.record is not None:
+            self.record.turns += 1
         
         if current_player.is_ai:
             self._play_ai_turn(current_player)
         else:
             self._play_human_turn(current_player)
+            if self.quit_game:  # Le joueur reprendra la partie à son tour
+                return
+            
+        self._update_turn()
+        if self.journal is not None:
+            self._journal_turn(player_index, reshuffles)
+            
+    def _journal_turn(self, player_index: int, reshuffles: int):
+        # Un remélange n'est pas rejouable à l'identique : on repart d'un instantané
+        if self.deck.reshuffles == reshuffles:
+            card, color, drawn = self._turn_move
+            self.journal.append(JournalRecord(player_index, card, color, drawn))
+            if not self.journal.needs_compaction():
+                return
+        self.journal.compact(self.snapshot_state())
             
+    def replay_move(self, record: JournalRecord):
+        """Rejoue un coup du journal (sans interface ni choix de l'IA)"""
+        if record.player != self.current_player_index:
+            raise ValueError(f"Journal désynchronisé : coup du joueur {record.player}, "
+                             f"joueur {self.current_player_index} attendu")
+        player = self.players[self.current_player_index]
+        self._turn_move = [None, None, 0]
+        for _ in range(record.drawn):
+            self._draw_card(player)
+        if record.card is not None:
+            self._play_card(player, record.card, record.color)
+        self.game_stats['turns_played'] += 1
         self._update_turn()
         
+    def resume_journal(self, journal: MoveJournal) -> bool:
+        """Reconstruit la partie depuis l'instantané et le journal, puis continue à journaliser"""
+        try:
+            game_state, records = journal.load()
+            self.restore_state(game_state)
+            for record in records:
+                self.replay_move(record)
+            if self.beliefs is not None:  # coups rejoués sans événements de pioche
+                self.beliefs.sync()
+        except Exception as e:
+            print(f"Erreur lors de la reprise du journal : {e}")
+            return False
+        self.journal = journal
+        journal.compact(self.snapshot_state())
+        return True
+        
     def _update_turn(self):
         self.current_player_index = (
             self.current_player_index + self.direction
         ) % len(self.players)
         
+    def _draw_card(self, player: Player) -> Optional[Card]:
+        """Fait piocher une carte au joueur (None si la pioche est épuisée)"""
+        reshuffles = self.deck.reshuffles
+        card = self.deck.draw_card()
+        if self.deck.reshuffles != reshuffles and self.events.wants(DeckReshuffled):
+            # Publié avant la pioche qui l'a provoqué ; la carte piochée en faisait partie
+            self.events.publish(DeckReshuffled(len(self.deck.cards) + 1))
+        if card is not None:
+            player.add_card(card)
+            self.game_stats['cards_drawn'] += 1
+            # Seule une pioche peut faire grossir une main
+            if len(player.hand) > self.game_stats['max_cards_in_hand']:
+                self.game_stats['max_cards_in_hand'] = len(player.hand)
+        return card
+
+    def _draw_cards(self, player: Player, count: int) -> int:
+        """Fait piocher `count` cartes (pénalité d'un +2/+4) ; renvoie le nombre piochées"""
+        drawn = 0
+        for _ in range(count):
+            if self._draw_card(player) is not None:
+                drawn += 1
+        if drawn and self.events.wants(CardsDrawn):
+            self.events.publish(CardsDrawn(player, drawn))
+        return drawn
+        
     def is_game_over(self) -> bool:
-        return any(len(player.hand) == 0 for player in self.players)
+        return self.quit_game or any(len(player.hand) == 0 for player in self.players)
 
     def _play_ai_turn(self, player: Player):
-        top_card = self.deck.discard_pile[-1]
-        playable_cards = [
-            card for card in player.hand 
-            if card.can_be_played_on(top_card)
-        ]
+        top_card = self.top_card
+        playable_cards = player.playable_cards(top_card)
         
         if not playable_cards:
-            drawn_card = self.deck.draw_card()
-            player.add_card(drawn_card)
-            if drawn_card.can_be_played_on(top_card):
+            drawn_card = self._draw_card(player)
+            if drawn_card is not None:
+                self._turn_move[2] += 1
+                if self.events.wants(CardsDrawn):
+                    self.events.publish(CardsDrawn(player, 1))
+            if drawn_card is not None and drawn_card.can_be_played_on(top_card):
                 self._play_card(player, drawn_card)
             return
             
-        if self.difficulty == "facile":
-            card_to_play = playable_cards[0]
+        strategy = self._strategy(player)
+        cache = self.decision_cache
+        if cache is not None and strategy in CACHEABLE_STRATEGIES:
+            card = cache.decide(decision_key(strategy, playable_cards, top_card),
+                                lambda: strategy(self, player, playable_cards))
         else:
-            card_to_play = self._choose_strategic_card(player, playable_cards)
-            
-        self._play_card(player, card_to_play)
-        
-    def _choose_strategic_card(self, player: Player, playable_cards: List[Card]) -> Card:
-        # Stratégie pour difficulté moyenne et difficile
-        # Priorité aux cartes spéciales
-        special_cards = [c for c in playable_cards if c.card_type != CardType.NUMBER]
-        if special_cards and self.difficulty == "difficile":
-            return special_cards[0]
-            
-        # Jouer les cartes de même couleur en priorité
-        top_card = self.deck.discard_pile[-1]
-        same_color_cards = [c for c in playable_cards if c.color == top_card.color]
-        if same_color_cards:
-            return same_color_cards[0]
-            
-        return playable_cards[0]
+            card = strategy(self, player, playable_cards)
+        if card.base is not card:  # Joker/+4 avec sa couleur annoncée
+            self._play_card(player, card.base, card.color)
+        else:
+            self._play_card(player, card)
         
-    def _play_card(self, player: Player, card: Card):
-        self.ui.animate_card_play(card)
+    def _strategy(self, player: Player):
+        return STRATEGIES.get(player.strategy or self.difficulty, same_color_first)
+
+    def _track_beliefs(self):
+        """Compte les cartes (game.beliefs) si une IA de la partie s'en sert"""
+        counting = any(player.is_ai and self._strategy(player) in BELIEF_STRATEGIES
+                       for player in self.players)
+        if counting and self.beliefs is None:
+            self.beliefs = CardBeliefs()
+            self.beliefs.attach(self)
+        elif not counting and self.beliefs is not None:
+            self.beliefs.detach()
+            self.beliefs = None
+
+    def _expert_move(self) -> int:
+        if self.expert_ai is None:
+            self.expert_ai = ExpertAI(workers=self.expert_workers,
+                                      seed=self.seed ^ EXPERT_SEED_SALT)
+        card, color = self.expert_ai.choose_move(Observation.from_game(self))
+        return (card.with_declared_color(color) if color is not None else card).id
+
+    def _close_expert(self):
+        """Arrête les processus de recherche de l'IA experte"""
+        if self.expert_ai is not None:
+            self.expert_ai.close()
+            self.expert_ai = None
+
+    def _decide(self, ask: Callable[[], int]) -> int:
+        """Décision que la graine ne détermine pas : lue dans le replay en
+        cours ou demandée, puis enregistrée"""
+        if self.replaying is not None:
+            value = next(self.replaying, None)
+            if value is None:
+                raise ValueError("Replay incomplet : décision manquante")
+        else:
+            value = ask()
+        if self.record is not None:
+            self.record.decisions.append(value)
+        return value
+
+    def _play_card(self, player: Player, card: Card, declared_color: Optional[Color] = None):
         player.remove_card(card)
-        
-        if len(player.hand) == 1:
-            self.ui.animate_uno_call(player.name)
-            
-        if card.card_type != CardType.NUMBER:
-            self.ui.animate_card_effect(card.card_type)
-            
         self.deck.discard_pile.append(card)
         self.game_stats['cards_played'] += 1
         
         if card.card_type != CardType.NUMBER:
             self.game_stats['special_cards_played'] += 1
-            self._check_special_master_achievement()
-            
-        # Mettre à jour le nombre maximum de cartes en main
-        for p in self.players:
-            self.game_stats['max_cards_in_hand'] = max(
-                self.game_stats['max_cards_in_hand'], 
-                len(p.hand)
-            )
             
+        # La couleur annoncée fait partie de l'état de la partie, pas de la carte
+        self.declared_color = None
         if card.color == Color.BLACK:
-            if player.is_ai:
-                # L'IA choisit la couleur la plus présente dans sa main
-                colors = [c.color for c in player.hand if c.color != Color.BLACK]
-                if colors:
-                    most_common_color = max(set(colors), key=colors.count)
-                    card.color = most_common_color
+            if declared_color is not None:  # Coup rejoué depuis le journal
+                self.declared_color = declared_color
+            elif player.is_ai:
+                if self.beliefs is not None and self._strategy(player) in BELIEF_STRATEGIES:
+                    self.declared_color = counting_color(self, player, card)
                 else:
-                    card.color = Color.RED
+                    # L'IA choisit la couleur la plus présente dans sa main
+                    self.declared_color = player.hand.most_common_color() or Color.RED
             else:
-                new_color = self.ui.get_color_choice()
-                card.color = new_color
+                self.declared_color = PLAYABLE_COLORS[self._decide(
+                    lambda: PLAYABLE_COLORS.index(self.ui.get_color_choice())
+                )]
+        self._turn_move[0] = card
+        self._turn_move[1] = self.declared_color
+        if self.events.wants(CardPlayed):
+            self.events.publish(CardPlayed(player, card, self.declared_color, len(player.hand)))
                 
         Rules.apply_card_effect(card, self)
         
     def _play_human_turn(self, player: Player):
-        while True:
-            choice = self.ui.get_player_move(player, self.deck.discard_pile[-1])
+        choice = self._decide(lambda: self._ask_player_move(player))
+        
+        if choice == -4:  # Quitter
+            self.quit_game = True
+            self.flush_saves()
+            return
+        
+        if choice == -1:  # Piocher une carte
+            drawn_card = self._draw_card(player)
+            if drawn_card is not None:
+                self._turn_move[2] += 1
+                if self.events.wants(CardsDrawn):
+                    self.events.publish(CardsDrawn(player, 1))
             
-            if choice == -4:  # Quitter
-                self.quit_game = True
-                break
-                
-            if choice == -2:  # Sauvegarder
-                if self.save_current_game():
-                    self.ui.show_message("Partie sauvegardée avec succès !")
-                else:
-                    self.ui.show_message("Erreur lors de la sauvegarde !", error=True)
-                continue
+            if drawn_card is not None and drawn_card.can_be_played_on(self.top_card):
+                if self._decide(lambda: int(self.ui.ask_play_drawn_card())):
+                    self._play_card(player, drawn_card)
+        else:
+            card_to_play = player.hand[choice]
+            self._play_card(player, card_to_play)
             
-            if choice == -1:  # Piocher une carte
-                drawn_card = self.deck.draw_card()
-                player.add_card(drawn_card)
-                self.ui.display_game_state(player, self.deck.discard_pile[-1], self)
-                
-                if drawn_card.can_be_played_on(self.deck.discard_pile[-1]):
-                    if self.ui.ask_play_drawn_card():
-                        self._play_card(player, drawn_card)
-                break
-            else:
-                card_to_play = player.hand[choice]
-                self._play_card(player, card_to_play)
-                break 
+    def _ask_player_move(self, player: Player) -> int:
+        """Demande un coup au joueur ; les commandes sans effet sur la partie sont traitées ici"""
+        while True:
+            self._show_save_results()
+            choice = self.ui.get_player_move(player, self.top_card)
+            if choice == -2:  # Sauvegarder (en arrière-plan, le tour continue)
+                self.save_current_game_async(self._report_save)
+                continue
+            if choice == -3:  # Aide déjà affichée, commande inconnue
+                continue
+            if choice == -5:  # Statistiques
+                timings = self.profiler.summary() if self.profiler is not None else None
+                self.ui.display_statistics(self.game_stats, timings)
+                continue
+            return choice
 
     def calculate_round_score(self, winner: Player) -> int:
         score = 0
@@ -191,76 +414,99 @@ class GameManager:
         return score
         
     def end_game(self):
-        winner = next(player for player in self.players if len(player.hand) == 0)
-        self.ui.animate_win(winner.name)
+        self._close_expert()
+        winner = next((player for player in self.players if len(player.hand) == 0), None)
+        if winner is None:  # Partie quittée : le journal reste disponible pour la reprendre
+            self.flush_saves()
+            if self.journal is not None:
+                self.journal.close()
+            return
+
         round_score = self.calculate_round_score(winner)
         self.scores[winner.name] += round_score
         
         # Mettre à jour les statistiques
         self.game_stats['games_won'] += 1
         
-        # Vérifier les achievements
-        self._check_achievements(winner)
+        # Les succès sont évalués à la publication de GameOver
+        if self.events.wants(GameOver):
+            self.events.publish(GameOver(winner, round_score, self.scores))
+        self.achievements.save_profile()
+        if self.stats_store is not None:
+            self.stats_store.record_game(self, winner, round_score)
         
-        self.ui.announce_winner(winner, round_score, self.scores)
+        # Partie terminée : plus rien à reprendre
+        if self.journal is not None:
+            self.journal.discard()
         
-    def _check_achievements(self, winner: Player):
-        # Premier succès
-        if self.achievements.check_achievement('first_win', self.game_stats):
-            self.ui.display_achievement('first_win')
-            
-        # Partie parfaite
-        if self.game_stats['cards_drawn'] == 0:
-            if self.achievements.check_achievement('perfect_game', self.game_stats):
-                self.ui.display_achievement('perfect_game')
-                
-        # Retour victorieux
-        if self.game_stats['max_cards_in_hand'] >= 10:
-            if self.achievements.check_achievement('comeback', self.game_stats):
-                self.ui.display_achievement('comeback')
-                
-    def _check_special_master_achievement(self):
-        if self.game_stats['special_cards_played'] >= 5:
-            if self.achievements.check_achievement('special_master', self.game_stats):
-                self.ui.display_achievement('special_master')
+        self.flush_saves()
+        
+    def _track_achievements(self):
+        human = next((player for player in self.players if not player.is_ai), None)
+        self.achievements.attach(self.events, human)
                 
+    def snapshot_state(self) -> dict:
+        """État complet de la partie, les cartes étant codées par leur identifiant"""
+        return {
+            'difficulty': self.difficulty,
+            'current_player': self.current_player_index,
+            'direction': self.direction,
+            'declared_color': self.declared_color.value if self.declared_color else None,
+            'scores': dict(self.scores),
+            'players': [
+                {
+                    'name': player.name,
+                    'is_ai': player.is_ai,
+                    'hand': [card.id for card in player.hand]
+                } for player in self.players
+            ],
+            'discard_pile': [card.id for card in self.deck.discard_pile],
+            'draw_pile': [card.id for card in self.deck.cards],
+            'achievements': list(self.achievements.unlocked),
+            'game_stats': dict(self.game_stats)
+        }
+        
     def save_current_game(self) -> bool:
         try:
-            game_state = {
-                'difficulty': self.difficulty,
-                'current_player': self.current_player_index,
-                'direction': self.direction,
-                'scores': self.scores,
-                'stats': self.game_stats,
-                'players': [
-                    {
-                        'name': player.name,
-                        'is_ai': player.is_ai,
-                        'hand': [
-                            {
-                                'color': card.color.value,
-                                'type': card.card_type.value,
-                                'value': card.value
-                            } for card in player.hand
-                        ]
-                    } for player in self.players
-                ],
-                'discard_pile': [
-                    {
-                        'color': card.color.value,
-                        'type': card.card_type.value,
-                        'value': card.value
-                    } for card in self.deck.discard_pile
-                ],
-                'achievements': list(self.achievements.unlocked),
-                'game_stats': self.game_stats
-            }
-            
-            return self.save_manager.save_game(game_state)
+            if self.save_manager is None:
+                return False
+            return self.save_manager.save_game(self.snapshot_state())
         except Exception as e:
             print(f"Erreur lors de la sauvegarde : {e}")
             return False
 
+    def save_current_game_async(self, callback: Optional[Callable[[bool], None]] = None) -> Future:
+        """Sauvegarde sans bloquer : instantané immédiat, écriture sur un autre thread"""
+        if self._save_results is None:
+            self._save_results = queue.SimpleQueue()
+        if self.save_manager is None:
+            future: Future = Future()
+            future.set_result(False)
+            if callback is not None:
+                callback(False)
+            return future
+        if self.save_writer is None:
+            self.save_writer = SaveWriter(self.save_manager)
+        return self.save_writer.submit(self.snapshot_state(), callback)
+        
+    def _report_save(self, success: bool):
+        # Appelé sur le thread d'écriture : le terminal appartient au thread de la partie
+        self._save_results.put(success)
+
+    def _show_save_results(self):
+        while self._save_results is not None and not self._save_results.empty():
+            if self._save_results.get():
+                self.ui.show_message("Partie sauvegardée avec succès !")
+            else:
+                self.ui.show_message("Erreur lors de la sauvegarde !", error=True)
+            
+    def flush_saves(self):
+        """Termine les sauvegardes en attente (fin de partie, abandon)"""
+        if self.save_writer is not None:
+            self.save_writer.close()
+            self.save_writer = None
+        self._show_save_results()
+
     def load_game(self, save_file) -> bool:
         try:
             # Conversion en string si ce n'est pas déjà le cas
@@ -272,55 +518,81 @@ class GameManager:
                 print("Échec du chargement de la sauvegarde")
                 return False
             
-            # Restaurer l'état du jeu
-            self.difficulty = game_state.get('difficulty', 'facile')
-            self.current_player_index = game_state.get('current_player', 0)
-            self.direction = game_state.get('direction', 1)
-            self.scores = game_state.get('scores', {})
-            self.game_stats = game_state.get('stats', {})
-            
-            # Recréer les joueurs et leurs mains
-            self.players = []
-            for player_data in game_state['players']:
-                player = Player(player_data['name'], player_data['is_ai'])
-                for card_data in player_data['hand']:
-                    card = Card(
-                        Color(card_data['color']),
-                        CardType(card_data['type']),
-                        card_data.get('value')
-                    )
-                    player.add_card(card)
-                self.players.append(player)
-            
-            # Recréer la pile de défausse
-            self.deck = Deck()
-            self.deck.discard_pile = []
-            for card_data in game_state['discard_pile']:
-                card = Card(
-                    Color(card_data['color']),
-                    CardType(card_data['type']),
-                    card_data.get('value')
-                )
-                self.deck.discard_pile.append(card)
-                
-            # Charger les achievements
-            self.achievements.unlocked = set(game_state.get('achievements', []))
-            self.game_stats = game_state.get('game_stats', {
-                'cards_played': 0,
-                'turns_played': 0,
-                'cards_drawn': 0,
-                'special_cards_played': 0,
-                'games_won': 0,
-                'max_cards_in_hand': 0
-            })
-            
+            self.restore_state(game_state)
             return True
         except Exception as e:
             print(f"Erreur lors du chargement : {e}")
             return False
 
+    def restore_state(self, game_state: dict):
+        """Restaure un état issu de snapshot_state ou d'une sauvegarde (tous formats)"""
+        # Une partie reprise ne se rejoue pas depuis sa graine
+        self.record = None
+        self.difficulty = game_state.get('difficulty', 'facile')
+        self.current_player_index = game_state.get('current_player', 0)
+        self.direction = game_state.get('direction', 1)
+        declared_color = game_state.get('declared_color')
+        self.declared_color = Color(declared_color) if declared_color else None
+        self.scores = dict(game_state.get('scores', {}))
+        
+        # Joueurs et mains (les joueurs existants sont réutilisés si leur nombre n'a pas changé)
+        if len(self.players) != len(game_state['players']):
+            self.players = [Player(player_data['name']) for player_data in game_state['players']]
+        for player, player_data in zip(self.players, game_state['players']):
+            player.name = player_data['name']
+            player.is_ai = player_data['is_ai']
+            player.strategy = None
+            player.hand.clear()
+            for card_data in player_data['hand']:
+                player.add_card(card_from_data(card_data).base)
+        
+        # Recréer la pile de défausse
+        self.deck.reset()
+        for card_data in game_state['discard_pile']:
+            card = card_from_data(card_data)
+            # Anciennes sauvegardes : la couleur annoncée était écrite sur la carte
+            if card.base is not card:
+                self.declared_color = card.color
+            self.deck.discard_pile.append(card.base)
+            
+        # Recréer la pioche (absente des anciennes sauvegardes : paquet privé
+        # des cartes déjà en main ou dans la défausse)
+        if 'draw_pile' in game_state:
+            self.deck.cards = [Card.from_id(card_id) for card_id in game_state['draw_pile']]
+        else:
+            in_play = Counter(self.deck.discard_pile)
+            for player in self.players:
+                in_play.update(player.hand)
+            remaining = []
+            for card in self.deck.cards:
+                if in_play[card]:
+                    in_play[card] -= 1
+                else:
+                    remaining.append(card)
+            self.deck.cards = remaining
+            self.deck.shuffle()
+            
+        # Charger les achievements (ajoutés à ceux du profil)
+        self.achievements.unlocked |= set(game_state.get('achievements', []))
+        self._track_achievements()
+        self._track_beliefs()
+        if self.beliefs is not None:
+            self.beliefs.sync()
+        self.game_stats = {
+            'cards_played': 0,
+            'turns_played': 0,
+            'cards_drawn': 0,
+            'special_cards_played': 0,
+            'games_won': 0,
+            'max_cards_in_hand': 0
+        }
+        self.game_stats.update(game_state.get('game_stats', game_state.get('stats', {})))
+
     def load_saved_game(self) -> bool:
         """Charge une partie sauvegardée"""
+        if self.save_manager is None:
+            return False
+        self.flush_saves()
         saves = self.save_manager.list_saves()
         if not saves:
             self.ui.show_message("Aucune sauvegarde disponible", error=True)
@@ -344,7 +616,7 @@ class GameManager:
                     pass
 
         # Vérification finale
-        if not isinstance(selected_save, str) or not selected_save.endswith('.json.gz'):
+        if not isinstance(selected_save, str) or not selected_save.endswith(SAVE_SUFFIXES):
             self.ui.show_message("Format de sauvegarde invalide", error=True)
             return False
 
@@ -0,0 +1,212 @@
+import random
+from typing import List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+from .card import Card, Color, PLAYABLE_COLORS
+from .rules import card_effect
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+# Un coup : (carte posée, couleur annoncée), ou (None, poser la carte piochée si
+# elle est jouable, couleur annoncée si c'est un joker) pour piocher
+Move = Union[Tuple[Card, Optional[Color]], Tuple[None, bool, Optional[Color]]]
+DRAW: Move = (None, True, None)
+DRAW_KEEP: Move = (None, False, None)
+
+
+def most_common_color(cards: Sequence[Card]) -> Color:
+    """Couleur la plus présente (la première de PLAYABLE_COLORS en cas d'égalité, rouge à défaut)"""
+    counts = [0] * len(PLAYABLE_COLORS)
+    for card in cards:
+        if card.color != Color.BLACK:
+            counts[PLAYABLE_COLORS.index(card.color)] += 1
+    best = max(counts)
+    return PLAYABLE_COLORS[counts.index(best)] if best else Color.RED
+
+
+class GameState:
+    """État pur d'une partie : mains, pioche, défausse, sens, joueur courant
+    et couleur annoncée, sans interface, sauvegarde ni succès.
+
+    clone() est en O(nombre de joueurs) : les mains sont des tuples, la
+    pioche est une liste jamais modifiée (on ne fait que déplacer un index)
+    et la défausse une liste chaînée de paires (carte, reste). Un coup ne
+    recopie que la main du joueur qui le joue ou qui pioche ; les clones se
+    partagent tout le reste. Les règles sont celles de Rules.apply_card_effect.
+
+    Un clone reçoit le générateur de son parent et le copie à son premier
+    remélange (le parent aussi) : il remélange comme l'aurait fait le parent,
+    sans faire avancer le générateur de celui-ci.
+    """
+
+    __slots__ = ('hands', '_draw_pile', '_draw_top', '_discard', 'discard_size',
+                 'current_player_index', 'direction', 'declared_color', 'winner',
+                 'reshuffles', 'rng', '_rng_shared')
+
+    def __init__(self, hands: Sequence[Sequence[Card]], draw_pile: Sequence[Card],
+                 discard_pile: Sequence[Card], current_player_index: int = 0,
+                 direction: int = 1, declared_color: Optional[Color] = None,
+                 rng: Optional[random.Random] = None):
+        if not discard_pile:
+            raise ValueError("La défausse ne peut pas être vide")
+        self.hands: List[Tuple[Card, ...]] = [tuple(hand) for hand in hands]
+        self._draw_pile: List[Card] = list(draw_pile)  # le dessus est à la fin
+        self._draw_top = len(self._draw_pile)
+        self._discard = None
+        for card in discard_pile:
+            self._discard = (card, self._discard)
+        self.discard_size = len(discard_pile)
+        self.current_player_index = current_player_index
+        self.direction = direction
+        self.declared_color = declared_color
+        self.winner: Optional[int] = next(
+            (i for i, hand in enumerate(self.hands) if not hand), None
+        )
+        self.reshuffles = 0
+        self.rng = rng or random.Random()
+        self._rng_shared = False  # générateur aussi utilisé par un clone ou un parent
+
+    @classmethod
+    def from_game(cls, game: 'GameManager', rng: Optional[random.Random] = None) -> 'GameState':
+        """Copie de l'état d'une partie en cours (informations cachées comprises)"""
+        return cls(
+            [list(player.hand) for player in game.players],
+            game.deck.cards,
+            game.deck.discard_pile,
+            game.current_player_index,
+            game.direction,
+            game.declared_color,
+            rng
+        )
+
+    def clone(self) -> 'GameState':
+        state = GameState.__new__(GameState)
+        state.hands = self.hands.copy()
+        state._draw_pile = self._draw_pile
+        state._draw_top = self._draw_top
+        state._discard = self._discard
+        state.discard_size = self.discard_size
+        state.current_player_index = self.current_player_index
+        state.direction = self.direction
+        state.declared_color = self.declared_color
+        state.winner = self.winner
+        state.reshuffles = self.reshuffles
+        state.rng = self.rng
+        state._rng_shared = self._rng_shared = True
+        return state
+
+    @property
+    def top_card(self) -> Card:
+        """Carte visible, avec la couleur annoncée éventuelle"""
+        card = self._discard[0]
+        if self.declared_color is not None and card.color == Color.BLACK:
+            return card.with_declared_color(self.declared_color)
+        return card
+
+    @property
+    def draw_pile(self) -> List[Card]:
+        return self._draw_pile[:self._draw_top]
+
+    @property
+    def discard_pile(self) -> List[Card]:
+        cards = []
+        node = self._discard
+        while node is not None:
+            cards.append(node[0])
+            node = node[1]
+        cards.reverse()
+        return cards
+
+    def is_game_over(self) -> bool:
+        return self.winner is not None
+
+    def playable_cards(self, player: Optional[int] = None) -> List[Card]:
+        """Cartes distinctes jouables par un joueur (le joueur courant par défaut)"""
+        if player is None:
+            player = self.current_player_index
+        top_card = self.top_card
+        return sorted({c for c in self.hands[player] if c.can_be_played_on(top_card)},
+                      key=lambda c: c.id)
+
+    def legal_moves(self) -> List[Move]:
+        playable = self.playable_cards()
+        if not playable:
+            return [DRAW, DRAW_KEEP]
+        moves: List[Move] = []
+        for card in playable:
+            if card.color == Color.BLACK:
+                moves.extend((card, color) for color in PLAYABLE_COLORS)
+            else:
+                moves.append((card, None))
+        return moves
+
+    def apply_move(self, move: Move):
+        """Joue le coup du joueur courant et passe au joueur suivant"""
+        if self.winner is not None:
+            raise ValueError("La partie est terminée")
+        player = self.current_player_index
+        if move[0] is None:
+            _, play, color = move
+            drawn = self._draw(player)
+            if play and drawn is not None and drawn.can_be_played_on(self.top_card):
+                self._play(player, drawn, color)
+        else:
+            card, color = move
+            self._play(player, card, color)
+        self._update_turn()
+
+    def _update_turn(self):
+        self.current_player_index = (self.current_player_index + self.direction) % len(self.hands)
+
+    def _draw(self, player: int) -> Optional[Card]:
+        if self._draw_top == 0:
+            self._reshuffle_discard_pile()
+            if self._draw_top == 0:
+                return None
+        self._draw_top -= 1
+        card = self._draw_pile[self._draw_top]
+        self.hands[player] = self.hands[player] + (card,)
+        return card
+
+    def _reshuffle_discard_pile(self):
+        # Comme Deck._reshuffle_discard_pile : tout sauf la carte visible repart dans la pioche
+        top_card, rest = self._discard
+        cards = []
+        while rest is not None:
+            cards.append(rest[0])
+            rest = rest[1]
+        if self._rng_shared:
+            rng = random.Random()
+            rng.setstate(self.rng.getstate())
+            self.rng = rng
+            self._rng_shared = False
+        self.rng.shuffle(cards)
+        self._draw_pile = cards
+        self._draw_top = len(cards)
+        self._discard = (top_card, None)
+        self.discard_size = 1
+        if cards:
+            self.reshuffles += 1
+
+    def _play(self, player: int, card: Card, color: Optional[Color]):
+        hand = self.hands[player]
+        try:
+            index = hand.index(card)
+        except ValueError:
+            raise ValueError(f"{card} n'est pas dans la main du joueur {player}") from None
+        self.hands[player] = hand[:index] + hand[index + 1:]
+        self._discard = (card, self._discard)
+        self.discard_size += 1
+        if card.color == Color.BLACK:
+            self.declared_color = color or most_common_color(self.hands[player])
+        else:
+            self.declared_color = None
+
+        _, self.direction, penalty, skip = card_effect(card, len(self.hands), self.direction)
+        victim = (self.current_player_index + self.direction) % len(self.hands)
+        for _ in range(penalty):
+            self._draw(victim)
+        if skip:
+            self._update_turn()
+
+        if not self.hands[player]:
+            self.winner = player
@@ -0,0 +1,134 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from .card import Card, Color, CardType, ALL_CARDS, PLAYABLE_COLORS, PLAYABLE_ON
+
+_COLORS = list(Color)
+_TYPES = list(CardType)
+_COLOR_INDEX = {color: i for i, color in enumerate(_COLORS)}
+_TYPE_INDEX = {card_type: i for i, card_type in enumerate(_TYPES)}
+_BLACK = _COLOR_INDEX[Color.BLACK]
+_NUMBER = _TYPE_INDEX[CardType.NUMBER]
+
+# Index de couleur et de type de chaque carte, par id
+_CARD_COLOR = tuple(_COLOR_INDEX[card.color] for card in ALL_CARDS)
+_CARD_TYPE = tuple(_TYPE_INDEX[card.card_type] for card in ALL_CARDS)
+
+class Hand:
+    """Main d'un joueur, indexée par carte, couleur, type et valeur.
+
+    Se comporte comme une liste ordonnée (ordre d'arrivée des cartes) pour
+    l'affichage et la sauvegarde, mais ajout, retrait et questions de
+    jouabilité ne parcourent jamais la main.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._cards: Dict[int, Card] = {}  # numéro d'arrivée -> carte
+        self._slots: List[List[int]] = [[] for _ in ALL_CARDS]  # id -> numéros d'arrivée
+        self._color_counts = [0] * len(_COLORS)
+        self._type_counts = [0] * len(_TYPES)
+        self._value_counts = [0] * 10
+        self._next_seq = 0
+        self._ordered: Optional[List[Card]] = None
+        self.extend(cards)
+
+    def append(self, card: Card):
+        seq = self._next_seq
+        self._next_seq += 1
+        self._cards[seq] = card
+        self._slots[card.id].append(seq)
+        self._color_counts[_CARD_COLOR[card.id]] += 1
+        type_index = _CARD_TYPE[card.id]
+        self._type_counts[type_index] += 1
+        if type_index == _NUMBER:
+            self._value_counts[card.value] += 1
+        self._ordered = None
+
+    def extend(self, cards: Iterable[Card]):
+        for card in cards:
+            self.append(card)
+
+    def remove(self, card: Card):
+        slot = self._slots[card.id]
+        if not slot:
+            raise ValueError(f"{card} n'est pas dans la main")
+        del self._cards[slot.pop()]
+        self._color_counts[_CARD_COLOR[card.id]] -= 1
+        type_index = _CARD_TYPE[card.id]
+        self._type_counts[type_index] -= 1
+        if type_index == _NUMBER:
+            self._value_counts[card.value] -= 1
+        self._ordered = None
+
+    def clear(self):
+        self._cards.clear()
+        for slot in self._slots:
+            slot.clear()
+        self._color_counts = [0] * len(_COLORS)
+        self._type_counts = [0] * len(_TYPES)
+        self._value_counts = [0] * 10
+        self._ordered = None
+
+    def count(self, card: Card) -> int:
+        return len(self._slots[card.id])
+
+    def color_count(self, color: Color) -> int:
+        return self._color_counts[_COLOR_INDEX[color]]
+
+    def type_count(self, card_type: CardType) -> int:
+        return self._type_counts[_TYPE_INDEX[card_type]]
+
+    def value_count(self, value: int) -> int:
+        return self._value_counts[value]
+
+    def most_common_color(self) -> Optional[Color]:
+        """Couleur (hors noir) la plus présente, None si la main n'en contient aucune"""
+        best = None
+        best_count = 0
+        for color in PLAYABLE_COLORS:
+            count = self._color_counts[_COLOR_INDEX[color]]
+            if count > best_count:
+                best, best_count = color, count
+        return best
+
+    def has_playable(self, top_card: Card) -> bool:
+        if self._color_counts[_BLACK] or self._color_counts[_CARD_COLOR[top_card.id]]:
+            return True
+        if top_card.card_type == CardType.NUMBER:
+            return self._value_counts[top_card.value] > 0
+        return self._type_counts[_CARD_TYPE[top_card.id]] > 0
+
+    def playable(self, top_card: Card) -> List[Card]:
+        """Cartes distinctes jouables sur top_card, dans l'ordre canonique des identifiants"""
+        slots = self._slots
+        return [ALL_CARDS[card_id] for card_id in PLAYABLE_ON[top_card.id] if slots[card_id]]
+
+    def _as_list(self) -> List[Card]:
+        if self._ordered is None:
+            self._ordered = list(self._cards.values())
+        return self._ordered
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._as_list())
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self._as_list()[index]
+
+    def __contains__(self, card: Card) -> bool:
+        return bool(self._slots[card.id])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Hand):
+            other = other._as_list()
+        return self._as_list() == other
+
+    def __repr__(self) -> str:
+        return f"Hand({self._as_list()!r})"
+
+
+def playable_cards(cards: Iterable[Card], top_card: Card) -> List[Card]:
+    """Cartes distinctes jouables d'une main (Hand ou liste), dans l'ordre canonique"""
+    if isinstance(cards, Hand):
+        return cards.playable(top_card)
+    return sorted({c for c in cards if c.can_be_played_on(top_card)}, key=lambda c: c.id)
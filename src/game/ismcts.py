@@ -0,0 +1,217 @@
+import math
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, TYPE_CHECKING
+from .card import Card, Color, PLAYABLE_COLORS
+from .deck import DECK_TEMPLATE
+from .game_state import DRAW, GameState, Move, most_common_color
+from .hand import playable_cards
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+# Au-delà, une simulation est arrêtée et évaluée sur la taille des mains
+MAX_ROLLOUT_TURNS = 200
+
+_FULL_DECK = Counter(DECK_TEMPLATE)
+
+
+class Observation:
+    """Ce que l'IA sait de la partie au moment de jouer"""
+
+    def __init__(self, player: int, hand: List[Card], top_card: Card, discard_pile: List[Card],
+                 hand_sizes: List[int], draw_size: int, direction: int):
+        self.player = player
+        self.hand = hand
+        self.top_card = top_card  # avec la couleur annoncée éventuelle
+        self.discard_pile = discard_pile
+        self.hand_sizes = hand_sizes
+        self.draw_size = draw_size
+        self.direction = direction
+
+    @classmethod
+    def from_game(cls, game: 'GameManager') -> 'Observation':
+        return cls(
+            game.current_player_index,
+            list(game.players[game.current_player_index].hand),
+            game.top_card,
+            list(game.deck.discard_pile),
+            [len(p.hand) for p in game.players],
+            len(game.deck.cards),
+            game.direction
+        )
+
+
+def determinize(observation: Observation, rng: random.Random) -> GameState:
+    """Partie possible : les cartes non vues sont redistribuées au hasard
+    entre les mains adverses et la pioche"""
+    unseen = _FULL_DECK.copy()
+    unseen.subtract(observation.hand)
+    unseen.subtract(observation.discard_pile)
+    hidden = list(unseen.elements())
+    rng.shuffle(hidden)
+
+    hands = []
+    for index, size in enumerate(observation.hand_sizes):
+        if index == observation.player:
+            hands.append(observation.hand)
+        else:
+            hands.append(hidden[:size])
+            del hidden[:size]
+    top = observation.top_card
+    return GameState(hands, hidden, observation.discard_pile, observation.player,
+                     observation.direction, top.color if top.base is not top else None, rng)
+
+
+def _rollout_move(state: GameState) -> Move:
+    playable = state.playable_cards()
+    if not playable:
+        return DRAW
+    # Politique des IA du moteur : même couleur d'abord, les jokers en dernier
+    top_color = state.top_card.color
+    card = next((c for c in playable if c.color == top_color), None)
+    if card is None:
+        colored = [c for c in playable if c.color != Color.BLACK]
+        card = state.rng.choice(colored or playable)
+    if card.color == Color.BLACK:
+        return card, most_common_color(state.hands[state.current_player_index])
+    return card, None
+
+
+def _rewards(state: GameState) -> List[float]:
+    players = range(len(state.hands))
+    if state.winner is not None:
+        return [1.0 if i == state.winner else 0.0 for i in players]
+    # Simulation interrompue : avantage aux mains les plus petites
+    sizes = [len(hand) for hand in state.hands]
+    best = min(sizes)
+    return [1.0 / (1 + size - best) / len(sizes) for size in sizes]
+
+
+class _Node:
+    __slots__ = ('move', 'parent', 'player', 'children', 'visits', 'wins', 'avails')
+
+    def __init__(self, move: Optional[Move] = None, parent: Optional['_Node'] = None,
+                 player: int = -1):
+        self.move = move
+        self.parent = parent
+        self.player = player  # joueur qui a joué `move`
+        self.children: Dict[Move, '_Node'] = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.avails = 1
+
+
+def search(observation: Observation, time_budget: Optional[float] = 0.2,
+           iterations: Optional[int] = None, exploration: float = 0.7,
+           seed: Optional[int] = None) -> Dict[Move, int]:
+    """ISMCTS à un observateur : renvoie le nombre de visites de chaque coup à la racine"""
+    rng = random.Random(seed)
+    root = _Node()
+    deadline = time.perf_counter() + time_budget if time_budget else None
+    done = 0
+    while True:
+        if iterations is not None and done >= iterations:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if iterations is None and deadline is None:
+            break
+        _iterate(root, determinize(observation, rng), exploration, rng)
+        done += 1
+    return {move: child.visits for move, child in root.children.items()}
+
+
+def _iterate(root: _Node, game: GameState, exploration: float, rng: random.Random):
+    node = root
+    # Sélection : tant que tous les coups possibles dans cette déterminisation sont explorés
+    while game.winner is None:
+        moves = game.legal_moves()
+        untried = [m for m in moves if m not in node.children]
+        if untried:
+            move = rng.choice(untried)
+            child = _Node(move, node, game.current_player_index)
+            node.children[move] = child
+            game.apply_move(move)
+            node = child
+            break
+        children = [node.children[m] for m in moves]
+        for child in children:
+            child.avails += 1
+        log_avails = [math.log(child.avails) for child in children]
+        node = max(
+            zip(children, log_avails),
+            key=lambda c: c[0].wins / c[0].visits + exploration * math.sqrt(c[1] / c[0].visits)
+        )[0]
+        game.apply_move(node.move)
+
+    # Simulation jusqu'à la fin de la partie (ou MAX_ROLLOUT_TURNS tours)
+    turns = 0
+    while game.winner is None and turns < MAX_ROLLOUT_TURNS:
+        game.apply_move(_rollout_move(game))
+        turns += 1
+
+    rewards = _rewards(game)
+    while node is not None:
+        node.visits += 1
+        if node.player >= 0:
+            node.wins += rewards[node.player]
+        node = node.parent
+
+
+class ExpertAI:
+    """IA « expert » : Information-Set Monte Carlo Tree Search.
+
+    Les mains adverses et la pioche sont tirées au hasard parmi les cartes
+    que l'IA n'a pas vues, puis des parties sont simulées avec les règles du
+    moteur. Le budget est un temps (secondes) et/ou un nombre d'itérations ;
+    avec workers > 1, chaque processus construit son propre arbre et les
+    visites à la racine sont additionnées.
+    """
+
+    def __init__(self, time_budget: Optional[float] = 0.2, iterations: Optional[int] = None,
+                 workers: int = 1, exploration: float = 0.7, seed: Optional[int] = None):
+        self.time_budget = time_budget
+        self.iterations = iterations
+        self.workers = workers
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def choose_move(self, observation: Observation) -> Move:
+        playable = playable_cards(observation.hand, observation.top_card)
+        if not playable:
+            return DRAW
+        if len(playable) == 1 and playable[0].color != Color.BLACK:
+            return playable[0], None
+
+        if self.workers > 1:
+            visits = self._parallel_search(observation)
+        else:
+            visits = search(observation, self.time_budget, self.iterations,
+                            self.exploration, self.rng.randrange(2 ** 32))
+        if not visits:
+            return playable[0], (PLAYABLE_COLORS[0] if playable[0].color == Color.BLACK else None)
+        return max(visits, key=visits.get)
+
+    def _parallel_search(self, observation: Observation) -> Dict[Move, int]:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        iterations = -(-self.iterations // self.workers) if self.iterations else None
+        futures = [
+            self._pool.submit(search, observation, self.time_budget, iterations,
+                              self.exploration, self.rng.randrange(2 ** 32))
+            for _ in range(self.workers)
+        ]
+        visits: Dict[Move, int] = {}
+        for future in futures:
+            for move, count in future.result().items():
+                visits[move] = visits.get(move, 0) + count
+        return visits
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
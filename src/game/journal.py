@@ -0,0 +1,111 @@
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple
+from .card import Card, Color, PLAYABLE_COLORS
+from . import save_format
+
+_NONE = 255
+
+class JournalRecord:
+    """Un coup : joueur, carte posée, couleur annoncée et cartes piochées par le joueur"""
+    __slots__ = ('player', 'card', 'color', 'drawn')
+    FORMAT = struct.Struct("<BBBB")
+
+    def __init__(self, player: int, card: Optional[Card], color: Optional[Color], drawn: int):
+        self.player = player
+        self.card = card
+        self.color = color
+        self.drawn = drawn
+
+    def pack(self) -> bytes:
+        return self.FORMAT.pack(
+            self.player,
+            self.card.id if self.card is not None else _NONE,
+            PLAYABLE_COLORS.index(self.color) if self.color is not None else _NONE,
+            self.drawn
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes, offset: int = 0) -> 'JournalRecord':
+        player, card_id, color, drawn = cls.FORMAT.unpack_from(data, offset)
+        return cls(
+            player,
+            Card.from_id(card_id) if card_id != _NONE else None,
+            PLAYABLE_COLORS[color] if color != _NONE else None,
+            drawn
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, JournalRecord) and self.pack() == other.pack()
+
+    def __repr__(self) -> str:
+        return f"JournalRecord({self.player}, {self.card!r}, {self.color}, {self.drawn})"
+
+
+class MoveJournal:
+    """Sauvegarde automatique en ajout seul.
+
+    Un instantané complet (format binaire de save_format) est écrit au début
+    de la partie, puis chaque coup ajoute 4 octets au journal. Toutes les
+    `compact_every` entrées, ou quand la pioche a été remélangée (seule
+    source de hasard en cours de partie), le journal est remplacé par un
+    nouvel instantané.
+    """
+
+    def __init__(self, journal_dir: str = "saves/journal", name: str = "partie",
+                 compact_every: int = 100):
+        self.journal_dir = Path(journal_dir)
+        self.snapshot_file = self.journal_dir / f"{name}.snap"
+        self.log_file = self.journal_dir / f"{name}.log"
+        self.compact_every = compact_every
+        self.moves_since_snapshot = 0
+        self._log: Optional[BinaryIO] = None
+
+    def exists(self) -> bool:
+        return self.snapshot_file.exists()
+
+    def start(self, game_state: dict):
+        """Écrit un nouvel instantané de base et vide le journal"""
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self.close()
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        tmp_file.write_bytes(save_format.encode_state(game_state))
+        # Le journal est vidé avant le remplacement de l'instantané : après une
+        # interruption, l'ancien instantané sans journal reste cohérent
+        self._log = self.log_file.open('wb', buffering=0)
+        os.replace(tmp_file, self.snapshot_file)
+        self.moves_since_snapshot = 0
+
+    def compact(self, game_state: dict):
+        self.start(game_state)
+
+    def needs_compaction(self) -> bool:
+        return self.moves_since_snapshot >= self.compact_every
+
+    def append(self, record: JournalRecord):
+        if self._log is None:
+            self._log = self.log_file.open('ab', buffering=0)
+        self._log.write(record.pack())
+        self.moves_since_snapshot += 1
+
+    def load(self) -> Tuple[dict, List[JournalRecord]]:
+        """Instantané de base et coups joués depuis"""
+        game_state = save_format.decode_state(self.snapshot_file.read_bytes())
+        data = self.log_file.read_bytes() if self.log_file.exists() else b""
+        size = JournalRecord.FORMAT.size
+        # Un enregistrement tronqué (écriture interrompue) est ignoré
+        records = [JournalRecord.unpack(data, offset)
+                   for offset in range(0, len(data) - size + 1, size)]
+        return game_state, records
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def discard(self):
+        """Supprime le journal (partie terminée)"""
+        self.close()
+        self.snapshot_file.unlink(missing_ok=True)
+        self.log_file.unlink(missing_ok=True)
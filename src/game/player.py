@@ -1,17 +1,30 @@
-from typing import List
+from typing import Iterable, List, Optional
 from .card import Card
+from .hand import Hand
 
 class Player:
-    def __init__(self, name: str, is_ai: bool = False):
+    def __init__(self, name: str, is_ai: bool = False, strategy: Optional[str] = None):
         self.name = name
-        self.hand: List[Card] = []
+        self._hand = Hand()
         self.is_ai = is_ai
+        self.strategy = strategy  # stratégie de l'IA (ai_strategy.STRATEGIES), sinon la difficulté
+        
+    @property
+    def hand(self) -> Hand:
+        return self._hand
+        
+    @hand.setter
+    def hand(self, cards: Iterable[Card]):
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
         
     def add_card(self, card: Card):
-        self.hand.append(card)
+        self._hand.append(card)
         
     def remove_card(self, card: Card):
-        self.hand.remove(card)
+        self._hand.remove(card)
         
     def has_playable_card(self, top_card: Card) -> bool:
-        return any(card.can_be_played_on(top_card) for card in self.hand)
+        return self._hand.has_playable(top_card)
+        
+    def playable_cards(self, top_card: Card) -> List[Card]:
+        return self._hand.playable(top_card)
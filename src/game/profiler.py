@@ -0,0 +1,219 @@
+import json
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+# Phases d'un tour, mesurées en temps exclusif (la pioche provoquée par un +2
+# compte dans « draw », pas dans « rules »)
+PHASES = ('render', 'input', 'ai', 'rules', 'draw', 'save')
+PHASE_LABELS = {
+    'turn': "Tour complet",
+    'render': "Affichage",
+    'input': "Saisie",
+    'ai': "Décision IA",
+    'rules': "Règles",
+    'draw': "Pioche/mélange",
+    'save': "Sauvegarde"
+}
+
+# Méthodes instrumentées, par phase
+_GAME_METHODS = {
+    '_play_ai_turn': 'ai',
+    '_play_card': 'rules',
+    '_draw_card': 'draw',
+    '_journal_turn': 'save',
+    'save_current_game': 'save',
+    'save_current_game_async': 'save'
+}
+_INPUT_METHODS = ('get_player_move', 'get_color_choice', 'ask_play_drawn_card')
+_RENDER_PREFIXES = ('display_', 'animate_', 'show_', 'announce_')
+
+
+class Histogram:
+    """Histogramme à précision relative constante (à la HdrHistogram).
+
+    Les valeurs (entiers, en nanosecondes) inférieures à 2 * SUB_BUCKETS
+    sont exactes ; au-delà, chaque puissance de 2 est découpée en
+    SUB_BUCKETS intervalles, soit une erreur relative inférieure à 1/32.
+    Mémoire bornée (quelques centaines de cases au plus).
+    """
+    SUB_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BITS
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < 2 * cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BITS - 1
+        return (shift + 1) * cls.SUB_BUCKETS + (value >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def _value(cls, index: int) -> int:
+        """Milieu de l'intervalle d'une case"""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.SUB_BUCKETS - 1
+        low = (index % cls.SUB_BUCKETS + cls.SUB_BUCKETS) << shift
+        return low + (1 << shift) // 2
+
+    def record(self, value: int):
+        value = max(0, value)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def merge(self, other: 'Histogram'):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def summary(self) -> dict:
+        """Résumé en microsecondes"""
+        return {
+            'count': self.count,
+            'mean_us': self.total / self.count / 1000 if self.count else 0.0,
+            'min_us': (self.min or 0) / 1000,
+            'p50_us': self.percentile(50) / 1000,
+            'p95_us': self.percentile(95) / 1000,
+            'p99_us': self.percentile(99) / 1000,
+            'max_us': (self.max or 0) / 1000
+        }
+
+
+class TurnProfiler:
+    """Durée de chaque phase des tours d'une partie.
+
+    attach() remplace, sur l'instance de GameManager et sur son interface,
+    les méthodes de chaque phase par des versions chronométrées
+    (time.perf_counter_ns) ; une partie sans profileur n'exécute donc aucun
+    code de mesure. Une phase est enregistrée une fois par tour où elle a lieu.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {
+            phase: Histogram() for phase in ('turn',) + PHASES
+        }
+        self._turn: Dict[str, int] = {}
+        self._stack: List[int] = []  # temps des sous-phases, par niveau
+        self._patched: List[Tuple[object, str, object]] = []
+
+    def attach(self, game: 'GameManager'):
+        """Instrumente une partie (après le choix de son interface)"""
+        self._patch(game, 'play_turn', self._timed_turn(game.play_turn))
+        for name, phase in _GAME_METHODS.items():
+            self._patch(game, name, self._timed(phase, getattr(game, name)))
+        # Affichage : diffusion des événements aux interfaces abonnées
+        self._patch(game.events, 'publish', self._timed('render', game.events.publish))
+        ui = game.ui
+        for name in dir(ui):
+            if not callable(getattr(ui, name, None)):
+                continue
+            if name.startswith(_RENDER_PREFIXES):
+                self._patch(ui, name, self._timed('render', getattr(ui, name)))
+            elif name in _INPUT_METHODS:
+                self._patch(ui, name, self._timed('input', getattr(ui, name)))
+
+    def detach(self):
+        for target, name, original in reversed(self._patched):
+            if hasattr(type(target), name):
+                delattr(target, name)  # retour à la méthode de la classe
+            else:
+                setattr(target, name, original)
+        self._patched = []
+
+    def _patch(self, target, name: str, wrapper):
+        self._patched.append((target, name, getattr(target, name)))
+        setattr(target, name, wrapper)
+
+    def _timed(self, phase: str, func: Callable) -> Callable:
+        clock = time.perf_counter_ns
+        stack = self._stack
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            stack.append(0)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                children = stack.pop()
+                self._turn[phase] = self._turn.get(phase, 0) + elapsed - children
+                if stack:
+                    stack[-1] += elapsed
+        return timed
+
+    def _timed_turn(self, func: Callable) -> Callable:
+        clock = time.perf_counter_ns
+
+        @wraps(func)
+        def timed_turn(*args, **kwargs):
+            self._turn = {}
+            self._stack.clear()
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.histograms['turn'].record(clock() - start)
+                for phase, elapsed in self._turn.items():
+                    self.histograms[phase].record(elapsed)
+        return timed_turn
+
+    def merge(self, other: 'TurnProfiler'):
+        for phase, histogram in other.histograms.items():
+            self.histograms[phase].merge(histogram)
+
+    def summary(self) -> Dict[str, dict]:
+        """p50/p95/p99 (µs) des phases mesurées au moins une fois"""
+        return {
+            phase: histogram.summary()
+            for phase, histogram in self.histograms.items() if histogram.count
+        }
+
+    def report(self) -> dict:
+        return {'version': 1, 'unit': 'µs', 'phases': self.summary()}
+
+    def save_report(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+
+    def __getstate__(self):
+        # Transmis entre processus (simulations) : seuls les histogrammes comptent
+        return {'histograms': self.histograms}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.histograms.update(state['histograms'])
@@ -0,0 +1,133 @@
+"""Enregistrement et relecture de parties.
+
+Une partie est entièrement déterminée par sa graine (mélanges, pioches,
+choix des IA classiques) et par les décisions que la graine ne permet pas
+de retrouver : les choix du joueur humain, les couleurs qu'il annonce et
+les coups de l'IA « expert » (recherche bornée en temps).
+
+Usage : python -m src.game.replay FICHIER [--turn N]
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import List, Optional, Union
+from ..ui.console_ui import ConsoleUI
+from ..ui.null_ui import NullUI
+
+REPLAY_VERSION = 1
+
+
+class ReplayRecord:
+    """Graine et suite des décisions d'une partie.
+
+    Décisions (entiers, dans l'ordre où la partie les demande) :
+      - coup du joueur : index dans la main, -1 piocher, -4 quitter ;
+      - poser la carte piochée : 1 ou 0 ;
+      - couleur annoncée : index dans PLAYABLE_COLORS ;
+      - coup de l'IA expert : id de la carte (variante à couleur annoncée
+        pour un Joker/+4).
+    """
+
+    def __init__(self, seed: int, difficulty: str, ai_only: bool = False,
+                 decisions: Optional[List[int]] = None, turns: int = 0):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.ai_only = ai_only
+        self.decisions: List[int] = decisions if decisions is not None else []
+        self.turns = turns  # tours joués
+
+    def to_dict(self) -> dict:
+        return {
+            'version': REPLAY_VERSION,
+            'seed': self.seed,
+            'difficulty': self.difficulty,
+            'ai_only': self.ai_only,
+            'turns': self.turns,
+            'decisions': self.decisions
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ReplayRecord':
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Version de replay non supportée : {data.get('version')}")
+        return cls(data['seed'], data['difficulty'], data.get('ai_only', False),
+                   list(data['decisions']), data.get('turns', 0))
+
+    def save(self, path: Union[str, Path]):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), separators=(',', ':')), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ReplayRecord':
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+
+class ReplayRunner:
+    """Rejoue une partie enregistrée.
+
+    seek() avance sans aucun affichage jusqu'au tour demandé ; play()
+    affiche la suite de la partie avec une vraie interface.
+    """
+
+    def __init__(self, record: ReplayRecord):
+        self.record = record
+        self.game = None
+        self._restart()
+
+    def _restart(self):
+        from .game_manager import GameManager
+
+        self.game = GameManager(self.record.difficulty, headless=True,
+                                ai_only=self.record.ai_only, seed=self.record.seed)
+        self.game.replaying = iter(self.record.decisions)
+        self.game.start_game()
+
+    @property
+    def turn(self) -> int:
+        return self.game.game_stats['turns_played']
+
+    def is_finished(self) -> bool:
+        return self.game.is_game_over() or self.turn >= self.record.turns
+
+    def step(self) -> bool:
+        """Joue le tour suivant ; False si la partie enregistrée est terminée"""
+        if self.is_finished():
+            return False
+        self.game.play_turn()
+        return True
+
+    def seek(self, turn: int):
+        """Se place au début du tour `turn` (0 = début de partie), sans affichage"""
+        if turn < self.turn:
+            self._restart()
+        ui = self.game.ui
+        self.game.ui = NullUI()
+        try:
+            while self.turn < turn and self.step():
+                pass
+        finally:
+            self.game.ui = ui
+
+    def play(self, from_turn: int = 0, ui=None):
+        """Affiche la partie à partir du tour `from_turn`"""
+        self.seek(from_turn)
+        self.game.ui = ui if ui is not None else ConsoleUI()
+        while self.step():
+            pass
+        if self.game.is_game_over():
+            self.game.end_game()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejoue une partie enregistrée")
+    parser.add_argument("file", help="fichier de replay (.json)")
+    parser.add_argument("--turn", type=int, default=0, help="tour à partir duquel afficher")
+    args = parser.parse_args(argv)
+
+    runner = ReplayRunner(ReplayRecord.load(args.file))
+    runner.play(args.turn)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,52 @@
 from __future__ import annotations
 from .card import Card, CardType
+from .events import CardEffect
 from .player import Player
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .game_manager import GameManager
 
+# Cartes à faire piocher au joueur suivant
+PENALTIES = {CardType.DRAW_TWO: 2, CardType.WILD_DRAW_FOUR: 4}
+EFFECT_NAMES = {CardType.SKIP: 'skip', CardType.REVERSE: 'reverse',
+                CardType.DRAW_TWO: 'draw_two', CardType.WILD_DRAW_FOUR: 'draw_four'}
+
+
+def card_effect(card: Card, players: int, direction: int) -> Tuple[Optional[str], int, int, bool]:
+    """Effet d'une carte, commun au moteur et à GameState : (nom de l'effet ou None,
+    sens après la carte, cartes à faire piocher au joueur suivant, joueur suivant passé)"""
+    card_type = card.card_type
+    if card_type == CardType.REVERSE:
+        # À deux joueurs, changer de sens revient à passer le tour de l'adversaire
+        return 'reverse', -direction, 0, players == 2
+    penalty = PENALTIES.get(card_type, 0)
+    if penalty or card_type == CardType.SKIP:
+        return EFFECT_NAMES[card_type], direction, penalty, True
+    return None, direction, 0, False
+
+
 class Rules:
     @staticmethod
     def apply_card_effect(card: Card, game_manager: GameManager):
-        if card.card_type == CardType.SKIP:
-            game_manager._update_turn()
-        
-        elif card.card_type == CardType.REVERSE:
-            game_manager.direction *= -1
-            if len(game_manager.players) == 2:
-                game_manager._update_turn()
-                
-        elif card.card_type == CardType.DRAW_TWO:
+        effect, direction, penalty, skip = card_effect(card, len(game_manager.players),
+                                                       game_manager.direction)
+        if effect is None:
+            return
+        game_manager.direction = direction
+        next_player = None
+        if effect != 'reverse':
             next_player = game_manager.players[
-                (game_manager.current_player_index + game_manager.direction) 
-                % len(game_manager.players)
+                (game_manager.current_player_index + direction) % len(game_manager.players)
             ]
-            for _ in range(2):
-                next_player.add_card(game_manager.deck.draw_card())
-            game_manager._update_turn()
-            
-        elif card.card_type == CardType.WILD_DRAW_FOUR:
-            next_player = game_manager.players[
-                (game_manager.current_player_index + game_manager.direction) 
-                % len(game_manager.players)
-            ]
-            for _ in range(4):
-                next_player.add_card(game_manager.deck.draw_card())
+        Rules._publish_effect(card, effect, game_manager, next_player)
+        if penalty:
+            game_manager._draw_cards(next_player, penalty)
+        if skip:
             game_manager._update_turn()
+
+    @staticmethod
+    def _publish_effect(card: Card, effect: str, game_manager: GameManager,
+                        target: Optional[Player] = None):
+        if game_manager.events.wants(CardEffect):
+            game_manager.events.publish(CardEffect(card, effect, target))
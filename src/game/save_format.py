@@ -0,0 +1,164 @@
+"""Format de sauvegarde binaire compact (version 2).
+
+Structure d'un fichier `.uno` :
+  - en-tête fixe (HEADER) : signature, version du format, difficulté,
+    joueur courant, sens, couleur annoncée, nombre de joueurs, date de
+    création et empreinte SHA-256 du contenu ;
+  - contenu : pour chaque joueur son nom, son type, son score et sa main
+    (un octet par carte), puis la défausse et la pioche (un octet par
+    carte), les statistiques (entiers non signés) et les succès (masque).
+"""
+import hashlib
+import struct
+from datetime import datetime
+from typing import Dict, List, Optional
+from .card import Card, Color, CardType, PLAYABLE_COLORS
+
+MAGIC = b"UNOB"
+FORMAT_VERSION = 2
+SUFFIX = ".uno"
+
+HEADER = struct.Struct("<4sBBBbBBq32s")
+_NO_COLOR = 255
+_UNKNOWN = 255
+
+DIFFICULTIES = ("facile", "moyen", "difficile", "expert")
+STAT_KEYS = (
+    'cards_played',
+    'turns_played',
+    'cards_drawn',
+    'special_cards_played',
+    'games_won',
+    'max_cards_in_hand'
+)
+# Un bit par succès : les nouveaux succès s'ajoutent à la fin (16 au plus)
+ACHIEVEMENT_IDS = ('first_win', 'perfect_game', 'comeback', 'special_master', 'veteran')
+
+_PLAYER = struct.Struct("<B?iB")  # longueur du nom, IA, score, taille de la main
+_PILE = struct.Struct("<H")
+_STATS = struct.Struct(f"<{len(STAT_KEYS)}I")
+_ACHIEVEMENTS = struct.Struct("<H")
+
+
+def encode_state(game_state: dict, created: Optional[datetime] = None) -> bytes:
+    """Encode un état de partie (cartes sous forme d'identifiants) en binaire"""
+    created = created or datetime.now()
+    scores = game_state.get('scores', {})
+    parts: List[bytes] = []
+
+    players = game_state['players']
+    for player in players:
+        name = player['name'].encode('utf-8')[:255]
+        hand = bytes(player['hand'])
+        parts.append(_PLAYER.pack(len(name), player['is_ai'],
+                                  scores.get(player['name'], 0), len(hand)))
+        parts.append(name)
+        parts.append(hand)
+
+    for pile in (game_state.get('discard_pile', []), game_state.get('draw_pile', [])):
+        pile = bytes(pile)
+        parts.append(_PILE.pack(len(pile)))
+        parts.append(pile)
+
+    stats = game_state.get('game_stats', {})
+    parts.append(_STATS.pack(*(stats.get(key, 0) for key in STAT_KEYS)))
+    unlocked = set(game_state.get('achievements', []))
+    unknown = unlocked.difference(ACHIEVEMENT_IDS)
+    if unknown:
+        raise ValueError(f"Succès sans bit dans le format binaire : {', '.join(sorted(unknown))}")
+    mask = sum(1 << i for i, name in enumerate(ACHIEVEMENT_IDS) if name in unlocked)
+    parts.append(_ACHIEVEMENTS.pack(mask))
+
+    payload = b"".join(parts)
+    difficulty = game_state.get('difficulty')
+    declared = game_state.get('declared_color')
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        DIFFICULTIES.index(difficulty) if difficulty in DIFFICULTIES else _UNKNOWN,
+        game_state.get('current_player', 0),
+        game_state.get('direction', 1),
+        PLAYABLE_COLORS.index(Color(declared)) if declared else _NO_COLOR,
+        len(players),
+        int(created.timestamp() * 1_000_000),
+        hashlib.sha256(payload).digest()
+    )
+    return header + payload
+
+
+def decode_state(data: bytes) -> dict:
+    """Décode un fichier binaire vers le même dictionnaire que les sauvegardes JSON"""
+    (magic, version, difficulty, current, direction, declared, n_players,
+     created_us, checksum) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Fichier de sauvegarde binaire invalide")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Version de sauvegarde non supportée : {version}")
+    payload = memoryview(data)[HEADER.size:]
+    if hashlib.sha256(payload).digest() != checksum:
+        raise ValueError("Corruption détectée : les checksums ne correspondent pas")
+
+    offset = HEADER.size
+    players = []
+    scores: Dict[str, int] = {}
+    for _ in range(n_players):
+        name_len, is_ai, score, hand_len = _PLAYER.unpack_from(data, offset)
+        offset += _PLAYER.size
+        name = data[offset:offset + name_len].decode('utf-8')
+        offset += name_len
+        hand = list(data[offset:offset + hand_len])
+        offset += hand_len
+        players.append({'name': name, 'is_ai': is_ai, 'hand': hand})
+        scores[name] = score
+
+    piles = []
+    for _ in range(2):
+        (length,) = _PILE.unpack_from(data, offset)
+        offset += _PILE.size
+        piles.append(list(data[offset:offset + length]))
+        offset += length
+
+    stats = dict(zip(STAT_KEYS, _STATS.unpack_from(data, offset)))
+    offset += _STATS.size
+    (mask,) = _ACHIEVEMENTS.unpack_from(data, offset)
+
+    return {
+        'difficulty': DIFFICULTIES[difficulty] if difficulty < len(DIFFICULTIES) else 'facile',
+        'current_player': current,
+        'direction': direction,
+        'declared_color': PLAYABLE_COLORS[declared].value if declared != _NO_COLOR else None,
+        'scores': scores,
+        'players': players,
+        'discard_pile': piles[0],
+        'draw_pile': piles[1],
+        'achievements': [name for i, name in enumerate(ACHIEVEMENT_IDS) if mask & (1 << i)],
+        'game_stats': stats,
+        'metadata': _metadata(created_us, checksum)
+    }
+
+
+def read_metadata(data: bytes) -> dict:
+    """Métadonnées d'un fichier binaire, lues dans le seul en-tête (contenu non décodé)"""
+    header = HEADER.unpack_from(data)
+    return _metadata(header[7], header[8])
+
+
+def _metadata(created_us: int, checksum: bytes) -> dict:
+    created = datetime.fromtimestamp(created_us / 1_000_000)
+    return {
+        'timestamp': created.strftime("%Y%m%d_%H%M%S"),
+        'version': f"{FORMAT_VERSION}.0",
+        'date_created': created.isoformat(),
+        'checksum': checksum.hex()
+    }
+
+
+def card_from_data(card_data) -> Card:
+    """Carte à partir d'un identifiant (format 2) ou d'un dictionnaire (format 1)"""
+    if isinstance(card_data, int):
+        return Card.from_id(card_data)
+    return Card(
+        Color(card_data['color']),
+        CardType(card_data['type']),
+        card_data.get('value')
+    )
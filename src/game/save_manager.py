@@ -3,40 +3,82 @@ from datetime import datetime
 from pathlib import Path
 import gzip
 import hashlib
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from . import save_format as binary_format
+
+MANIFEST_VERSION = 1
+JSON_SUFFIX = ".json.gz"
+SAVE_SUFFIXES = (JSON_SUFFIX, binary_format.SUFFIX)
 
 class SaveManager:
-    def __init__(self):
-        self.save_dir = Path("saves")
+    def __init__(self, save_dir: str = "saves", save_format: str = "binary"):
+        self.save_dir = Path(save_dir)
         self.save_dir.mkdir(exist_ok=True)
         self.max_saves = 10  # Nombre maximum de sauvegardes à conserver
+        # "binary" (format compact, par défaut) ou "json" (format historique)
+        self.save_format = save_format
+        # Index des sauvegardes (évite de décompresser chaque fichier pour les lister)
+        self.manifest_file = self.save_dir / "index.json"
+        self._manifest: Optional[Dict[str, dict]] = None
+        self._manifest_dir_mtime: Optional[int] = None
         
-    def save_game(self, game_state: dict) -> bool:
+    def save_game(self, game_state: dict, name: Optional[str] = None) -> bool:
+        """Écrit une sauvegarde ; `name` remplace l'horodatage dans le nom du fichier"""
+        return self.save_games([(name, game_state)]) == 1
+
+    def save_games(self, states: List[Tuple[Optional[str], dict]]) -> int:
+        """Écrit plusieurs sauvegardes (nom, état) en ne réécrivant l'index
+        qu'une fois ; renvoie le nombre de sauvegardes écrites"""
+        saved = 0
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_file = self.save_dir / f"uno_save_{timestamp}.json.gz"
-            
-            # Ajout de métadonnées
-            game_state['metadata'] = {
-                'timestamp': timestamp,
-                'version': '1.0',
-                'date_created': datetime.now().isoformat()
-            }
+            self._ensure_manifest()
+            for name, game_state in states:
+                try:
+                    self._write_save(game_state, name)
+                    saved += 1
+                except Exception as e:
+                    print(f"Erreur lors de la sauvegarde : {e}")
+            if saved:
+                self._rotate_saves()
+                self._write_manifest()
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde : {e}")
+        return saved
+
+    def save_path(self, name: str) -> Path:
+        """Fichier d'une sauvegarde nommée, dans le format courant"""
+        suffix = binary_format.SUFFIX if self.save_format == "binary" else JSON_SUFFIX
+        return self.save_dir / f"uno_save_{name}{suffix}"
             
-            # Calcul du checksum
-            checksum = self._calculate_checksum(game_state)
-            game_state['metadata']['checksum'] = checksum
+    def _write_save(self, game_state: dict, name: Optional[str]):
+        created = datetime.now()
+        save_file = self.save_path(name or created.strftime("%Y%m%d_%H%M%S"))
+        if self.save_format == "binary":
+            data = binary_format.encode_state(game_state, created)
+            save_file.write_bytes(data)
+            # Entrée de l'index construite depuis l'état : seul l'en-tête est relu
+            self._manifest[save_file.name] = self._manifest_entry(save_file, {
+                'players': game_state['players'],
+                'metadata': binary_format.read_metadata(data)
+            })
+            return
             
-            # Sauvegarde compressée
-            with gzip.open(save_file, 'wt', encoding='utf-8') as f:
-                json.dump(game_state, f, indent=2)
-                
-            self._rotate_saves()
-            return True
+        # Ajout de métadonnées
+        game_state['metadata'] = {
+            'timestamp': created.strftime("%Y%m%d_%H%M%S"),
+            'version': '1.0',
+            'date_created': created.isoformat()
+        }
+        
+        # Calcul du checksum
+        checksum = self._calculate_checksum(game_state)
+        game_state['metadata']['checksum'] = checksum
+        
+        # Sauvegarde compressée
+        with gzip.open(save_file, 'wt', encoding='utf-8') as f:
+            json.dump(game_state, f, indent=2)
             
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde : {e}")
-            return False
+        self._manifest[save_file.name] = self._manifest_entry(save_file, game_state)
             
     def load_game(self, save_info) -> Optional[dict]:
         try:
@@ -58,7 +100,7 @@ class SaveManager:
             save_file = str(save_file).strip()
             
             # Vérification que le nom de fichier est valide
-            if not save_file.endswith('.json.gz'):
+            if not save_file.endswith(SAVE_SUFFIXES):
                 raise ValueError(f"Format de fichier invalide : {save_file}")
             
             save_path = self.save_dir / save_file
@@ -68,6 +110,10 @@ class SaveManager:
             if not save_path.exists():
                 raise FileNotFoundError(f"Sauvegarde non trouvée: {save_path}")
                 
+            if save_file.endswith(binary_format.SUFFIX):
+                # Le format binaire vérifie lui-même son empreinte
+                return binary_format.decode_state(save_path.read_bytes())
+                
             # Lecture du fichier compressé
             with gzip.open(save_path, 'rt', encoding='utf-8') as f:
                 game_state = json.load(f)
@@ -93,21 +139,95 @@ class SaveManager:
             return None
             
     def list_saves(self) -> List[Dict[str, str]]:
-        saves = []
-        for save_file in self.save_dir.glob("uno_save_*.json*"):
+        self._ensure_manifest()
+        saves = [dict(entry) for entry in self._manifest.values()]
+        return sorted(saves, key=lambda x: x['date'], reverse=True)
+        
+    def _manifest_entry(self, save_file: Path, data: dict) -> dict:
+        stat = save_file.stat()
+        metadata = data['metadata']
+        return {
+            'filename': save_file.name,
+            'date': metadata['date_created'],
+            'version': metadata.get('version', 'unknown'),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'checksum': metadata.get('checksum'),
+            'players': [
+                {
+                    'name': player['name'],
+                    'is_ai': player['is_ai'],
+                    'cards': len(player['hand'])
+                } for player in data.get('players', [])
+            ],
+            'display': f"{save_file.name} ({metadata['date_created']})"  # Ajout d'un champ pour l'affichage
+        }
+        
+    def _read_save_file(self, save_file: Path) -> dict:
+        if save_file.name.endswith(binary_format.SUFFIX):
+            return binary_format.decode_state(save_file.read_bytes())
+        with gzip.open(save_file, 'rt', encoding='utf-8') if save_file.suffix == '.gz' \
+             else save_file.open('r') as f:
+            return json.load(f)
+            
+    def _ensure_manifest(self):
+        """Charge l'index, et le reconstruit s'il est absent ou périmé"""
+        if self._manifest is not None and self._manifest_is_fresh(self._manifest_dir_mtime):
+            return
+        try:
+            with self.manifest_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != MANIFEST_VERSION:
+                raise ValueError("Version d'index inconnue")
+            self._manifest = {entry['filename']: entry for entry in data['saves']}
+            self._manifest_dir_mtime = data.get('dir_mtime_ns')
+        except Exception:
+            self._manifest = {}
+            self._manifest_dir_mtime = None
+            
+        if not self._manifest_is_fresh(self._manifest_dir_mtime):
+            self._rebuild_manifest()
+            
+    def _manifest_is_fresh(self, dir_mtime_ns: Optional[int]) -> bool:
+        # Tout ajout ou suppression de fichier modifie la date du répertoire
+        return dir_mtime_ns is not None and self.save_dir.stat().st_mtime_ns == dir_mtime_ns
+        
+    def _rebuild_manifest(self):
+        """Resynchronise l'index : seuls les fichiers nouveaux ou modifiés sont relus"""
+        manifest = {}
+        for save_file in self.save_dir.glob("uno_save_*"):
+            if not save_file.name.endswith(SAVE_SUFFIXES):
+                continue
+            entry = self._manifest.get(save_file.name)
             try:
-                with gzip.open(save_file, 'rt', encoding='utf-8') if save_file.suffix == '.gz' \
-                     else save_file.open('r') as f:
-                    data = json.load(f)
-                    saves.append({
-                        'filename': save_file.name,
-                        'date': data['metadata']['date_created'],
-                        'version': data['metadata'].get('version', 'unknown'),
-                        'display': f"{save_file.name} ({data['metadata']['date_created']})"  # Ajout d'un champ pour l'affichage
-                    })
+                stat = save_file.stat()
+                if entry is None or entry.get('size') != stat.st_size \
+                        or entry.get('mtime_ns') != stat.st_mtime_ns:
+                    entry = self._manifest_entry(save_file, self._read_save_file(save_file))
             except Exception:
                 continue
-        return sorted(saves, key=lambda x: x['date'], reverse=True)
+            manifest[save_file.name] = entry
+        self._manifest = manifest
+        self._write_manifest()
+        
+    def _write_manifest(self):
+        try:
+            if not self.manifest_file.exists():
+                self.manifest_file.touch()
+            # Réécriture en place : ne modifie pas la date du répertoire
+            dir_mtime_ns = self.save_dir.stat().st_mtime_ns
+            with self.manifest_file.open('r+', encoding='utf-8') as f:
+                json.dump({
+                    'version': MANIFEST_VERSION,
+                    'dir_mtime_ns': dir_mtime_ns,
+                    'saves': list(self._manifest.values())
+                }, f)
+                f.truncate()
+            self._manifest_dir_mtime = dir_mtime_ns
+        except OSError as e:
+            # L'index n'est qu'un cache : il sera reconstruit au prochain listage
+            print(f"Erreur lors de l'écriture de l'index des sauvegardes : {e}")
+            self._manifest_dir_mtime = None
         
     def _calculate_checksum(self, data: dict) -> str:
         # Créer une copie du dictionnaire sans les métadonnées
@@ -119,7 +239,9 @@ class SaveManager:
         
     def _rotate_saves(self):
         """Conserve uniquement les N sauvegardes les plus récentes"""
-        saves = sorted(self.save_dir.glob("uno_save_*.json*"))
+        # Par date : le nom d'une sauvegarde nommée ne dit rien de son âge
+        saves = sorted(self._manifest, key=lambda name: (self._manifest[name]['date'], name))
         while len(saves) > self.max_saves:
             oldest_save = saves.pop(0)
-            oldest_save.unlink() 
\ No newline at end of file
+            (self.save_dir / oldest_save).unlink(missing_ok=True)
+            del self._manifest[oldest_save] 
\ No newline at end of file
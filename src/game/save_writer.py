@@ -0,0 +1,82 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+from .save_manager import SaveManager
+
+_STOP = object()
+
+class SaveWriter:
+    """Écrit les sauvegardes sur un thread dédié pour ne jamais bloquer la partie.
+
+    Les états soumis doivent être des instantanés indépendants de la partie
+    (voir GameManager.snapshot_state). La file est bornée ; si plusieurs
+    sauvegardes attendent, seule la plus récente est écrite et toutes les
+    demandes fusionnées reçoivent son résultat.
+    """
+
+    def __init__(self, save_manager: SaveManager, max_pending: int = 8):
+        self.save_manager = save_manager
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="uno-save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, game_state: dict,
+               callback: Optional[Callable[[bool], None]] = None) -> Future:
+        """Met une sauvegarde en file ; le résultat (bool) arrive via le futur ou le callback"""
+        if self._closed:
+            raise RuntimeError("Le thread de sauvegarde est arrêté")
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(lambda f: callback(not f.exception() and f.result()))
+        self._queue.put((game_state, future))
+        return future
+
+    def flush(self):
+        """Attend que toutes les sauvegardes en file soient écrites"""
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = None):
+        """Écrit les sauvegardes en attente puis arrête le thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                self._queue.task_done()
+                return
+            jobs: List[Tuple[dict, Future]] = [job]
+            stop = False
+            # Fusion des sauvegardes consécutives : seule la dernière compte
+            while True:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stop = True
+                    break
+                jobs.append(job)
+            self._write(jobs)
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _write(self, jobs: List[Tuple[dict, Future]]):
+        game_state = jobs[-1][0]
+        try:
+            result = self.save_manager.save_game(game_state)
+        except Exception as e:
+            for _, future in jobs:
+                future.set_exception(e)
+                self._queue.task_done()
+            return
+        for _, future in jobs:
+            future.set_result(result)
+            self._queue.task_done()
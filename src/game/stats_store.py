@@ -0,0 +1,237 @@
+"""Profils, résultats et statistiques des parties dans une base SQLite locale.
+
+Une ligne par partie (table `games`, avec ses game_stats), une ligne par
+joueur et par partie (`results`), et des totaux par profil et difficulté
+(`career`) ou par difficulté (`difficulty_totals`) tenus à jour à chaque
+lot : classements, carrières et moyennes se lisent sans parcourir les
+résultats. Les écritures sont groupées par lots, dans
+une transaction, en mode WAL (plusieurs processus de simulation peuvent
+écrire dans la même base ; les lectures ne sont pas bloquées).
+"""
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from .player import Player
+
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+SCHEMA_VERSION = 1
+# Parties gardées en mémoire avant d'être écrites
+BATCH_SIZE = 500
+
+_STATS = ('cards_played', 'turns_played', 'cards_drawn', 'special_cards_played', 'max_cards_in_hand')
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    is_ai INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    seed INTEGER,
+    winner INTEGER,
+    round_score INTEGER NOT NULL,
+    {", ".join(f"{stat} INTEGER NOT NULL" for stat in _STATS)}
+);
+CREATE TABLE IF NOT EXISTS results (
+    game_id INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    profile_id INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    cards_left INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seat)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS career (
+    profile_id INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (profile_id, difficulty)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS difficulty_totals (
+    difficulty TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    {", ".join(f"{stat} INTEGER NOT NULL" for stat in _STATS)}
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS achievements (
+    profile_id INTEGER NOT NULL,
+    achievement TEXT NOT NULL,
+    unlocked_at REAL NOT NULL,
+    PRIMARY KEY (profile_id, achievement)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS games_by_difficulty ON games (difficulty, played_at);
+CREATE INDEX IF NOT EXISTS results_by_profile ON results (profile_id, game_id);
+CREATE INDEX IF NOT EXISTS career_by_wins ON career (difficulty, wins);
+"""
+
+
+class StatsStore:
+    """Base de statistiques ; record_game met une partie en attente, écrite
+    par lots de `batch_size` (ou par flush/close)"""
+
+    def __init__(self, path: Union[str, Path] = "saves/stats.db", batch_size: int = BATCH_SIZE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        # isolation_level None : les transactions sont ouvertes explicitement (BEGIN IMMEDIATE)
+        self.connection = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._profiles: Dict[str, int] = {}
+        # (partie, [(place, nom, IA, gagné, points, cartes restantes)], (joueur suivi, ses succès))
+        self._pending: List[Tuple[tuple, List[tuple], Tuple[Optional[str], List[str]]]] = []
+        self.games_written = 0
+
+    def record_game(self, game: 'GameManager', winner: Optional[Player], round_score: int = 0):
+        """Met en attente le résultat d'une partie terminée (appelé par GameManager.end_game)"""
+        stats = game.game_stats
+        winner_seat = next((i for i, p in enumerate(game.players) if p is winner), None)
+        row = (time.time(), game.difficulty, game.seed, winner_seat, round_score,
+               *(stats.get(stat, 0) for stat in _STATS))
+        players = [(seat, player.name, player.is_ai, player is winner,
+                    round_score if player is winner else 0, len(player.hand))
+                   for seat, player in enumerate(game.players)]
+        tracked = game.achievements.player
+        achievements = (tracked.name, sorted(game.achievements.unlocked)) if tracked else (None, [])
+        self.record(row, players, achievements)
+
+    def record(self, game: tuple, players: List[tuple],
+               achievements: Tuple[Optional[str], List[str]] = (None, [])):
+        """Forme brute de record_game (import de résultats, benchmarks)"""
+        self._pending.append((game, players, achievements))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Écrit les parties en attente dans une seule transaction"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        db = self.connection
+        now = time.time()
+        db.execute("BEGIN IMMEDIATE")  # verrou d'écriture : identifiants attribués sans conflit
+        try:
+            game_id = db.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()[0]
+            games, results, unlocked = [], [], []
+            career: Dict[Tuple[int, str], List[int]] = defaultdict(lambda: [0, 0, 0])
+            by_difficulty: Dict[str, List[int]] = defaultdict(lambda: [0] * (1 + len(_STATS)))
+            for game, players, (tracked, achievements) in pending:
+                game_id += 1
+                games.append((game_id, *game))
+                difficulty = game[1]
+                totals = by_difficulty[difficulty]
+                totals[0] += 1
+                for i, value in enumerate(game[5:], 1):
+                    totals[i] += value
+                for seat, name, is_ai, won, points, cards_left in players:
+                    profile_id = self._profile_id(name, is_ai, now)
+                    results.append((game_id, seat, profile_id, int(won), points, cards_left))
+                    total = career[(profile_id, difficulty)]
+                    total[0] += 1
+                    total[1] += int(won)
+                    total[2] += points
+                if tracked is not None:
+                    profile_id = self._profile_id(tracked, False, now)
+                    unlocked.extend((profile_id, name, now) for name in achievements)
+            db.executemany(f"INSERT INTO games VALUES ({', '.join('?' * (6 + len(_STATS)))})", games)
+            db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)", results)
+            db.executemany(
+                "INSERT INTO career VALUES (?, ?, ?, ?, ?) ON CONFLICT (profile_id, difficulty) "
+                "DO UPDATE SET games = games + excluded.games, wins = wins + excluded.wins, "
+                "points = points + excluded.points",
+                [(profile_id, difficulty, *total) for (profile_id, difficulty), total in career.items()]
+            )
+            db.executemany(
+                f"INSERT INTO difficulty_totals VALUES ({', '.join('?' * (2 + len(_STATS)))}) "
+                "ON CONFLICT (difficulty) DO UPDATE SET games = games + excluded.games, "
+                + ", ".join(f"{stat} = {stat} + excluded.{stat}" for stat in _STATS),
+                [(difficulty, *totals) for difficulty, totals in by_difficulty.items()]
+            )
+            db.executemany("INSERT OR IGNORE INTO achievements VALUES (?, ?, ?)", unlocked)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            self._profiles.clear()  # identifiants éventuellement annulés
+            raise
+        self.games_written += len(pending)
+
+    def _profile_id(self, name: str, is_ai: bool, now: float) -> int:
+        profile_id = self._profiles.get(name)
+        if profile_id is None:
+            db = self.connection
+            db.execute("INSERT OR IGNORE INTO profiles (name, is_ai, created_at) VALUES (?, ?, ?)",
+                       (name, int(is_ai), now))
+            profile_id = db.execute("SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()[0]
+            self._profiles[name] = profile_id
+        return profile_id
+
+    def leaderboard(self, difficulty: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """Profils classés par victoires (toutes difficultés ou une seule)"""
+        if difficulty is None:
+            query = ("SELECT name, SUM(games), SUM(wins), SUM(points) FROM career "
+                     "JOIN profiles ON profiles.id = profile_id "
+                     "GROUP BY profile_id ORDER BY SUM(wins) DESC LIMIT ?")
+            rows = self.connection.execute(query, (limit,))
+        else:
+            query = ("SELECT name, games, wins, points FROM career "
+                     "JOIN profiles ON profiles.id = profile_id "
+                     "WHERE difficulty = ? ORDER BY wins DESC LIMIT ?")
+            rows = self.connection.execute(query, (difficulty, limit))
+        return [{'name': name, 'games': games, 'wins': wins, 'points': points,
+                 'win_rate': wins / games if games else 0.0}
+                for name, games, wins, points in rows]
+
+    def career(self, name: str) -> Dict[str, dict]:
+        """Parties, victoires et points d'un profil, par difficulté"""
+        rows = self.connection.execute(
+            "SELECT difficulty, games, wins, points FROM career "
+            "JOIN profiles ON profiles.id = profile_id WHERE name = ?", (name,))
+        return {difficulty: {'games': games, 'wins': wins, 'points': points}
+                for difficulty, games, wins, points in rows}
+
+    def recent_games(self, name: str, difficulty: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """Dernières parties d'un profil (place, victoire, cartes restantes et game_stats)"""
+        query = (f"SELECT games.id, played_at, difficulty, seat, won, points, cards_left, "
+                 f"{', '.join(_STATS)} FROM results "
+                 "JOIN games ON games.id = game_id "
+                 "WHERE profile_id = (SELECT id FROM profiles WHERE name = ?)")
+        params: list = [name]
+        if difficulty is not None:
+            query += " AND difficulty = ?"
+            params.append(difficulty)
+        query += " ORDER BY game_id DESC LIMIT ?"
+        params.append(limit)
+        columns = ('game', 'played_at', 'difficulty', 'seat', 'won', 'points', 'cards_left') + _STATS
+        return [dict(zip(columns, row)) for row in self.connection.execute(query, params)]
+
+    def difficulty_summary(self, difficulty: str) -> dict:
+        """Parties jouées à une difficulté et moyennes de leurs game_stats"""
+        row = self.connection.execute(
+            f"SELECT games, {', '.join(_STATS)} FROM difficulty_totals WHERE difficulty = ?",
+            (difficulty,)).fetchone()
+        if row is None:
+            return {'games': 0, **{stat: 0.0 for stat in _STATS}}
+        games = row[0]
+        return {'games': games, **{stat: total / games for stat, total in zip(_STATS, row[1:])}}
+
+    def achievements(self, name: str) -> List[str]:
+        rows = self.connection.execute(
+            "SELECT achievement FROM achievements "
+            "WHERE profile_id = (SELECT id FROM profiles WHERE name = ?) ORDER BY unlocked_at",
+            (name,))
+        return [achievement for achievement, in rows]
+
+    def close(self):
+        self.flush()
+        self.connection.close()
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+import signal
+from .server import DIFFICULTIES, JOIN_TIMEOUT, MAX_TABLES, MOVE_TIMEOUT, GameServer
+
+
+async def serve(args):
+    server = GameServer(args.save_dir, args.difficulty, args.timeout, JOIN_TIMEOUT, args.max_tables)
+    await server.start(args.host, args.port, args.unix)
+    print(f"Serveur UNO à l'écoute sur {args.unix or server.address}")
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(server.shutdown()))
+        except NotImplementedError:  # Windows : Ctrl+C interrompt asyncio.run
+            pass
+    try:
+        await server.wait_closed()
+    finally:
+        await server.shutdown()
+    print("Serveur arrêté, parties en cours sauvegardées")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Serveur de parties UNO (JSON, un message par ligne)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", metavar="CHEMIN", default=None,
+                        help="écoute sur un socket Unix plutôt qu'en TCP")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default="moyen",
+                        help="niveau des IA par défaut")
+    parser.add_argument("--timeout", type=float, default=MOVE_TIMEOUT,
+                        help="secondes laissées au joueur pour chaque coup")
+    parser.add_argument("--max-tables", type=int, default=MAX_TABLES)
+    parser.add_argument("--save-dir", default="saves/tables",
+                        help="sauvegardes des parties interrompues")
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
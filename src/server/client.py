@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Optional
+from ..game.card import Card, Color
+from .protocol import MAX_LINE, decode, encode
+
+
+class TableClient:
+    """Client du serveur de parties (tests, charge)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 7777,
+                      path: Optional[str] = None) -> 'TableClient':
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def send(self, message: dict):
+        self.writer.write(encode(message))
+        await self.writer.drain()
+
+    async def receive(self) -> Optional[dict]:
+        """Message suivant du serveur ; None quand la connexion est fermée"""
+        line = await self.reader.readline()
+        return decode(line) if line else None
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def choose_move(state: dict) -> dict:
+    """Joue la première carte jouable (couleur la plus présente pour une carte noire), sinon pioche"""
+    hand = [Card.from_id(card_id) for card_id in state['hand']]
+    colors = Counter(card.color for card in hand if card.color != Color.BLACK)
+    color = colors.most_common(1)[0][0].value if colors else Color.RED.value
+    if state['playable']:
+        return {'type': 'play', 'card': state['playable'][0], 'color': color}
+    return {'type': 'draw', 'play': True, 'color': color}
+
+
+async def play_game(client: TableClient, difficulty: Optional[str] = None,
+                    save: Optional[str] = None, seed: Optional[int] = None) -> dict:
+    """Rejoint une table et y joue jusqu'à la fin ; renvoie le dernier message du serveur
+    (game_over, saved, error), ou {'type': 'closed'} si la connexion a été fermée"""
+    join = {'type': 'join'}
+    if difficulty is not None:
+        join['difficulty'] = difficulty
+    if save is not None:
+        join['save'] = save
+    if seed is not None:
+        join['seed'] = seed
+    await client.send(join)
+    while True:
+        message = await client.receive()
+        if message is None:
+            return {'type': 'closed'}
+        if message['type'] == 'state':
+            await client.send(choose_move(message))
+        elif message['type'] in ('game_over', 'saved', 'error'):
+            return message
+
+
+async def run_clients(count: int, host: str, port: int, path: Optional[str],
+                      difficulty: Optional[str]) -> Counter:
+    async def one() -> str:
+        client = await TableClient.connect(host, port, path)
+        try:
+            return (await play_game(client, difficulty))['type']
+        finally:
+            await client.close()
+
+    results = await asyncio.gather(*(one() for _ in range(count)), return_exceptions=True)
+    return Counter(r if isinstance(r, str) else type(r).__name__ for r in results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.client",
+        description="Clients automatiques du serveur de parties (test local, charge)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", metavar="CHEMIN", default=None, help="socket Unix du serveur")
+    parser.add_argument("--clients", type=int, default=1, help="parties jouées en parallèle")
+    parser.add_argument("--difficulty", choices=["facile", "moyen", "difficile"], default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = asyncio.run(run_clients(args.clients, args.host, args.port, args.unix,
+                                      args.difficulty))
+    elapsed = time.perf_counter() - start
+    print(f"{args.clients} parties en {elapsed:.2f} s ({args.clients / elapsed:.1f} parties/s)")
+    for result, count in results.most_common():
+        print(f"  {result:12s} {count}")
+
+
+if __name__ == "__main__":
+    main()
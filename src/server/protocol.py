@@ -0,0 +1,63 @@
+"""Protocole du serveur : un objet JSON par ligne, dans les deux sens.
+
+Client -> serveur
+  {"type": "join", "difficulty": "moyen"}        nouvelle table (un humain, trois IA)
+  {"type": "join", "save": "uno_save_....uno"}   reprise d'une table sauvegardée
+  {"type": "play", "card": 2, "color": "rouge"}  carte n°2 de la main (à partir de 0) ;
+                                                 couleur obligatoire pour une carte noire
+  {"type": "draw", "play": true, "color": "vert"} pioche ; jouer la carte piochée si
+                                                 possible (couleur si elle est noire)
+  {"type": "quit"}
+  {"type": "watch", "table": "3"}                suivre une table en spectateur (premier message)
+
+Serveur -> client
+  {"type": "joined", "table": ..., "seat": 0, "seed": ...}
+  {"type": "state", ...}                         voir table.table_state, avant chaque coup
+  {"type": "timeout"}                            coup non reçu à temps : pioche automatique
+  {"type": "error", "message": ...}
+  {"type": "game_over", "winner": ..., "scores": {...}}
+  {"type": "saved", "save": ...}                 table sauvegardée (arrêt du serveur, abandon)
+
+Serveur -> spectateur (voir spectator.SpectatorFeed ; mains cachées)
+  {"type": "snapshot", "seq": ..., ...}          état public de la table
+  {"type": "delta", "seq": ..., "current": 2, "plays": [[place, carte, couleur]],
+   "hands": [[place, cartes]], "draw_pile": 40, "direction": -1}
+  {"type": "end", "seq": ..., "winner": 1, "scores": {...}}
+"""
+import json
+from typing import Optional
+from ..game.card import Color, PLAYABLE_COLORS
+
+# Taille maximale d'une ligne (StreamReader)
+MAX_LINE = 64 * 1024
+
+
+class ProtocolError(ValueError):
+    """Message invalide ; la table répond par un message d'erreur"""
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"JSON invalide : {e}") from None
+    if not isinstance(message, dict) or not isinstance(message.get('type'), str):
+        raise ProtocolError("Message sans type")
+    return message
+
+
+def error(message: str) -> dict:
+    return {'type': 'error', 'message': message}
+
+
+def parse_color(value) -> Optional[Color]:
+    if value is None:
+        return None
+    for color in PLAYABLE_COLORS:
+        if color.value == value:
+            return color
+    raise ProtocolError(f"Couleur inconnue : {value}")
@@ -0,0 +1,197 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from ..game.game_manager import GameManager
+from ..game.save_manager import SaveManager
+from .protocol import MAX_LINE, ProtocolError, decode, encode, error
+from .table import RemoteUI, Table
+
+MOVE_TIMEOUT = 60.0
+JOIN_TIMEOUT = 10.0
+MAX_TABLES = 10000
+MAX_PENDING = 16  # messages reçus en attente par table
+WRITE_BUFFER = 64 * 1024  # au-delà, la table attend que son client lise
+MAX_TABLE_SAVES = 100000
+# La recherche de l'IA experte (0,2 s par coup) bloquerait toutes les tables
+DIFFICULTIES = ("facile", "moyen", "difficile")
+
+
+class GameServer:
+    """Serveur de parties : une table (un humain, trois IA) par connexion,
+    toutes servies par la même boucle asyncio.
+
+    shutdown() ferme les connexions après avoir sauvegardé les parties en
+    cours (SaveManager, un fichier par table, index réécrit une seule fois).
+    """
+
+    def __init__(self, save_dir: str = "saves/tables", difficulty: str = "moyen",
+                 move_timeout: float = MOVE_TIMEOUT, join_timeout: float = JOIN_TIMEOUT,
+                 max_tables: int = MAX_TABLES, max_pending: int = MAX_PENDING,
+                 write_buffer: int = WRITE_BUFFER):
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Difficulté non disponible sur le serveur : {difficulty}")
+        Path(save_dir).mkdir(parents=True, exist_ok=True)
+        self.save_manager = SaveManager(save_dir)
+        self.save_manager.max_saves = MAX_TABLE_SAVES
+        self.difficulty = difficulty
+        self.move_timeout = move_timeout
+        self.join_timeout = join_timeout
+        self.max_tables = max_tables
+        self.max_pending = max_pending
+        self.write_buffer = write_buffer
+        self.started = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.tables: Dict[str, Table] = {}
+        self.spectators: Set[asyncio.StreamWriter] = set()
+        self._next_id = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._save_lock = asyncio.Lock()
+        self._closed = asyncio.Event()  # arrêt demandé
+        self._stopped = asyncio.Event()  # arrêt terminé
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None):
+        """Écoute en TCP, ou sur le socket Unix `path`"""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE)
+        return self
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def wait_closed(self):
+        await self._stopped.wait()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.transport.set_write_buffer_limits(high=self.write_buffer)
+        message = await self._first_message(reader)
+        if message is None or message['type'] not in ('join', 'watch'):
+            writer.write(encode(error("join ou watch attendu")))
+            writer.close()
+            return
+        if message['type'] == 'watch':
+            await self._watch(message, writer)
+            return
+        if len(self.tables) >= self.max_tables or self._closed.is_set():
+            writer.write(encode(error("Serveur complet")))
+            writer.close()
+            return
+        self._next_id += 1
+        table = Table(self, str(self._next_id), reader, writer)
+        self.tables[table.id] = table
+        try:
+            await table.run(message)
+        finally:
+            del self.tables[table.id]
+            if not self._closed.is_set():  # sinon fermée par shutdown(), après la sauvegarde
+                writer.close()
+
+    async def _first_message(self, reader: asyncio.StreamReader) -> Optional[dict]:
+        try:
+            line = await asyncio.wait_for(reader.readline(), self.join_timeout)
+            return decode(line) if line else None
+        except (asyncio.TimeoutError, ValueError, ConnectionError):
+            return None
+
+    async def _watch(self, message: dict, writer: asyncio.StreamWriter):
+        """Envoie au spectateur l'instantané puis les deltas de la table, jusqu'à sa fin"""
+        table = self.tables.get(str(message.get('table')))
+        if table is None or table.game is None or table.finished:
+            writer.write(encode(error("Table introuvable")))
+            writer.close()
+            return
+        wake = asyncio.Event()
+        feed = table.spectate()
+        subscriber = feed.subscribe(wake.set)
+        self.spectators.add(writer)
+        try:
+            while True:
+                await wake.wait()
+                wake.clear()
+                writer.writelines(subscriber.take())
+                # Spectateur lent : sa file déborde, il est resynchronisé puis déconnecté
+                await asyncio.wait_for(writer.drain(), self.move_timeout)
+                if subscriber.closed and not subscriber.queue:
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            feed.unsubscribe(subscriber)
+            self.spectators.discard(writer)
+            writer.close()
+
+    async def create_game(self, message: dict, ui: RemoteUI) -> GameManager:
+        save = message.get('save')
+        if save is None:
+            difficulty = message.get('difficulty', self.difficulty)
+            if difficulty not in DIFFICULTIES:
+                raise ProtocolError(f"Difficulté non disponible : {difficulty}")
+            seed = message.get('seed')
+            if seed is not None and not isinstance(seed, int):
+                raise ProtocolError("Graine invalide")
+            game = GameManager(difficulty, headless=True, seed=seed, ui=ui)
+            game.start_game()
+            return game
+
+        if not isinstance(save, str) or '/' in save or '\\' in save:
+            raise ProtocolError("Nom de sauvegarde invalide")
+        async with self._save_lock:
+            state = await asyncio.to_thread(self.save_manager.load_game, save)
+        if state is None:
+            raise ProtocolError(f"Sauvegarde introuvable : {save}")
+        game = GameManager(state.get('difficulty', 'facile'), headless=True, ui=ui)
+        game.restore_state(state)
+        if game.difficulty not in DIFFICULTIES or all(p.is_ai for p in game.players):
+            raise ProtocolError("Sauvegarde non jouable sur le serveur")
+        return game
+
+    async def save_table(self, table: Table) -> Optional[str]:
+        """Sauvegarde une table abandonnée ; renvoie le nom du fichier"""
+        table.finished = True
+        state = table.game.snapshot_state()
+        async with self._save_lock:
+            saved = await asyncio.to_thread(self.save_manager.save_game, state, table.save_name)
+        if not saved:
+            return None
+        save = self.save_manager.save_path(table.save_name).name
+        await table.send({'type': 'saved', 'save': save})
+        return save
+
+    async def shutdown(self):
+        """Arrêt propre : plus de connexions, parties en cours sauvegardées, clients prévenus"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._server is not None:
+            self._server.close()
+
+        # Les tables ne jouent qu'entre deux attentes : leur état est cohérent
+        tables = list(self.tables.values())
+        pending: List[Tuple[Table, dict]] = []
+        for table in tables:
+            if table.needs_save:
+                table.finished = True
+                pending.append((table, table.game.snapshot_state()))
+        tasks = [table.task for table in tables if table.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        async with self._save_lock:
+            await asyncio.to_thread(
+                self.save_manager.save_games,
+                [(table.save_name, state) for table, state in pending]
+            )
+        for table, _ in pending:
+            save = self.save_manager.save_path(table.save_name)
+            if save.exists() and not table.writer.is_closing():
+                table.writer.write(encode({'type': 'saved', 'save': save.name}))
+        for table in tables:
+            table.writer.close()
+        for writer in list(self.spectators):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+        self._stopped.set()
@@ -0,0 +1,177 @@
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+from ..game.events import CardPlayed, CardsDrawn, GameOver, TurnStarted
+from ..game.game_manager import GameManager
+from ..game.player import Player
+from .protocol import encode
+
+# Messages en attente par spectateur avant resynchronisation
+QUEUE_LIMIT = 64
+# Resynchronisations tolérées avant de déconnecter un spectateur trop lent
+MAX_RESYNCS = 3
+
+
+class Subscriber:
+    """File bornée des messages (déjà encodés) d'un spectateur"""
+    __slots__ = ('queue', 'limit', 'resyncs', 'closed', 'wake')
+
+    def __init__(self, limit: int = QUEUE_LIMIT, wake: Optional[Callable[[], None]] = None):
+        self.queue: Deque[bytes] = deque()
+        self.limit = limit
+        self.resyncs = 0
+        self.closed = False
+        self.wake = wake  # appelé quand des messages arrivent (réveil d'une connexion)
+
+    def push(self, data: bytes) -> bool:
+        """Ajoute un message ; False si la file est pleine"""
+        if len(self.queue) >= self.limit:
+            return False
+        self.queue.append(data)
+        if self.wake is not None:
+            self.wake()
+        return True
+
+    def take(self) -> List[bytes]:
+        messages = list(self.queue)
+        self.queue.clear()
+        return messages
+
+    def close(self):
+        self.closed = True
+        if self.wake is not None:
+            self.wake()
+
+
+class SpectatorFeed:
+    """Diffusion d'une partie à ses spectateurs.
+
+    Chaque spectateur reçoit un instantané, puis un delta par coup : cartes
+    posées (et couleur annoncée), nouvelles tailles de main, joueur suivant,
+    changement de sens. Les mains restent cachées : seules leurs tailles
+    sont publiées. Un delta est encodé une seule fois pour tous les
+    spectateurs ; un spectateur dont la file déborde la voit remplacée par
+    un instantané, puis est déconnecté après MAX_RESYNCS débordements.
+    """
+
+    def __init__(self, game: GameManager, queue_limit: int = QUEUE_LIMIT,
+                 max_resyncs: int = MAX_RESYNCS):
+        self.game = game
+        self.queue_limit = queue_limit
+        self.max_resyncs = max_resyncs
+        self.subscribers: List[Subscriber] = []
+        self.seq = 0
+        self.resyncs = 0
+        self.dropped = 0
+        self._seats: Dict[Player, int] = {player: i for i, player in enumerate(game.players)}
+        self._plays: List[list] = []
+        self._changed: Dict[int, None] = {}  # places dont la main a changé (ordre conservé)
+        self._direction = game.direction
+        self._snapshot: Optional[bytes] = None  # instantané encodé pour `seq`
+        self._subscriptions = [
+            (TurnStarted, self._on_turn_started),
+            (CardPlayed, self._on_card_played),
+            (CardsDrawn, self._on_cards_drawn),
+            (GameOver, self._on_game_over)
+        ]
+        for event_type, handler in self._subscriptions:
+            game.events.subscribe(event_type, handler)
+
+    def snapshot(self) -> dict:
+        game = self.game
+        return {
+            'type': 'snapshot',
+            'seq': self.seq,
+            'turn': game.game_stats['turns_played'],
+            'current': game.current_player_index,
+            'direction': game.direction,
+            'top': game.top_card.id,
+            'declared_color': game.declared_color.value if game.declared_color else None,
+            'draw_pile': len(game.deck.cards),
+            'players': [{'name': p.name, 'cards': len(p.hand)} for p in game.players]
+        }
+
+    def snapshot_bytes(self) -> bytes:
+        if self._snapshot is None:
+            self._snapshot = encode(self.snapshot())
+        return self._snapshot
+
+    def subscribe(self, wake: Optional[Callable[[], None]] = None) -> Subscriber:
+        subscriber = Subscriber(self.queue_limit, wake)
+        subscriber.push(self.snapshot_bytes())
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+
+    def close(self):
+        """Se désabonne de la partie et ferme les files des spectateurs"""
+        self.game.events.disconnect(self._subscriptions)
+        for subscriber in self.subscribers:
+            subscriber.close()
+        self.subscribers = []
+
+    def _on_card_played(self, event: CardPlayed):
+        seat = self._seats[event.player]
+        self._plays.append([seat, event.card.id,
+                            event.color.value if event.color is not None else None])
+        self._changed[seat] = None
+
+    def _on_cards_drawn(self, event: CardsDrawn):
+        self._changed[self._seats[event.player]] = None
+
+    def _on_turn_started(self, event: TurnStarted):
+        self._publish_delta()
+
+    def _on_game_over(self, event: GameOver):
+        self._publish_delta()
+        self.seq += 1
+        self._broadcast(encode({
+            'type': 'end',
+            'seq': self.seq,
+            'winner': self._seats[event.winner],
+            'scores': dict(event.scores)
+        }))
+        self.close()
+
+    def _publish_delta(self):
+        game = self.game
+        if not self._plays and not self._changed and game.direction == self._direction:
+            return
+        self.seq += 1
+        delta = {'type': 'delta', 'seq': self.seq, 'current': game.current_player_index}
+        if self._plays:
+            delta['plays'] = self._plays
+        if self._changed:
+            players = game.players
+            delta['hands'] = [[seat, len(players[seat].hand)] for seat in self._changed]
+            delta['draw_pile'] = len(game.deck.cards)
+        if game.direction != self._direction:
+            delta['direction'] = self._direction = game.direction
+        self._plays = []
+        self._changed = {}
+        self._broadcast(encode(delta))
+
+    def _broadcast(self, data: bytes):
+        self._snapshot = None
+        slow = None
+        for subscriber in self.subscribers:
+            if not subscriber.push(data):
+                if slow is None:
+                    slow = []
+                slow.append(subscriber)
+        if slow:
+            self._resync(slow)
+
+    def _resync(self, subscribers: List[Subscriber]):
+        for subscriber in subscribers:
+            subscriber.queue.clear()
+            subscriber.resyncs += 1
+            if subscriber.resyncs > self.max_resyncs:
+                self.dropped += 1
+                self.subscribers.remove(subscriber)
+                subscriber.close()
+                continue
+            self.resyncs += 1
+            subscriber.push(self.snapshot_bytes())
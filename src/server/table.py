@@ -0,0 +1,246 @@
+import asyncio
+from typing import List, Optional, TYPE_CHECKING
+from ..game.card import Card, Color
+from ..game.events import CardPlayed, CardsDrawn
+from ..game.game_manager import GameManager
+from ..game.player import Player
+from ..ui.backend import UIBackend
+from .protocol import ProtocolError, decode, encode, error, parse_color
+from .spectator import SpectatorFeed
+
+if TYPE_CHECKING:
+    from .server import GameServer
+
+# Coups non reçus à temps d'affilée avant que la table ne soit sauvegardée et fermée
+MAX_TIMEOUTS = 3
+
+
+class Move:
+    """Coup complet d'un joueur distant : carte de la main (None pour piocher),
+    choix de jouer la carte piochée et couleur annoncée"""
+    __slots__ = ('card', 'play_drawn', 'color')
+
+    def __init__(self, card: Optional[int], play_drawn: bool = False, color: Optional[Color] = None):
+        self.card = card
+        self.play_drawn = play_drawn
+        self.color = color
+
+
+def parse_move(message: dict, player: Player, top_card: Card) -> Move:
+    kind = message['type']
+    color = parse_color(message.get('color'))
+    if kind == 'play':
+        index = message.get('card')
+        if not isinstance(index, int) or isinstance(index, bool) \
+                or not 0 <= index < len(player.hand):
+            raise ProtocolError("Numéro de carte invalide")
+        card = player.hand[index]
+        if not card.can_be_played_on(top_card):
+            raise ProtocolError("Cette carte ne peut pas être jouée")
+        if card.color == Color.BLACK and color is None:
+            raise ProtocolError("Couleur à annoncer manquante")
+        return Move(index, color=color)
+    if kind == 'draw':
+        return Move(None, bool(message.get('play', False)), color)
+    raise ProtocolError(f"Message inattendu : {kind}")
+
+
+class RemoteUI(UIBackend):
+    """Interface d'un joueur distant : son coup est connu avant que la partie
+    ne le demande ; les coups joués depuis son dernier tour sont résumés dans `log`"""
+
+    def __init__(self):
+        self.move: Optional[Move] = None
+        self.log: List[dict] = []
+        self._player: Optional[Player] = None
+
+    def get_player_move(self, player: Player, top_card: Card) -> int:
+        self._player = player
+        return self.move.card if self.move.card is not None else -1
+
+    def ask_play_drawn_card(self) -> bool:
+        return self.move.play_drawn
+
+    def get_color_choice(self) -> Color:
+        if self.move.color is not None:
+            return self.move.color
+        # Carte noire piochée puis jouée sans couleur précisée
+        return self._player.hand.most_common_color() or Color.RED
+
+    def on_card_played(self, event: CardPlayed):
+        self.log.append({
+            'event': 'card_played',
+            'player': event.player.name,
+            'card': event.card.id,
+            'color': event.color.value if event.color is not None else None
+        })
+
+    def on_cards_drawn(self, event: CardsDrawn):
+        self.log.append({'event': 'cards_drawn', 'player': event.player.name, 'count': event.count})
+
+    def take_log(self) -> List[dict]:
+        log, self.log = self.log, []
+        return log
+
+
+def table_state(game: GameManager, seat: int) -> dict:
+    """Ce que voit le joueur de la place `seat` (les autres mains sont réduites à leur taille)"""
+    player = game.players[seat]
+    top_card = game.top_card
+    return {
+        'type': 'state',
+        'turn': game.game_stats['turns_played'],
+        'current': game.current_player_index,
+        'direction': game.direction,
+        'top': top_card.id,
+        'declared_color': game.declared_color.value if game.declared_color else None,
+        'hand': [card.id for card in player.hand],
+        'playable': [i for i, card in enumerate(player.hand) if card.can_be_played_on(top_card)],
+        'players': [{'name': p.name, 'cards': len(p.hand)} for p in game.players]
+    }
+
+
+class Table:
+    """Une partie et la connexion de son joueur humain.
+
+    Les tours des IA sont joués sans attendre ; seul le coup du joueur
+    est attendu, avec un délai. Les messages reçus passent par une file
+    bornée : un client qui envoie trop vite cesse d'être lu, et un client
+    qui lit trop lentement ne ralentit que sa table (drain).
+    """
+
+    def __init__(self, server: 'GameServer', table_id: str,
+                 reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.id = table_id
+        self.reader = reader
+        self.writer = writer
+        self.ui = RemoteUI()
+        self.game: Optional[GameManager] = None
+        self.seat = 0
+        self.inbox: asyncio.Queue = asyncio.Queue(maxsize=server.max_pending)
+        self.timeouts = 0
+        self.finished = False  # partie terminée, quittée ou déjà sauvegardée
+        self.task: Optional[asyncio.Task] = None
+        self.feed: Optional[SpectatorFeed] = None
+
+    @property
+    def save_name(self) -> str:
+        return f"table_{self.server.started}_{self.id}"
+
+    @property
+    def needs_save(self) -> bool:
+        return self.game is not None and not self.finished
+
+    async def run(self, join: dict):
+        """Joue la partie demandée par le premier message du client"""
+        self.task = asyncio.current_task()
+        reading = asyncio.create_task(self._read())
+        try:
+            if await self._join(join):
+                await self._play()
+        finally:
+            reading.cancel()
+            if self.feed is not None:
+                self.feed.close()
+
+    def spectate(self) -> SpectatorFeed:
+        """Diffusion de la partie aux spectateurs, créée au premier d'entre eux"""
+        if self.feed is None:
+            self.feed = SpectatorFeed(self.game)
+        return self.feed
+
+    async def send(self, message: dict):
+        if self.writer.is_closing():
+            return
+        try:
+            self.writer.write(encode(message))
+            await self.writer.drain()
+        except ConnectionError:
+            pass  # la lecture signale la déconnexion
+
+    async def _read(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    message = decode(line)
+                except ProtocolError as e:
+                    await self.send(error(str(e)))
+                    continue
+                await self.inbox.put(message)
+        except ValueError:  # ligne plus longue que MAX_LINE
+            await self.send(error("Message trop long"))
+        except ConnectionError:
+            pass
+        await self.inbox.put(None)  # déconnexion
+
+    async def _receive(self, timeout: float) -> Optional[dict]:
+        """Message suivant (None à la déconnexion) ; asyncio.TimeoutError après `timeout` s"""
+        return await asyncio.wait_for(self.inbox.get(), timeout)
+
+    async def _join(self, message: dict) -> bool:
+        try:
+            self.game = await self.server.create_game(message, self.ui)
+        except ProtocolError as e:
+            await self.send(error(str(e)))
+            return False
+        self.seat = next(i for i, player in enumerate(self.game.players) if not player.is_ai)
+        await self.send({'type': 'joined', 'table': self.id, 'seat': self.seat, 'seed': self.game.seed})
+        return True
+
+    async def _play(self):
+        game = self.game
+        while not game.is_game_over():
+            player = game.players[game.current_player_index]
+            if player.is_ai:
+                game.play_turn()
+                continue
+            state = table_state(game, self.seat)
+            state['events'] = self.ui.take_log()
+            state['timeout'] = self.server.move_timeout
+            await self.send(state)
+            move = await self._next_move(player)
+            if move is None:
+                return
+            self.ui.move = move
+            game.play_turn()
+
+        self.finished = True
+        game.end_game()
+        winner = next(i for i, player in enumerate(game.players) if len(player.hand) == 0)
+        await self.send({
+            'type': 'game_over',
+            'winner': winner,
+            'scores': dict(game.scores),
+            'events': self.ui.take_log()
+        })
+
+    async def _next_move(self, player: Player) -> Optional[Move]:
+        """Coup du joueur ; None si la table se ferme (abandon, déconnexion)"""
+        while True:
+            try:
+                message = await self._receive(self.server.move_timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                if self.timeouts >= MAX_TIMEOUTS:
+                    await self.server.save_table(self)
+                    return None
+                await self.send({'type': 'timeout'})
+                return Move(None)
+            if message is None:
+                # Déconnexion : la table est sauvegardée pour être reprise
+                await self.server.save_table(self)
+                return None
+            if message['type'] == 'quit':
+                self.finished = True
+                return None
+            try:
+                move = parse_move(message, player, self.game.top_card)
+            except ProtocolError as e:
+                await self.send(error(str(e)))
+                continue
+            self.timeouts = 0
+            return move
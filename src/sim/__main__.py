@@ -0,0 +1,45 @@
+import argparse
+import os
+from .headless import simulate, format_report, MAX_TURNS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.sim",
+        description="Simulation de parties UNO entre IA, sans interface"
+    )
+    parser.add_argument("--games", type=int, default=1000,
+                        help="nombre de parties à jouer")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus")
+    parser.add_argument("--difficulty", choices=["facile", "moyen", "difficile", "expert"],
+                        default="facile", help="niveau des IA")
+    parser.add_argument("--expert-workers", type=int, default=1,
+                        help="processus de recherche de chaque IA experte")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine de base (une graine par processus)")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS,
+                        help="nombre de tours avant d'abandonner une partie")
+    parser.add_argument("--engine", choices=["objet", "numpy"], default="objet",
+                        help="moteur objet (GameManager) ou vectorisé (NumPy)")
+    parser.add_argument("--profile", metavar="FICHIER", default=None,
+                        help="mesure la durée des phases des tours (rapport JSON)")
+    parser.add_argument("--stats", metavar="BASE", default=None,
+                        help="enregistre les parties dans une base SQLite (StatsStore)")
+    parser.add_argument("--events", metavar="DOSSIER", default=None,
+                        help="journalise les événements des parties (JSONL compressé, voir event_log)")
+    parser.add_argument("--cache", action="store_true",
+                        help="réutilise les décisions des IA (cache LRU par processus)")
+    args = parser.parse_args(argv)
+
+    totals = simulate(args.games, args.workers, args.difficulty, args.seed,
+                      args.max_turns, args.engine, profile=args.profile is not None,
+                      stats_db=args.stats, event_log=args.events,
+                      expert_workers=args.expert_workers, decision_cache=args.cache)
+    print(format_report(totals))
+    if args.profile:
+        totals['profile'].save_report(args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+from typing import Optional
+import numpy as np
+from ..game.card import (Card, Color, CardType, ALL_CARDS, CARD_KINDS,
+                         PLAYABLE_COLORS, WILD_TYPES)
+from ..game.deck import DECK_TEMPLATE
+from ..game.rules import PENALTIES
+
+# Tables précalculées à partir des cartes du moteur objet, indexées par id
+# _PLAYABLE[visible, carte] : la carte (d'un paquet) peut être posée sur la carte visible
+_PLAYABLE = np.array(
+    [[ALL_CARDS[c].can_be_played_on(top) for c in range(CARD_KINDS)] for top in ALL_CARDS],
+    dtype=bool
+)
+# _SAME_COLOR[visible, carte] : même couleur que la carte visible (couleur annoncée comprise)
+_SAME_COLOR = np.array(
+    [[ALL_CARDS[c].color == top.color for c in range(CARD_KINDS)] for top in ALL_CARDS],
+    dtype=bool
+)
+_IS_BLACK = np.array([card.color == Color.BLACK for card in ALL_CARDS[:CARD_KINDS]])
+# Index de couleur (dans PLAYABLE_COLORS) de chaque carte, -1 pour les cartes noires
+_COLOR_INDEX = np.array([
+    PLAYABLE_COLORS.index(card.color) if card.color in PLAYABLE_COLORS else -1
+    for card in ALL_CARDS[:CARD_KINDS]
+])
+_COLOR_ONEHOT = np.zeros((CARD_KINDS, len(PLAYABLE_COLORS)), dtype=np.int16)
+for _card_id, _color_index in enumerate(_COLOR_INDEX):
+    if _color_index >= 0:
+        _COLOR_ONEHOT[_card_id, _color_index] = 1
+# _DECLARED[carte noire, couleur] : id de la variante avec couleur annoncée
+_DECLARED = np.full((CARD_KINDS, len(PLAYABLE_COLORS)), -1, dtype=np.int16)
+for _card_type in WILD_TYPES:
+    for _i, _color in enumerate(PLAYABLE_COLORS):
+        _DECLARED[Card(Color.BLACK, _card_type).id, _i] = Card(_color, _card_type).id
+
+_TYPE_OF = np.array([list(CardType).index(card.card_type) for card in ALL_CARDS[:CARD_KINDS]])
+_SKIP_TYPE = list(CardType).index(CardType.SKIP)
+_REVERSE_TYPE = list(CardType).index(CardType.REVERSE)
+_PENALTY = np.zeros(CARD_KINDS, dtype=np.int8)  # cartes à faire piocher au joueur suivant
+for _card_type, _count in PENALTIES.items():
+    _PENALTY[_TYPE_OF == list(CardType).index(_card_type)] = _count
+
+# Composition d'un paquet complet, en ids
+_DECK_IDS = np.array([card.id for card in DECK_TEMPLATE], dtype=np.int8)
+
+# Stratégies reproduites ; « difficile » compte les cartes (beliefs.CardBeliefs),
+# ce que ce moteur ne fait pas : elle n'est jouée que par le moteur objet
+DIFFICULTIES = ("facile", "moyen")
+
+
+class BatchSimulator:
+    """Moteur vectorisé : N parties IA contre IA jouées en parallèle, pas à pas.
+
+    Chaque pas joue un tour dans toutes les parties encore en cours en
+    appliquant les règles de Rules.apply_card_effect et les stratégies
+    « facile » (première carte jouable) et « moyen » (même couleur d'abord)
+    de GameManager.
+    """
+
+    def __init__(self, games: int, difficulty: str = "facile", players: int = 4,
+                 seed: Optional[int] = None, max_turns: int = 2000):
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Le moteur numpy ne joue pas la difficulté « {difficulty} »")
+        self.games = games
+        self.difficulty = difficulty
+        self.players = players
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+
+        n = games
+        self.hands = np.zeros((n, players, CARD_KINDS), dtype=np.int16)
+        self.hand_sizes = np.zeros((n, players), dtype=np.int16)
+        self.pile = self.rng.permuted(np.tile(_DECK_IDS, (n, 1)), axis=1)
+        self.pile_len = np.full(n, len(_DECK_IDS), dtype=np.int16)
+        self.discard = np.zeros((n, CARD_KINDS), dtype=np.int16)
+        self.top = np.zeros(n, dtype=np.int16)  # id visible (variante si couleur annoncée)
+        self.top_base = np.zeros(n, dtype=np.int16)  # id réel de la carte visible
+        self.direction = np.ones(n, dtype=np.int8)
+        self.current = np.zeros(n, dtype=np.int16)
+        self.active = np.ones(n, dtype=bool)
+        self.turns = np.zeros(n, dtype=np.int32)
+        self.cards_drawn = np.zeros(n, dtype=np.int32)
+        self.winner = np.full(n, -1, dtype=np.int8)
+        self._deal()
+
+    def _deal(self):
+        n = self.games
+        games = np.arange(n)
+        # Distribution depuis le haut du paquet (fin du tableau), joueur par joueur
+        for _ in range(7):
+            for player in range(self.players):
+                self.pile_len -= 1
+                cards = self.pile[games, self.pile_len]
+                self.hands[games, player, cards] += 1
+        self.hand_sizes[:] = 7
+
+        # Première carte : une carte noire repart sous le paquet
+        for g in np.flatnonzero(_IS_BLACK[self.pile[games, self.pile_len - 1]]):
+            length = self.pile_len[g]
+            while _IS_BLACK[self.pile[g, length - 1]]:
+                self.pile[g, :length] = np.roll(self.pile[g, :length], 1)
+        self.pile_len -= 1
+        first = self.pile[games, self.pile_len].astype(np.int16)
+        self.top[:] = first
+        self.top_base[:] = first
+        self.discard[games, first] += 1
+
+    def _reshuffle(self, g: int):
+        # Comme Deck._reshuffle_discard_pile : tout sauf la carte visible repart dans la pioche
+        counts = self.discard[g].copy()
+        counts[self.top_base[g]] -= 1
+        cards = np.repeat(np.arange(CARD_KINDS, dtype=np.int8), counts)
+        self.rng.shuffle(cards)
+        self.pile[g, :len(cards)] = cards
+        self.pile_len[g] = len(cards)
+        self.discard[g] = 0
+        self.discard[g, self.top_base[g]] = 1
+
+    def _draw(self, games: np.ndarray, players: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Fait piocher counts[i] cartes ; renvoie la dernière carte piochée (-1 si aucune)"""
+        last = np.full(len(games), -1, dtype=np.int16)
+        for j in range(int(counts.max(initial=0))):
+            sel = np.flatnonzero(counts > j)
+            g = games[sel]
+            for empty in g[self.pile_len[g] == 0]:
+                self._reshuffle(empty)
+            ok = self.pile_len[g] > 0
+            sel, g = sel[ok], g[ok]
+            p = players[sel]
+            self.pile_len[g] -= 1
+            cards = self.pile[g, self.pile_len[g]]
+            self.hands[g, p, cards] += 1
+            self.hand_sizes[g, p] += 1
+            self.cards_drawn[g] += 1
+            last[sel] = cards
+        return last
+
+    def _choose(self, playable: np.ndarray, top: np.ndarray) -> np.ndarray:
+        choice = np.argmax(playable, axis=1)
+        if self.difficulty == "facile":
+            return choice
+        same = playable & _SAME_COLOR[top]
+        has_same = same.any(axis=1)
+        return np.where(has_same, np.argmax(same, axis=1), choice)
+
+    def step(self):
+        games = np.flatnonzero(self.active)
+        if len(games) == 0:
+            return
+        cur = self.current[games].astype(np.intp)
+        top = self.top[games]
+        hands = self.hands[games, cur]
+        playable = _PLAYABLE[top] & (hands > 0)
+        can_play = playable.any(axis=1)
+        card = np.where(can_play, self._choose(playable, top), -1)
+
+        # Sans carte jouable : piocher une carte et la poser si possible
+        drawers = np.flatnonzero(~can_play)
+        if len(drawers):
+            drawn = self._draw(games[drawers], cur[drawers], np.ones(len(drawers), dtype=np.int8))
+            playable_drawn = (drawn >= 0) & _PLAYABLE[top[drawers], np.maximum(drawn, 0)]
+            card[drawers[playable_drawn]] = drawn[playable_drawn]
+
+        playing = np.flatnonzero(card >= 0)
+        self._play(games[playing], cur[playing], card[playing].astype(np.intp))
+
+        self.turns[games] += 1
+        self.current[games] = (self.current[games] + self.direction[games]) % self.players
+
+        sizes = self.hand_sizes[games]
+        won = (sizes == 0).any(axis=1)
+        self.winner[games[won]] = np.argmax(sizes[won] == 0, axis=1)
+        self.active[games[won]] = False
+        self.active[games[self.turns[games] >= self.max_turns]] = False
+
+    def _play(self, g: np.ndarray, p: np.ndarray, card: np.ndarray):
+        if len(g) == 0:
+            return
+        self.hands[g, p, card] -= 1
+        self.hand_sizes[g, p] -= 1
+        self.discard[g, card] += 1
+        self.top_base[g] = card
+
+        # Couleur annoncée : la couleur la plus présente dans la main (rouge à défaut)
+        wild = _IS_BLACK[card]
+        color = np.argmax(self.hands[g[wild], p[wild]] @ _COLOR_ONEHOT, axis=1)
+        top = card.astype(np.int16)
+        top[wild] = _DECLARED[card[wild], color]
+        self.top[g] = top
+
+        # Effets des cartes (Rules.apply_card_effect)
+        card_type = _TYPE_OF[card]
+        reverse = card_type == _REVERSE_TYPE
+        self.direction[g[reverse]] *= -1
+        skip = card_type == _SKIP_TYPE
+        if self.players == 2:
+            skip |= reverse
+        penalty = _PENALTY[card]
+        victims = np.flatnonzero(penalty > 0)
+        if len(victims):
+            vg = g[victims]
+            victim = (self.current[vg] + self.direction[vg]) % self.players
+            self._draw(vg, victim.astype(np.intp), penalty[victims])
+        skip |= penalty > 0
+        sg = g[skip]
+        self.current[sg] = (self.current[sg] + self.direction[sg]) % self.players
+
+    def run(self) -> dict:
+        while self.active.any():
+            self.step()
+        return {
+            'winner': self.winner,
+            'turns': self.turns,
+            'cards_drawn': self.cards_drawn
+        }
+
+
+def run_vector_batch(games: int, difficulty: str, seed: Optional[int] = None,
+                     max_turns: int = 2000, batch_size: int = 10000) -> dict:
+    """Équivalent vectorisé de headless.run_batch (mêmes totaux)"""
+    rng = np.random.default_rng(seed)
+    totals = {'games': 0, 'turns': 0, 'cards_drawn': 0, 'unfinished': 0, 'wins': [0] * 4}
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        sim = BatchSimulator(size, difficulty, seed=int(rng.integers(2 ** 32)),
+                             max_turns=max_turns)
+        result = sim.run()
+        totals['games'] += size
+        totals['turns'] += int(result['turns'].sum())
+        totals['cards_drawn'] += int(result['cards_drawn'].sum())
+        totals['unfinished'] += int((result['winner'] < 0).sum())
+        for seat, wins in enumerate(np.bincount(result['winner'][result['winner'] >= 0],
+                                                minlength=4)):
+            totals['wins'][seat] += int(wins)
+        remaining -= size
+    return totals
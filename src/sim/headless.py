@@ -0,0 +1,216 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
+from ..game.decision_cache import DecisionCache
+from ..game.event_log import EventLogger
+from ..game.game_manager import GameManager
+from ..game.profiler import PHASE_LABELS, TurnProfiler
+from ..game.stats_store import StatsStore
+
+# Au-delà de ce nombre de tours, une partie est considérée comme bloquée
+MAX_TURNS = 2000
+
+
+def play_headless_game(difficulty: str, max_turns: int = MAX_TURNS,
+                       seed: Optional[int] = None,
+                       profiler: Optional[TurnProfiler] = None,
+                       game: Optional[GameManager] = None) -> dict:
+    """Joue une partie IA contre IA sans interface et renvoie son résumé ;
+    `game` (même difficulté) est réinitialisée plutôt que recréée"""
+    if game is None:
+        game = GameManager(difficulty, headless=True, ai_only=True, seed=seed)
+    else:
+        game.reset(seed)
+    if profiler is not None:
+        profiler.attach(game)
+    game.start_game()
+
+    turns = 0
+    while not game.is_game_over() and turns < max_turns:
+        game.play_turn()
+        turns += 1
+
+    if profiler is not None:
+        profiler.detach()
+
+    winner = None
+    if game.is_game_over():
+        game.end_game()
+        winner = next(i for i, p in enumerate(game.players) if len(p.hand) == 0)
+
+    return {
+        'winner': winner,
+        'turns': turns,
+        'cards_drawn': game.game_stats['cards_drawn'],
+        'seats': len(game.players),
+        'seed': game.seed  # pour rejouer la partie (replay.ReplayRunner)
+    }
+
+
+def run_batch(games: int, difficulty: str, seed: Optional[int] = None,
+              max_turns: int = MAX_TURNS, profile: bool = False,
+              stats_db: Optional[str] = None, event_log: Optional[str] = None,
+              expert_workers: int = 1, decision_cache: bool = False) -> dict:
+    """Joue un lot de parties dans le processus courant et agrège les résultats ;
+    avec `stats_db`, les parties terminées sont enregistrées dans cette base,
+    avec `event_log`, leurs événements sont journalisés dans ce dossier,
+    `expert_workers` processus cherchent les coups de l'IA experte ; avec
+    `decision_cache`, les décisions des IA sont réutilisées d'une partie à l'autre"""
+    rng = random.Random(seed)
+    totals = _empty_totals()
+    profiler = TurnProfiler() if profile else None
+    if profiler is not None:
+        totals['profile'] = profiler
+    game = GameManager(difficulty, headless=True, ai_only=True)
+    game.expert_workers = expert_workers
+    if decision_cache:
+        game.decision_cache = DecisionCache()
+    if stats_db is not None:
+        game.stats_store = StatsStore(stats_db)
+    logger = None
+    if event_log is not None:
+        # Un journal par processus, nommé d'après sa graine
+        logger = EventLogger(event_log, prefix=f"events-{seed}", compress=True)
+        logger.attach(game)
+    try:
+        for _ in range(games):
+            result = play_headless_game(difficulty, max_turns, rng.getrandbits(32), profiler, game)
+            totals['games'] += 1
+            totals['turns'] += result['turns']
+            totals['cards_drawn'] += result['cards_drawn']
+            if result['winner'] is None:
+                totals['unfinished'] += 1
+            else:
+                wins = totals['wins']
+                wins.extend([0] * (result['seats'] - len(wins)))
+                wins[result['winner']] += 1
+    finally:
+        if game.expert_ai is not None:  # dernière partie inachevée
+            game.expert_ai.close()
+        if game.stats_store is not None:
+            game.stats_store.close()
+        if logger is not None:
+            logger.close()
+            totals['events_dropped'] = logger.dropped
+        if game.decision_cache is not None:
+            totals['cache_hits'] = game.decision_cache.hits
+            totals['cache_misses'] = game.decision_cache.misses
+    return totals
+
+
+def simulate(games: int, workers: int = 1, difficulty: str = "facile",
+             seed: Optional[int] = None, max_turns: int = MAX_TURNS,
+             engine: str = "objet", profile: bool = False,
+             stats_db: Optional[str] = None, event_log: Optional[str] = None,
+             expert_workers: int = 1, decision_cache: bool = False) -> dict:
+    """Répartit les parties sur un pool de processus, avec une graine par worker.
+
+    engine : "objet" (GameManager) ou "numpy" (moteur vectorisé de batch.py)
+    profile : mesure la durée des phases des tours (totals['profile'], moteur objet)
+    stats_db : base SQLite où enregistrer les parties (voir StatsStore, moteur objet)
+    event_log : dossier du journal d'événements (voir event_log.EventLogger, moteur objet)
+    expert_workers : processus de recherche de chaque IA experte (moteur objet)
+    decision_cache : décisions des IA en cache, un par processus (DecisionCache, moteur objet)
+    """
+    if engine == "numpy":
+        if profile:
+            raise ValueError("Le moteur numpy ne mesure pas les phases des tours")
+        if stats_db is not None:
+            raise ValueError("Le moteur numpy n'enregistre pas les parties")
+        if event_log is not None:
+            raise ValueError("Le moteur numpy ne journalise pas les événements")
+        if decision_cache:
+            raise ValueError("Le moteur numpy ne met pas de décisions en cache")
+        from .batch import DIFFICULTIES, run_vector_batch
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Le moteur numpy ne joue pas la difficulté « {difficulty} »")
+        runner = run_vector_batch
+    else:
+        runner = partial(run_batch, profile=profile, stats_db=stats_db, event_log=event_log,
+                         expert_workers=expert_workers, decision_cache=decision_cache)
+    workers = max(1, min(workers, games)) if games else 1
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    chunks = _split(games, workers)
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [runner(chunks[0], difficulty, base_seed, max_turns)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(runner, count, difficulty, base_seed + i, max_turns)
+                for i, count in enumerate(chunks)
+            ]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    totals = _empty_totals()
+    for result in results:
+        _merge(totals, result)
+    totals['elapsed'] = elapsed
+    totals['workers'] = workers
+    totals['difficulty'] = difficulty
+    totals['seed'] = base_seed
+    return totals
+
+
+def format_report(totals: dict) -> str:
+    games = totals['games']
+    finished = games - totals['unfinished']
+    elapsed = totals.get('elapsed', 0.0)
+    lines = [
+        f"Parties jouées : {games} "
+        f"({totals.get('workers', 1)} processus, difficulté {totals.get('difficulty')}, "
+        f"graine {totals.get('seed')})",
+        "Victoires par siège :"
+    ]
+    for seat, wins in enumerate(totals['wins']):
+        rate = 100.0 * wins / finished if finished else 0.0
+        lines.append(f"  IA {seat + 1} : {wins:8d} ({rate:5.1f} %)")
+    if totals['unfinished']:
+        lines.append(f"Parties interrompues : {totals['unfinished']}")
+    if games:
+        lines.append(f"Tours moyens : {totals['turns'] / games:.1f}")
+        lines.append(f"Cartes piochées par partie : {totals['cards_drawn'] / games:.1f}")
+    if 'cache_hits' in totals:
+        lookups = totals['cache_hits'] + totals['cache_misses']
+        rate = 100.0 * totals['cache_hits'] / lookups if lookups else 0.0
+        lines.append(f"Décisions lues dans le cache : {totals['cache_hits']} ({rate:.1f} %)")
+    if totals.get('events_dropped'):
+        lines.append(f"Événements non journalisés (file pleine) : {totals['events_dropped']}")
+    if elapsed > 0:
+        lines.append(f"Parties/s : {games / elapsed:.0f}")
+    if 'profile' in totals:
+        lines.append("Durée des phases par tour (µs) :      p50      p95      p99")
+        for phase, timing in totals['profile'].summary().items():
+            lines.append(f"  {PHASE_LABELS.get(phase, phase):30s} {timing['p50_us']:8.1f} "
+                         f"{timing['p95_us']:8.1f} {timing['p99_us']:8.1f}")
+    return "\n".join(lines)
+
+
+def _empty_totals() -> Dict:
+    return {'games': 0, 'turns': 0, 'cards_drawn': 0, 'unfinished': 0, 'wins': []}
+
+
+def _merge(totals: dict, partial: dict):
+    for key in ('games', 'turns', 'cards_drawn', 'unfinished'):
+        totals[key] += partial[key]
+    for key in ('events_dropped', 'cache_hits', 'cache_misses'):
+        if key in partial:
+            totals[key] = totals.get(key, 0) + partial[key]
+    if 'profile' in partial:
+        if 'profile' in totals:
+            totals['profile'].merge(partial['profile'])
+        else:
+            totals['profile'] = partial['profile']
+    wins: List[int] = totals['wins']
+    wins.extend([0] * (len(partial['wins']) - len(wins)))
+    for seat, count in enumerate(partial['wins']):
+        wins[seat] += count
+
+
+def _split(games: int, workers: int) -> List[int]:
+    base, extra = divmod(games, workers)
+    return [base + (1 if i < extra else 0) for i in range(workers)]
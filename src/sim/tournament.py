@@ -0,0 +1,339 @@
+"""Tournoi toutes rondes entre stratégies d'IA, avec classement Elo.
+
+Chaque paire de stratégies joue des parties à quatre places, assises en
+alternance (A B A B puis B A B A) pour annuler l'avantage de la place ;
+la stratégie du gagnant remporte la partie. Les classements viennent du
+modèle de Bradley-Terry (échelle Elo, moyenne 1500), avec des intervalles
+de confiance à 95 % obtenus par rééchantillonnage des parties.
+
+Une stratégie qui lève une exception, joue une carte illégale ou dépasse
+le temps permis pour un coup perd la partie par forfait ; le pool de
+processus continue avec les parties suivantes.
+
+Usage : python -m src.sim.tournament [facile moyen difficile] --games 1000
+        [--workers N] [--module mon_module] [-o classement.json]
+"""
+import argparse
+import importlib
+import itertools
+import json
+import math
+import os
+import random
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..game.ai_strategy import STRATEGIES
+from ..game.game_manager import GameManager
+from .headless import MAX_TURNS
+
+# Temps maximal d'un coup (secondes) avant forfait
+MOVE_TIMEOUT = 1.0
+# Parties d'une paire jouées par tâche du pool
+CHUNK_SIZE = 50
+# Rééchantillonnages pour les intervalles de confiance
+BOOTSTRAP = 200
+ELO_SCALE = 400 / math.log(10)
+
+
+class StrategyTimeout(Exception):
+    """Coup trop long, interrompu par le minuteur du processus"""
+
+
+def _alarm(signum, frame):
+    raise StrategyTimeout()
+
+
+def play_match(strategies: Sequence[str], seed: int, max_turns: int = MAX_TURNS,
+               move_timeout: Optional[float] = MOVE_TIMEOUT,
+               game: Optional[GameManager] = None) -> dict:
+    """Joue une partie, une stratégie par place ; résumé avec la place
+    gagnante (None si la partie n'aboutit pas) ou la place fautive.
+    `game` est réinitialisée plutôt que recréée"""
+    if game is None:
+        game = GameManager(strategies[0], headless=True, ai_only=True, seed=seed)
+    else:
+        game.reset(seed)
+    game.record = None
+    for player, strategy in zip(game.players, strategies):
+        player.strategy = strategy
+    game.start_game()
+
+    # Le minuteur interrompt un coup bloqué ; sans lui (Windows, thread
+    # secondaire), un coup trop long n'est sanctionné qu'une fois joué
+    timer = (move_timeout is not None and hasattr(signal, 'setitimer')
+             and threading.current_thread() is threading.main_thread())
+    if timer:
+        previous = signal.signal(signal.SIGALRM, _alarm)
+    turns = 0
+    fault = None
+    try:
+        while not game.is_game_over() and turns < max_turns:
+            seat = game.current_player_index
+            top_card = game.top_card
+            start = time.perf_counter()
+            try:
+                if timer:
+                    signal.setitimer(signal.ITIMER_REAL, move_timeout)
+                try:
+                    game.play_turn()
+                finally:
+                    if timer:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except StrategyTimeout:
+                fault = (seat, "temps dépassé")
+                break
+            except Exception as e:
+                fault = (seat, f"{type(e).__name__}: {e}")
+                break
+            turns += 1
+            if move_timeout is not None and time.perf_counter() - start > move_timeout:
+                fault = (seat, "temps dépassé")
+                break
+            card = game._turn_move[0]
+            if card is not None and not card.can_be_played_on(top_card):
+                fault = (seat, f"coup illégal : {card}")
+                break
+    finally:
+        if timer:
+            signal.signal(signal.SIGALRM, previous)
+
+    winner = None
+    if fault is None and game.is_game_over():
+        winner = next(i for i, p in enumerate(game.players) if len(p.hand) == 0)
+    return {
+        'winner': winner,
+        'fault': fault,
+        'turns': turns,
+        'seed': seed
+    }
+
+
+def play_pair(first: str, second: str, games: int, seed: int, offset: int = 0,
+              max_turns: int = MAX_TURNS, move_timeout: Optional[float] = MOVE_TIMEOUT) -> dict:
+    """Joue `games` parties entre deux stratégies, places alternées ;
+    renvoie les victoires de chacune, les nuls et les forfaits"""
+    for name in (first, second):
+        if name not in STRATEGIES:  # module non importé dans ce processus (voir --module)
+            raise ValueError(f"Stratégie inconnue : {name}")
+    rng = random.Random(seed)
+    result = {'pair': (first, second), 'games': 0, 'wins': [0, 0], 'draws': 0,
+              'errors': [0, 0], 'messages': [], 'turns': 0}
+    game = GameManager(first, headless=True, ai_only=True)
+    for game_index in range(offset, offset + games):
+        # Parties paires : A B A B ; impaires : B A B A
+        side = game_index % 2
+        seats = [first, second, first, second] if side == 0 else [second, first, second, first]
+        match = play_match(seats, rng.getrandbits(32), max_turns, move_timeout, game)
+        result['games'] += 1
+        result['turns'] += match['turns']
+        if match['fault'] is not None:
+            seat, message = match['fault']
+            loser = (seat + side) % 2
+            result['errors'][loser] += 1
+            result['wins'][1 - loser] += 1
+            if len(result['messages']) < 5:
+                result['messages'].append(f"{result['pair'][loser]} (graine {match['seed']}) : {message}")
+        elif match['winner'] is None:
+            result['draws'] += 1
+        else:
+            result['wins'][(match['winner'] + side) % 2] += 1
+    return result
+
+
+def fit_ratings(names: Sequence[str], results: Dict[Tuple[str, str], List[float]],
+                iterations: int = 200) -> Dict[str, float]:
+    """Classements de Bradley-Terry (algorithme MM) à l'échelle Elo, moyenne 1500.
+
+    results[(a, b)] = [victoires de a, victoires de b] (un nul compte pour
+    moitié) ; une demi-victoire fictive par paire évite les forces nulles.
+    """
+    wins = {name: 0.0 for name in names}
+    games: Dict[Tuple[str, str], float] = {}
+    for (a, b), (wins_a, wins_b) in results.items():
+        wins[a] += wins_a + 0.5
+        wins[b] += wins_b + 0.5
+        games[(a, b)] = wins_a + wins_b + 1.0
+    strength = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        total = {name: 0.0 for name in names}
+        for (a, b), n in games.items():
+            share = n / (strength[a] + strength[b])
+            total[a] += share
+            total[b] += share
+        updated = {name: wins[name] / total[name] if total[name] else 1.0 for name in names}
+        # Normalisation : moyenne géométrique 1
+        scale = math.exp(sum(math.log(v) for v in updated.values()) / len(updated))
+        updated = {name: v / scale for name, v in updated.items()}
+        converged = all(abs(updated[n] - strength[n]) < 1e-9 for n in names)
+        strength = updated
+        if converged:
+            break
+    return {name: 1500 + ELO_SCALE * math.log(strength[name]) for name in names}
+
+
+def confidence_intervals(names: Sequence[str], results: Dict[Tuple[str, str], List[float]],
+                         samples: int = BOOTSTRAP, seed: int = 0) -> Dict[str, Tuple[float, float]]:
+    """Intervalles à 95 % : chaque partie de chaque paire est retirée au sort
+    (loi binomiale) puis les classements sont recalculés. La probabilité de
+    victoire compte la demi-victoire fictive de fit_ratings : une paire gagnée
+    à chaque partie garde un intervalle de largeur non nulle"""
+    uniform = random.Random(seed).random
+    fitted: Dict[str, List[float]] = {name: [] for name in names}
+    for _ in range(samples):
+        resampled = {}
+        for pair, (wins_a, wins_b) in results.items():
+            n = round(wins_a + wins_b)  # parties jouées (un nul : une moitié de chaque côté)
+            p = (wins_a + 0.5) / (wins_a + wins_b + 1.0)
+            drawn = float(sum(1 for _ in range(n) if uniform() < p))
+            resampled[pair] = [drawn, n - drawn]
+        for name, rating in fit_ratings(names, resampled, iterations=100).items():
+            fitted[name].append(rating)
+    intervals = {}
+    for name, ratings in fitted.items():
+        ratings.sort()
+        intervals[name] = (ratings[int(0.025 * (samples - 1))], ratings[int(0.975 * (samples - 1))])
+    return intervals
+
+
+def _import_modules(modules: Sequence[str]):
+    """Importe les modules qui enregistrent des stratégies (aussi dans chaque processus)"""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def run_tournament(strategies: Sequence[str], games: int = 1000, workers: int = 1,
+                   seed: Optional[int] = None, max_turns: int = MAX_TURNS,
+                   move_timeout: Optional[float] = MOVE_TIMEOUT,
+                   modules: Sequence[str] = (), chunk_size: int = CHUNK_SIZE) -> dict:
+    """Joue `games` parties pour chaque paire de stratégies sur un pool de
+    processus et renvoie le classement (voir format_leaderboard)"""
+    _import_modules(modules)
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Stratégie inconnue : {', '.join(unknown)}")
+    if len(set(strategies)) < 2:
+        raise ValueError("Il faut au moins deux stratégies")
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    pairs = list(itertools.combinations(dict.fromkeys(strategies), 2))
+    tasks = []
+    for index, (first, second) in enumerate(pairs):
+        for offset in range(0, games, chunk_size):
+            tasks.append((first, second, min(chunk_size, games - offset),
+                          base_seed + index * games + offset, offset, max_turns, move_timeout))
+
+    start = time.perf_counter()
+    results = []
+    failures = []
+    if workers <= 1:
+        results = [play_pair(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_import_modules,
+                                 initargs=(tuple(modules),)) as pool:
+            futures = {pool.submit(play_pair, *task): task for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:  # processus perdu : les parties de la tâche sont ignorées
+                    first, second, count = futures[future][:3]
+                    failures.append(f"{first} / {second} ({count} parties) : {type(e).__name__}: {e}")
+    elapsed = time.perf_counter() - start
+    return _leaderboard(list(dict.fromkeys(strategies)), results, failures, elapsed, base_seed)
+
+
+def _leaderboard(names: List[str], results: List[dict], failures: List[str],
+                 elapsed: float, seed: int) -> dict:
+    totals = {name: {'games': 0, 'wins': 0.0, 'errors': 0} for name in names}
+    pairs: Dict[Tuple[str, str], List[float]] = {}
+    messages = list(failures)
+    games = turns = 0
+    for result in results:
+        first, second = result['pair']
+        score = pairs.setdefault((first, second), [0.0, 0.0])
+        for i, name in enumerate((first, second)):
+            won = result['wins'][i] + result['draws'] / 2
+            score[i] += won
+            totals[name]['games'] += result['games']
+            totals[name]['wins'] += won
+            totals[name]['errors'] += result['errors'][i]
+        games += result['games']
+        turns += result['turns']
+        messages.extend(result['messages'])
+
+    ratings = fit_ratings(names, pairs)
+    intervals = confidence_intervals(names, pairs, seed=seed)
+    ranking = sorted(names, key=ratings.get, reverse=True)
+    return {
+        'seed': seed,
+        'games': games,
+        'turns': turns,
+        'elapsed': elapsed,
+        'ranking': [{
+            'strategy': name,
+            'elo': round(ratings[name], 1),
+            'ci95': [round(bound, 1) for bound in intervals[name]],
+            'games': totals[name]['games'],
+            'score': totals[name]['wins'] / totals[name]['games'] if totals[name]['games'] else 0.0,
+            'errors': totals[name]['errors']
+        } for name in ranking],
+        'pairs': [{'pair': list(pair), 'score': score} for pair, score in pairs.items()],
+        'errors': messages
+    }
+
+
+def format_leaderboard(board: dict) -> str:
+    lines = [
+        f"Parties jouées : {board['games']} (graine {board['seed']})",
+        "Rang  Stratégie        Elo    IC 95 %          Score   Forfaits"
+    ]
+    for rank, entry in enumerate(board['ranking'], 1):
+        low, high = entry['ci95']
+        lines.append(f"{rank:4d}  {entry['strategy']:14s} {entry['elo']:6.0f}  "
+                     f"[{low:6.0f}, {high:6.0f}]  {100 * entry['score']:5.1f} %  {entry['errors']:8d}")
+    if board['errors']:
+        lines.append("Erreurs :")
+        lines.extend(f"  {message}" for message in board['errors'])
+    if board['elapsed'] > 0:
+        lines.append(f"Parties/s : {board['games'] / board['elapsed']:.0f}")
+    return "\n".join(lines)
+
+
+def save_leaderboard(board: dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(board, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.sim.tournament",
+        description="Tournoi toutes rondes entre stratégies d'IA (classement Elo)"
+    )
+    parser.add_argument("strategies", nargs="*", default=["facile", "moyen", "difficile"],
+                        help="stratégies enregistrées (ai_strategy.STRATEGIES)")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="parties par paire de stratégies")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS,
+                        help="tours avant de déclarer la partie nulle")
+    parser.add_argument("--timeout", type=float, default=MOVE_TIMEOUT,
+                        help="secondes permises par coup avant forfait")
+    parser.add_argument("--module", action="append", default=[],
+                        help="module à importer qui enregistre des stratégies")
+    parser.add_argument("-o", "--output", default="saves/classement.json",
+                        help="classement au format JSON")
+    args = parser.parse_args(argv)
+
+    board = run_tournament(args.strategies, args.games, args.workers, args.seed,
+                           args.max_turns, args.timeout, args.module)
+    print(format_leaderboard(board))
+    save_leaderboard(board, args.output)
+
+
+if __name__ == "__main__":
+    main()
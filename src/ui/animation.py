@@ -0,0 +1,184 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+# Au-delà, les animations les plus anciennes en attente sont abandonnées
+MAX_PENDING = 8
+
+
+class Animation:
+    """Suite d'images (listes de lignes) affichées `frame_time` secondes chacune,
+    la dernière restant visible `hold` secondes de plus"""
+
+    __slots__ = ('frames', 'frame_time', 'hold')
+
+    def __init__(self, frames: List[List[str]], frame_time: float, hold: float = 0.0):
+        if not frames:
+            raise ValueError("Une animation doit comporter au moins une image")
+        self.frames = frames
+        self.frame_time = frame_time
+        self.hold = hold
+
+    @property
+    def duration(self) -> float:
+        return len(self.frames) * self.frame_time + self.hold
+
+
+class AnimationScheduler:
+    """Joue les animations dans un thread dédié.
+
+    play() met l'animation en file et rend la main aussitôt : la logique du
+    jeu n'attend jamais l'affichage. Le temps d'animation avance à
+    `speed` fois le temps réel, multiplié par (1 + animations en attente)
+    quand la file s'allonge ; les images dont l'échéance est passée ne sont
+    pas dessinées (seule la plus récente l'est). skip() termine l'animation
+    en cours sur sa dernière image.
+    """
+
+    def __init__(self, draw: Callable[[List[str]], None], speed: float = 1.0,
+                 max_pending: int = MAX_PENDING, clock: Callable[[], float] = time.monotonic):
+        self.draw = draw
+        self.speed = speed
+        self.clock = clock
+        self.dropped_frames = 0
+        self._queue: Deque[Animation] = deque(maxlen=max_pending)
+        self._condition = threading.Condition()
+        self._skip = threading.Event()
+        self._playing = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def busy(self) -> bool:
+        with self._condition:
+            return self._playing or bool(self._queue)
+
+    def play(self, animation: Animation):
+        with self._condition:
+            if self._closed:
+                return
+            self._queue.append(animation)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="animations", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def skip(self):
+        """Termine l'animation en cours"""
+        self._skip.set()
+
+    def wait_idle(self, key_pressed: Optional[Callable[[], bool]] = None, poll: float = 0.02):
+        """Attend la fin des animations en file ; une touche pressée passe l'animation en cours"""
+        with self._condition:
+            while self._playing or self._queue:
+                self._condition.wait(poll)
+                if key_pressed is not None and key_pressed():
+                    self.skip()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+        self._skip.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._playing = False
+                    self._condition.notify_all()
+                    self._condition.wait()
+                if self._closed:
+                    self._playing = False
+                    self._condition.notify_all()
+                    return
+                animation = self._queue.popleft()
+                self._playing = True
+                self._skip.clear()
+            try:
+                self._play(animation)
+            except Exception:
+                # Un affichage défaillant ne doit pas bloquer wait_idle()
+                pass
+
+    def _rate(self) -> float:
+        return self.speed * (1 + len(self._queue))
+
+    def _play(self, animation: Animation):
+        frames = animation.frames
+        last = len(frames) - 1
+        frame_time = animation.frame_time
+        duration = animation.duration
+        progress = 0.0  # temps d'animation écoulé
+        shown = -1
+        previous = self.clock()
+        while True:
+            index = min(int(progress / frame_time), last) if frame_time > 0 else last
+            if index != shown:
+                self.dropped_frames += max(0, index - shown - 1)
+                self.draw(frames[index])
+                shown = index
+            if progress >= duration:
+                return
+            due = (index + 1) * frame_time if index < last else duration
+            if self._skip.wait(max(0.0, due - progress) / self._rate()):
+                if shown != last:
+                    self.draw(frames[last])
+                return
+            now = self.clock()
+            progress += (now - previous) * self._rate()
+            previous = now
+
+
+class KeyListener:
+    """Détection non bloquante d'une touche pressée (terminal en mode caractère)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._saved = None
+
+    def __enter__(self) -> 'KeyListener':
+        if self._is_posix_tty():
+            import termios
+            import tty
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def pressed(self) -> bool:
+        if sys.platform == 'win32':
+            import msvcrt
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            return False
+        if self._saved is None:
+            return False
+        import select
+        ready, _, _ = select.select([self.stream], [], [], 0)
+        if ready:
+            os.read(self.stream.fileno(), 1)
+            return True
+        return False
+
+    def _is_posix_tty(self) -> bool:
+        if sys.platform == 'win32':
+            return False
+        try:
+            return self.stream.isatty()
+        except (AttributeError, ValueError):
+            return False
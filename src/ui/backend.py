@@ -0,0 +1,32 @@
+from ..game.card import Card, Color
+from ..game.player import Player
+from typing import List, Dict, Optional
+
+
+class UIBackend:
+    """Interface d'une partie.
+
+    L'affichage passe par les événements du moteur (game.events) : une
+    interface définit les méthodes on_<événement> qui l'intéressent
+    (on_turn_started, on_card_played, ...) et GameManager les abonne quand
+    elle devient game.ui. Les méthodes ci-dessous sont appelées directement,
+    parce que le moteur attend une réponse ou qu'il s'agit de messages.
+    """
+
+    def get_player_move(self, player: Player, top_card: Card) -> int:
+        raise RuntimeError("Aucun joueur humain ne peut jouer sans interface")
+
+    def get_color_choice(self) -> Color:
+        raise RuntimeError("Aucun joueur humain ne peut jouer sans interface")
+
+    def ask_play_drawn_card(self) -> bool:
+        raise RuntimeError("Aucun joueur humain ne peut jouer sans interface")
+
+    def display_statistics(self, game_stats: dict, timings: Optional[Dict[str, dict]] = None):
+        pass
+
+    def show_message(self, message: str, error: bool = False):
+        pass
+
+    def display_save_list(self, saves: List[Dict[str, str]]) -> Optional[str]:
+        return None
@@ -1,17 +1,21 @@
-import os
-import time
-import sys
 import random
+import threading
 from colorama import init, Fore, Back, Style
 from ..game.card import Card, Color, CardType
 from ..game.player import Player
+from ..game.profiler import PHASE_LABELS
+from ..game.events import (GameStarted, TurnStarted, CardPlayed, CardsDrawn,
+                           AchievementUnlocked, GameOver)
+from .animation import Animation, AnimationScheduler, KeyListener
+from .backend import UIBackend
+from .renderer import FrameRenderer, build_card_strings
 from typing import TYPE_CHECKING, List, Dict, Optional
 from datetime import datetime
 
 if TYPE_CHECKING:
     from ..game.game_manager import GameManager
 
-class ConsoleUI:
+class ConsoleUI(UIBackend):
     def __init__(self):
         init()  # Initialisation de colorama
         self.color_map = {
@@ -23,9 +27,46 @@ class ConsoleUI:
         }
         self.animation_enabled = False
         self.animation_speed = 0.05
+        self.renderer = FrameRenderer()
+        self._card_strings = build_card_strings(self.color_map)
+        # Les animations sont dessinées sous le plateau par leur propre thread
+        self.animations = AnimationScheduler(self._draw_overlay)
+        self._output_lock = threading.RLock()
+        self._board: List[str] = []
+        self._overlay: List[str] = []
+        self._turn: Optional[TurnStarted] = None  # tour en cours
+
+    # Événements de la partie (abonnés par GameManager)
+
+    def on_game_started(self, event: GameStarted):
+        self.animate_shuffle()
+
+    def on_turn_started(self, event: TurnStarted):
+        self._turn = event
+        self.display_game_state(event.player, event.top_card, event.game)
+
+    def on_card_played(self, event: CardPlayed):
+        self.animate_card_play(event.card)
+        if event.cards_left == 1:
+            self.animate_uno_call(event.player.name)
+        if event.card.card_type != CardType.NUMBER:
+            self.animate_card_effect(event.card.card_type)
+
+    def on_cards_drawn(self, event: CardsDrawn):
+        # Le joueur humain voit la carte qu'il vient de piocher
+        turn = self._turn
+        if turn is not None and event.player is turn.player and not event.player.is_ai:
+            self.display_game_state(event.player, turn.game.top_card, turn.game)
+
+    def on_achievement_unlocked(self, event: AchievementUnlocked):
+        self.display_achievement(event.name)
+
+    def on_game_over(self, event: GameOver):
+        self.animate_win(event.winner.name)
+        self.announce_winner(event.winner, event.round_score, event.scores)
 
     def _clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
 
     def _hide_cursor(self):
         print('\033[?25l', end='')
@@ -34,43 +75,48 @@ class ConsoleUI:
         print('\033[?25h', end='')
 
     def _format_card(self, card: Card) -> str:
-        color = self.color_map[card.color]
-        if card.card_type == CardType.NUMBER:
-            return f"{color}[{card.color.value} {card.value}]{Style.RESET_ALL}"
-        return f"{color}[{card.color.value} {card.card_type.value}]{Style.RESET_ALL}"
+        return self._card_strings[card.id]
 
     def display_game_state(self, current_player: Player, top_card: Card, game_manager: 'GameManager'):
-        self._clear_screen()
-        
         # Bannière décorative
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{' '*25}UNO GAME{' '*25}")
-        print(f"{'='*60}{Style.RESET_ALL}\n")
+        lines = [
+            "",
+            f"{Fore.CYAN}{'='*60}",
+            f"{' '*25}UNO GAME{' '*25}",
+            f"{'='*60}{Style.RESET_ALL}",
+            "",
+            f"{Fore.YELLOW}État des joueurs:{Style.RESET_ALL}"
+        ]
 
         # Informations sur les autres joueurs
-        print(f"{Fore.YELLOW}État des joueurs:{Style.RESET_ALL}")
         for player in game_manager.players:
-            cards_count = len(player.hand)
-            if player == current_player:
-                print(f"> {player.name}: {cards_count} cartes")
-            else:
-                print(f"  {player.name}: {cards_count} cartes")
+            marker = ">" if player == current_player else " "
+            lines.append(f"{marker} {player.name}: {len(player.hand)} cartes")
 
         # Carte visible
-        print(f"\n{Fore.CYAN}Carte visible :{Style.RESET_ALL}")
-        print(f"╔════════════╗")
-        print(f"║ {self._format_card(top_card)} ║")
-        print(f"╚════════════╝")
+        lines.extend((
+            "",
+            f"{Fore.CYAN}Carte visible :{Style.RESET_ALL}",
+            "╔════════════╗",
+            f"║ {self._format_card(top_card)} ║",
+            "╚════════════╝"
+        ))
 
         # Main du joueur actuel
         if not current_player.is_ai:
-            print(f"\n{Fore.GREEN}Vos cartes :{Style.RESET_ALL}")
-            print("╔════════════╗")
+            lines.extend(("", f"{Fore.GREEN}Vos cartes :{Style.RESET_ALL}", "╔════════════╗"))
             for i, card in enumerate(current_player.hand):
-                print(f"║ {i+1}. {self._format_card(card)} ║")
-            print("╚════════════╝")
+                lines.append(f"║ {i+1}. {self._format_card(card)} ║")
+            lines.append("╚════════════╝")
+
+        # Une seule écriture, limitée aux lignes modifiées depuis l'affichage précédent
+        with self._output_lock:
+            self._board = lines
+            self.renderer.render(lines + self._overlay)
 
     def get_player_move(self, player: Player, top_card: Card) -> int:
+        # La saisie peut faire défiler l'écran : prochaine image complète
+        self._sync()
         print(f"\n{Fore.CYAN}Actions disponibles:{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}0.{Style.RESET_ALL} Piocher une carte")
         print(f"{Fore.YELLOW}1-{len(player.hand)}.{Style.RESET_ALL} Jouer une carte")
@@ -100,6 +146,7 @@ class ConsoleUI:
                 print(f"{Fore.RED}❌ Entrée invalide !{Style.RESET_ALL}")
 
     def get_color_choice(self) -> Color:
+        self._sync()
         colors = {
             "1": Color.RED,
             "2": Color.BLUE,
@@ -120,6 +167,7 @@ class ConsoleUI:
             print(f"{Fore.RED}❌ Choix invalide !{Style.RESET_ALL}")
 
     def ask_play_drawn_card(self) -> bool:
+        self._sync()
         while True:
             choice = input(f"\n{Fore.CYAN}Voulez-vous jouer la carte piochée ? (o/n) :{Style.RESET_ALL} ")
             if choice.lower() in ['o', 'n']:
@@ -127,6 +175,7 @@ class ConsoleUI:
             print(f"{Fore.RED}❌ Réponse invalide, veuillez répondre par 'o' ou 'n'{Style.RESET_ALL}")
 
     def announce_winner(self, winner: Player, round_score: int, total_scores: dict):
+        self._sync()
         print(f"\n{Fore.YELLOW}{'='*60}")
         print(f"{' '*20}🎉 FIN DE LA PARTIE 🎉")
         print(f"\n{Fore.GREEN}Le gagnant est : {winner.name} !{Style.RESET_ALL}")
@@ -141,20 +190,31 @@ class ConsoleUI:
     def display_winner(self, player: Player):
         self.announce_winner(player)
 
-    def display_statistics(self, game_stats: dict):
+    def display_statistics(self, game_stats: dict, timings: Optional[Dict[str, dict]] = None):
+        self._sync()
         print(f"\n{Fore.CYAN}📊 Statistiques de la partie :{Style.RESET_ALL}")
         print("╔════════════════════════════════╗")
         print(f"║ Cartes jouées : {game_stats['cards_played']:14d} ║")
         print(f"║ Tours joués   : {game_stats['turns_played']:14d} ║")
         print(f"║ Cartes piochées : {game_stats['cards_drawn']:11d} ║")
         print("╚════════════════════════════════╝")
+        if not timings:
+            return
+        print(f"\n{Fore.CYAN}⏱  Durée des tours (ms) :{Style.RESET_ALL}")
+        print(f"{'Phase':16s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'n':>6s}")
+        for phase, timing in timings.items():
+            print(f"{PHASE_LABELS.get(phase, phase):16s} {timing['p50_us'] / 1000:9.3f} "
+                  f"{timing['p95_us'] / 1000:9.3f} {timing['p99_us'] / 1000:9.3f} "
+                  f"{timing['count']:6d}")
 
     def show_message(self, message: str, error: bool = False):
         """Affiche un message à l'utilisateur"""
+        self._sync()
         color = '\033[91m' if error else '\033[92m'  # Rouge pour erreur, vert pour succès
         print(f"{color}{message}\033[0m")
 
     def show_saves(self, saves: list):
+        self._sync()
         print(f"\n{Fore.CYAN}Sauvegardes disponibles :{Style.RESET_ALL}")
         print("╔════════════════════════════════╗")
         for i, save in enumerate(saves, 1):
@@ -180,12 +240,7 @@ class ConsoleUI:
             return -2  # Code spécial pour la sauvegarde
             
         elif command == "!stats":
-            self.display_statistics({
-                'cards_played': 0,  # À remplacer par les vraies stats
-                'turns_played': 0,
-                'cards_drawn': 0
-            })
-            return -3  # Continue le tour
+            return -5  # Statistiques : affichées par GameManager, qui les connaît
             
         elif command == "!help":
             self._display_help()
@@ -217,12 +272,33 @@ class ConsoleUI:
             if choice.lower() == 'n':
                 return False
 
+    def _queue_animation(self, frames: List[List[str]], frame_time: float, hold: float = 0.0):
+        # Retour immédiat : le thread d'animation dessine sous le plateau
+        if not self.animations.busy:
+            self._hide_cursor()
+        self.animations.play(Animation(frames, frame_time, hold))
+
+    def _draw_overlay(self, lines: List[str]):
+        with self._output_lock:
+            self._overlay = lines
+            self.renderer.render(self._board + lines)
+
+    def _sync(self):
+        """Termine les animations en file (une touche passe la courante) avant d'écrire sous l'image"""
+        if self.animations.busy:
+            with KeyListener() as keys:
+                self.animations.wait_idle(keys.pressed)
+            self._show_cursor()
+        with self._output_lock:
+            self._overlay = []
+            self.renderer.invalidate()
+
     def animate_card_play(self, card: Card):
         if not self.animation_enabled:
             return
             
         card_str = self._format_card(card)
-        frames = [
+        box = [
             f"┌─────────┐",
             f"│{' ' * 9}│",
             f"│   {card_str}   │",
@@ -232,34 +308,21 @@ class ConsoleUI:
         
         # Animation de la carte qui "tombe"
         height = 10
-        for i in range(height):
-            self._clear_screen()
-            print('\n' * (height - i))
-            for frame in frames:
-                print(frame)
-            time.sleep(self.animation_speed)
+        self._queue_animation([[""] * (height - i + 1) + box for i in range(height)],
+                              self.animation_speed)
             
     def animate_shuffle(self):
         if not self.animation_enabled:
             return
             
-        self._hide_cursor()
         cards = ["🂠", "🂡", "🂢", "🂣", "🂤", "🂥", "🂦"]
         width = 20
         
+        frames = []
         for _ in range(3):  # 3 animations de mélange
             for i in range(width):
-                sys.stdout.write("\r" + " " * width)
-                sys.stdout.write("\r")
-                for j in range(width):
-                    if j == i:
-                        sys.stdout.write(random.choice(cards))
-                    else:
-                        sys.stdout.write(" ")
-                sys.stdout.flush()
-                time.sleep(self.animation_speed)
-        print("\n")
-        self._show_cursor()
+                frames.append([" " * i + random.choice(cards) + " " * (width - i - 1)])
+        self._queue_animation(frames, self.animation_speed)
         
     def animate_uno_call(self, player_name: str):
         if not self.animation_enabled:
@@ -268,16 +331,9 @@ class ConsoleUI:
         colors = [Fore.RED, Fore.YELLOW, Fore.GREEN, Fore.BLUE]
         uno_text = "UNO!"
         
-        self._hide_cursor()
-        for _ in range(5):
-            for color in colors:
-                sys.stdout.write("\r" + " " * 40)
-                sys.stdout.write("\r")
-                sys.stdout.write(f"{color}{player_name} dit {uno_text}!{Style.RESET_ALL}")
-                sys.stdout.flush()
-                time.sleep(0.2)
-        print("\n")
-        self._show_cursor()
+        frames = [[f"{color}{player_name} dit {uno_text}!{Style.RESET_ALL}"]
+                  for _ in range(5) for color in colors]
+        self._queue_animation(frames, 0.2)
         
     def animate_win(self, winner_name: str):
         if not self.animation_enabled:
@@ -296,30 +352,17 @@ class ConsoleUI:
             "     '-------'     "
         ]
         
-        self._hide_cursor()
-        for i in range(len(trophy)):
-            self._clear_screen()
-            for j in range(i + 1):
-                print(Fore.YELLOW + trophy[j] + Style.RESET_ALL)
-            time.sleep(self.animation_speed)
-            
-        print(f"\n{Fore.GREEN}🎉 {winner_name} a gagné ! 🎉{Style.RESET_ALL}")
-        self._show_cursor()
+        frames = [[Fore.YELLOW + line + Style.RESET_ALL for line in trophy[:i + 1]]
+                  for i in range(len(trophy))]
+        frames[-1] = frames[-1] + ["", f"{Fore.GREEN}🎉 {winner_name} a gagné ! 🎉{Style.RESET_ALL}"]
+        self._queue_animation(frames, self.animation_speed)
         
     def animate_draw_cards(self, count: int):
         if not self.animation_enabled:
             return
             
-        self._hide_cursor()
-        for i in range(count):
-            sys.stdout.write("\r" + " " * 40)
-            sys.stdout.write("\r")
-            cards_drawn = "🂠 " * (i + 1)
-            sys.stdout.write(f"Pioche de cartes: {cards_drawn}")
-            sys.stdout.flush()
-            time.sleep(self.animation_speed)
-        print("\n")
-        self._show_cursor()
+        frames = [[f"Pioche de cartes: {'🂠 ' * (i + 1)}"] for i in range(count)]
+        self._queue_animation(frames, self.animation_speed)
         
     def animate_card_effect(self, card_type: CardType):
         if not self.animation_enabled:
@@ -337,18 +380,11 @@ class ConsoleUI:
         if not effect:
             return
             
-        self._hide_cursor()
-        for _ in range(3):  # 3 pulsations
-            for size in range(1, 4):
-                sys.stdout.write("\r" + " " * 20)
-                sys.stdout.write("\r")
-                sys.stdout.write(effect * size)
-                sys.stdout.flush()
-                time.sleep(self.animation_speed)
-        print("\n")
-        self._show_cursor()
+        frames = [[effect * size] for _ in range(3) for size in range(1, 4)]  # 3 pulsations
+        self._queue_animation(frames, self.animation_speed)
         
     def toggle_animations(self):
+        self._sync()
         self.animation_enabled = not self.animation_enabled
         status = "activées" if self.animation_enabled else "désactivées"
         print(f"\nAnimations {status}")
@@ -359,18 +395,23 @@ class ConsoleUI:
             'first_win': "🏆 Premier Succès - Première victoire !",
             'perfect_game': "✨ Partie Parfaite - Gagner sans piocher !",
             'comeback': "🔄 Retour Victorieux - Gagner après avoir eu 10+ cartes !",
-            'special_master': "🎯 Maître des Cartes Spéciales - Utiliser 5+ cartes spéciales !"
+            'special_master': "🎯 Maître des Cartes Spéciales - Utiliser 5+ cartes spéciales !",
+            'veteran': "🎖 Vétéran - Gagner 10 parties !"
         }
         
         message = achievement_messages.get(achievement_name)
         if message:
-            print(f"\n{Fore.YELLOW}=== SUCCÈS DÉBLOQUÉ ! ==={Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{message}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}======================{Style.RESET_ALL}\n")
-            time.sleep(2)  # Pause pour que le joueur puisse lire le message
+            # Reste affiché 2 s pour que le joueur puisse lire le message, sans bloquer la partie
+            self._queue_animation([[
+                "",
+                f"{Fore.YELLOW}=== SUCCÈS DÉBLOQUÉ ! ==={Style.RESET_ALL}",
+                f"{Fore.GREEN}{message}{Style.RESET_ALL}",
+                f"{Fore.YELLOW}======================{Style.RESET_ALL}"
+            ]], 0.0, hold=2.0)
 
     def display_save_list(self, saves: List[Dict[str, str]]) -> Optional[str]:
         """Affiche la liste des sauvegardes et permet à l'utilisateur d'en sélectionner une"""
+        self._sync()
         if not saves:
             self.show_message("Aucune sauvegarde disponible")
             return None
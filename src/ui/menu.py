@@ -10,8 +10,9 @@ class Menu:
             print("1. Facile")
             print("2. Moyen")
             print("3. Difficile")
+            print("4. Expert")
             
-            choice = input("Choisissez la difficulté (1-3): ")
+            choice = input("Choisissez la difficulté (1-4): ")
             
             if choice == "1":
                 return "facile"
@@ -19,6 +20,8 @@ class Menu:
                 return "moyen"
             elif choice == "3":
                 return "difficile"
+            elif choice == "4":
+                return "expert"
             else:
                 print("Choix invalide. Veuillez réessayer.")
 
@@ -33,3 +36,15 @@ class Menu:
                 return False
             else:
                 print("Choix invalide. Veuillez répondre par 'o' ou 'n'.")
+
+    def ask_resume_game(self) -> bool:
+        while True:
+            print("\n=== UNO - Reprendre une partie ===")
+            choice = input("Une partie n'est pas terminée. Voulez-vous la reprendre ? (o/n): ")
+            
+            if choice.lower() == 'o':
+                return True
+            elif choice.lower() == 'n':
+                return False
+            else:
+                print("Choix invalide. Veuillez répondre par 'o' ou 'n'.")
@@ -0,0 +1,10 @@
+from .backend import UIBackend
+
+class NullUI(UIBackend):
+    """Interface vide pour les parties sans affichage (simulations IA contre IA).
+
+    Elle ne s'abonne à aucun événement : le moteur n'en construit aucun.
+    """
+
+    def __init__(self):
+        self.animation_enabled = False
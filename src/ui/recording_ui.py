@@ -0,0 +1,24 @@
+from typing import List, Type
+from ..game.events import GameEvent
+from .backend import UIBackend
+
+class RecordingUI(UIBackend):
+    """Interface qui conserve les événements reçus (tests, outils d'analyse)"""
+
+    def __init__(self):
+        self.animation_enabled = False
+        self.events: List[GameEvent] = []
+
+    def record(self, event: GameEvent):
+        self.events.append(event)
+
+    on_game_started = on_turn_started = on_card_played = record
+    on_cards_drawn = on_deck_reshuffled = on_card_effect = record
+    on_achievement_unlocked = on_game_over = record
+
+    def of_type(self, event_type: Type[GameEvent]) -> List[GameEvent]:
+        return [event for event in self.events if type(event) is event_type]
+
+    def clear(self):
+        self.events.clear()
+
@@ -0,0 +1,74 @@
+import shutil
+import sys
+from typing import Dict, List, Optional, TextIO, Tuple
+from colorama import Style
+from ..game.card import Card, Color, CardType, ALL_CARDS
+
+CSI = "\033["
+HOME = CSI + "H"
+CLEAR_SCREEN = HOME + CSI + "2J"
+ERASE_LINE_END = CSI + "K"
+ERASE_BELOW = CSI + "J"
+
+
+def move_to(row: int) -> str:
+    """Curseur au début de la ligne `row` (0 = première ligne de l'écran)"""
+    return f"{CSI}{row + 1};1H"
+
+
+def format_card(card: Card, color_code: str) -> str:
+    if card.card_type == CardType.NUMBER:
+        return f"{color_code}[{card.color.value} {card.value}]{Style.RESET_ALL}"
+    return f"{color_code}[{card.color.value} {card.card_type.value}]{Style.RESET_ALL}"
+
+
+def build_card_strings(color_map: Dict[Color, str]) -> Tuple[str, ...]:
+    """Texte coloré de chaque carte (variantes à couleur annoncée comprises), indexé par id"""
+    return tuple(format_card(card, color_map[card.color]) for card in ALL_CARDS)
+
+
+class FrameRenderer:
+    """Affichage console par images complètes, sans effacer l'écran.
+
+    Chaque image est une liste de lignes. Seules les lignes qui diffèrent
+    de l'image précédente sont réécrites (positionnement ANSI, effacement
+    de fin de ligne), puis tout ce qui suit l'image est effacé ; le tout
+    part en un seul write. Après une sortie qui a pu faire défiler l'écran
+    (saisie, longs messages), invalidate() force une image complète.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream  # sys.stdout par défaut, lu à chaque image
+        self._previous: Optional[List[str]] = None
+
+    def render(self, lines: List[str]):
+        previous = self._previous
+        if previous is None or len(lines) >= self._rows():
+            parts = [HOME]
+            parts.extend(line + ERASE_LINE_END + "\n" for line in lines)
+            parts.append(ERASE_BELOW)
+        else:
+            parts = [
+                move_to(row) + line + ERASE_LINE_END
+                for row, line in enumerate(lines)
+                if row >= len(previous) or previous[row] != line
+            ]
+            parts.append(move_to(len(lines)) + ERASE_BELOW)
+        stream = self.stream or sys.stdout
+        stream.write("".join(parts))
+        stream.flush()
+        self._previous = list(lines)
+
+    def clear(self):
+        stream = self.stream or sys.stdout
+        stream.write(CLEAR_SCREEN)
+        stream.flush()
+        self._previous = None
+
+    def invalidate(self):
+        self._previous = None
+
+    @staticmethod
+    def _rows() -> int:
+        # Une image plus haute que le terminal le fait défiler : pas de mise à jour partielle
+        return shutil.get_terminal_size().lines
@@ -1,110 +1,119 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock, patch
-from src.game.achievements import Achievements
+from src.game.achievements import Achievements, AchievementRule
+from src.game.events import (EventStream, GameStarted, CardPlayed, CardsDrawn, GameOver,
+                             AchievementUnlocked)
 from src.game.game_manager import GameManager
-from src.ui.console_ui import ConsoleUI
+from src.ui.recording_ui import RecordingUI
 from src.game.card import Card, Color, CardType
 from src.game.player import Player
 
+SKIP = Card(Color.RED, CardType.SKIP)
+THREE = Card(Color.RED, CardType.NUMBER, 3)
+
 class TestAchievements(unittest.TestCase):
     def setUp(self):
-        self.game = GameManager("facile")
-        # Créer un mock plus complet pour ConsoleUI
-        self.ui_mock = Mock(spec=ConsoleUI)
-        self.ui_mock.display_achievement = Mock()
-        self.game.ui = self.ui_mock
-        
-        # Initialiser les achievements
-        self.achievements = self.game.achievements
-        
-        # Créer un joueur de test avec des cartes
-        self.test_player = Player("Test Player")
-        self.test_player.hand = [
-            Card(Color.RED, CardType.NUMBER, 1),
-            Card(Color.BLUE, CardType.SKIP)
-        ]
-        self.game.players[0] = self.test_player
-        
-    def tearDown(self):
-        # Réinitialiser les achievements après chaque test
-        self.achievements.unlocked.clear()
-        
+        self.events = EventStream()
+        self.ui = RecordingUI()
+        self.events.connect(self.ui)
+        self.player = Player("Joueur")
+        self.other = Player("IA 1", True)
+        self.achievements = Achievements()
+        self.achievements.attach(self.events, self.player)
+
+    def unlocked(self) -> list:
+        return [event.name for event in self.ui.of_type(AchievementUnlocked)]
+
+    def win(self, player=None):
+        self.events.publish(GameOver(player or self.player, 10, {}))
+
     def test_first_win_achievement(self):
-        # Simuler la première victoire
-        self.game.game_stats['games_won'] = 1
-        
-        # Vérifier que l'achievement est débloqué
-        self.assertTrue(
-            self.achievements.check_achievement('first_win', self.game.game_stats)
-        )
-        
-        # Vérifier qu'il ne peut pas être débloqué deux fois
-        self.assertFalse(
-            self.achievements.check_achievement('first_win', self.game.game_stats)
-        )
-        
+        self.win(self.other)
+        self.assertNotIn('first_win', self.unlocked())
+        self.win()
+        self.assertIn('first_win', self.unlocked())
+
+        # Un succès n'est débloqué qu'une fois
+        self.win()
+        self.assertEqual(self.unlocked().count('first_win'), 1)
+
     def test_perfect_game_achievement(self):
-        # Simuler une partie sans pioche
-        self.game.game_stats['cards_drawn'] = 0
-        
-        self.assertTrue(
-            self.achievements.check_achievement('perfect_game', self.game.game_stats)
-        )
-        
-        # Simuler une partie avec pioche
-        self.game.game_stats['cards_drawn'] = 1
-        
-        # Réinitialiser les achievements pour le test
-        self.achievements.unlocked.clear()
-        self.assertFalse(
-            self.achievements.check_achievement('perfect_game', self.game.game_stats)
-        )
-        
+        self.events.publish(GameStarted(None))
+        self.events.publish(CardsDrawn(self.player, 1))
+        self.win()
+        self.assertNotIn('perfect_game', self.unlocked())
+
+        # Nouvelle partie : les compteurs repartent de zéro
+        self.events.publish(GameStarted(None))
+        self.events.publish(CardsDrawn(self.other, 4))
+        self.win()
+        self.assertIn('perfect_game', self.unlocked())
+
     def test_special_master_achievement(self):
-        # Ajouter des cartes spéciales à la main du joueur
-        special_card = Card(Color.RED, CardType.SKIP)
-        self.test_player.hand.append(special_card)
-        
-        # Simuler directement l'état des statistiques
-        self.game.game_stats['special_cards_played'] = 5
-        
-        # Vérifier l'achievement
-        self.assertTrue(
-            self.achievements.check_achievement('special_master', self.game.game_stats)
-        )
-        
+        for _ in range(4):
+            self.events.publish(CardPlayed(self.player, SKIP, None, 3))
+            self.events.publish(CardPlayed(self.player, THREE, None, 3))
+            self.events.publish(CardPlayed(self.other, SKIP, None, 3))
+        self.assertNotIn('special_master', self.unlocked())
+        self.events.publish(CardPlayed(self.player, SKIP, None, 3))
+        self.assertEqual(self.unlocked(), ['special_master'])
+
     def test_comeback_achievement(self):
-        # Simuler une grande main
-        self.game.game_stats['max_cards_in_hand'] = 11
-        
-        # Vérifier directement avec les conditions
-        achievement_unlocked = self.achievements._conditions_met('comeback', self.game.game_stats)
-        self.assertTrue(achievement_unlocked)
-        
-        # Réinitialiser et tester avec une petite main
-        self.game.game_stats['max_cards_in_hand'] = 5
-        achievement_unlocked = self.achievements._conditions_met('comeback', self.game.game_stats)
-        self.assertFalse(achievement_unlocked)
-        
-    def test_achievement_display(self):
-        # Simuler le débloquage d'un achievement
-        self.game.game_stats['games_won'] = 1
-        self.game._check_achievements(self.test_player)
-        
-        # Vérifier que la méthode d'affichage a été appelée au moins une fois
-        self.ui_mock.display_achievement.assert_called()
-        
-    def test_multiple_achievements(self):
-        # Simuler une situation où plusieurs achievements peuvent être débloqués
-        self.game.game_stats.update({
-            'games_won': 1,
-            'cards_drawn': 0,
-            'special_cards_played': 5,
-            'max_cards_in_hand': 10
-        })
-        
-        # Vérifier les achievements
-        self.game._check_achievements(self.test_player)
-        
-        # Vérifier que la méthode d'affichage a été appelée
-        self.assertTrue(self.ui_mock.display_achievement.called) 
\ No newline at end of file
+        self.player.hand = [THREE] * 10
+        self.events.publish(CardsDrawn(self.player, 3))
+        self.player.hand = []
+        self.win()
+        self.assertIn('comeback', self.unlocked())
+
+    def test_career_progress_is_kept_in_profile(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "profils", "Joueur.json")
+            self.achievements.load_profile(path)
+            for _ in range(6):
+                self.events.publish(GameStarted(None))
+                self.win()
+            self.assertTrue(self.achievements.save_profile())
+
+            achievements = Achievements()
+            achievements.load_profile(path)
+            achievements.attach(self.events, self.player)
+            self.assertIn('first_win', achievements.unlocked)
+            self.assertEqual(achievements.progress['veteran'], {'wins': 6})
+            for _ in range(4):
+                self.events.publish(GameStarted(None))
+                self.win()
+            self.assertIn('veteran', achievements.unlocked)
+
+    def test_only_input_events_are_followed(self):
+        rule = AchievementRule('test', "Test", "", "", {CardsDrawn: lambda c, e, p: True})
+        achievements = Achievements({'test': rule})
+        events = EventStream()
+        achievements.attach(events, self.player)
+        self.assertTrue(events.active)
+
+        events.publish(CardsDrawn(self.player, 1))
+        # Succès débloqué : plus rien à suivre
+        self.assertEqual(achievements.unlocked, {'test'})
+        self.assertFalse(events._handlers.get(CardsDrawn))
+
+    def test_no_tracked_player_costs_nothing(self):
+        game = GameManager("moyen", headless=True, ai_only=True, seed=1)
+        self.assertFalse(game.events.active)
+
+    def test_game_unlocks_achievements(self):
+        ui = RecordingUI()
+        game = GameManager("facile", headless=True, seed=2, ui=ui)
+        game.players[0].is_ai = True  # le joueur suivi joue comme une IA
+        game.start_game()
+        while not game.is_game_over():
+            game.play_turn()
+        game.end_game()
+
+        winner = next(p for p in game.players if not p.hand)
+        unlocked = {event.name for event in ui.of_type(AchievementUnlocked)}
+        self.assertEqual(unlocked, game.achievements.unlocked)
+        self.assertEqual('first_win' in unlocked, winner is game.players[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import io
+import threading
+import time
+import unittest
+from src.game.card import CardType
+from src.ui.animation import Animation, AnimationScheduler, KeyListener
+from src.ui.console_ui import ConsoleUI
+
+class TestAnimationScheduler(unittest.TestCase):
+    def setUp(self):
+        self.frames = []
+        self.scheduler = AnimationScheduler(self.frames.append)
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def animation(self, count: int, frame_time: float, hold: float = 0.0) -> Animation:
+        return Animation([[str(i)] for i in range(count)], frame_time, hold)
+
+    def test_play_returns_immediately(self):
+        start = time.perf_counter()
+        self.scheduler.play(self.animation(10, 0.05))
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertTrue(self.scheduler.busy)
+
+        self.scheduler.wait_idle()
+        self.assertEqual(self.frames, [[str(i)] for i in range(10)])
+        self.assertFalse(self.scheduler.busy)
+
+    def test_skip_ends_on_last_frame(self):
+        self.scheduler.play(self.animation(100, 0.05))
+        start = time.perf_counter()
+        self.scheduler.wait_idle(key_pressed=lambda: True)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.frames[-1], ["99"])
+        self.assertLess(len(self.frames), 100)
+
+    def test_speed_factor(self):
+        self.scheduler.speed = 20.0
+        start = time.perf_counter()
+        self.scheduler.play(self.animation(10, 0.1, hold=1.0))
+        self.scheduler.wait_idle()
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(self.frames[-1], ["9"])
+
+    def test_late_frames_are_dropped(self):
+        drawn = []
+
+        def slow_draw(lines):
+            drawn.append(lines)
+            time.sleep(0.03)
+
+        scheduler = AnimationScheduler(slow_draw)
+        scheduler.play(self.animation(30, 0.01))
+        scheduler.wait_idle()
+        scheduler.close()
+
+        self.assertLess(len(drawn), 30)
+        self.assertEqual(drawn[-1], ["29"])
+        self.assertEqual(scheduler.dropped_frames, 30 - len(drawn))
+
+    def test_backlog_is_bounded(self):
+        release = threading.Event()
+        scheduler = AnimationScheduler(lambda lines: release.wait(), max_pending=2)
+        for _ in range(5):
+            scheduler.play(self.animation(1, 0.0))
+        self.assertLessEqual(len(scheduler._queue), 2)
+        release.set()
+        scheduler.wait_idle()
+        scheduler.close()
+
+    def test_key_listener_without_terminal(self):
+        with KeyListener(io.StringIO()) as keys:
+            self.assertFalse(keys.pressed())
+
+class TestConsoleUIAnimations(unittest.TestCase):
+    def setUp(self):
+        self.ui = ConsoleUI()
+        self.ui.renderer.stream = io.StringIO()
+        self.ui.animation_enabled = True
+
+    def tearDown(self):
+        self.ui.animations.close()
+
+    def test_animations_do_not_block(self):
+        start = time.perf_counter()
+        self.ui.animate_uno_call("IA 1")  # 20 images de 0,2 s
+        self.ui.animate_card_effect(CardType.SKIP)
+        self.ui.display_achievement('first_win')  # 2 s à l'écran
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+        self.ui.animations.skip()
+        self.assertTrue(self.ui.animations.busy)
+
+    def test_messages_wait_for_animations(self):
+        self.ui.animations.speed = 100.0
+        self.ui.animate_win("Joueur")
+        self.ui.show_message("Fin")
+
+        self.assertFalse(self.ui.animations.busy)
+        self.assertIn("Joueur a gagné", self.ui.renderer.stream.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
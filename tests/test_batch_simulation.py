@@ -0,0 +1,90 @@
+import random
+import unittest
+import numpy as np
+from src.game.card import Card, Color, CardType
+from src.sim.batch import BatchSimulator, run_vector_batch
+from src.sim.headless import play_headless_game, simulate
+
+class TestBatchSimulation(unittest.TestCase):
+    def setUp(self):
+        self.blue_one = Card(Color.BLUE, CardType.NUMBER, 1)
+        
+    def _single_game(self, top: Card, hand: list, current: int = 0) -> BatchSimulator:
+        sim = BatchSimulator(1, "facile", seed=0)
+        sim.hands[:] = 0
+        for card in hand:
+            sim.hands[0, current, card.id] += 1
+        sim.hand_sizes[0] = sim.hands[0].sum(axis=1)
+        sim.top[:] = top.id
+        sim.top_base[:] = top.base.id
+        sim.current[:] = current
+        return sim
+        
+    def test_deal(self):
+        sim = BatchSimulator(50, seed=1)
+        
+        self.assertTrue((sim.hand_sizes == 7).all())
+        total = sim.hands.sum(axis=(1, 2)) + sim.pile_len + sim.discard.sum(axis=1)
+        self.assertTrue((total == 108).all())
+        self.assertFalse(np.isin(sim.top, [Card(Color.BLACK, t).id for t in
+                                           (CardType.WILD, CardType.WILD_DRAW_FOUR)]).any())
+        
+    def test_skip_effect(self):
+        red_five = Card(Color.RED, CardType.NUMBER, 5)
+        sim = self._single_game(red_five, [Card(Color.RED, CardType.SKIP), self.blue_one])
+        sim.step()
+        
+        # Comme Rules.apply_card_effect + GameManager._update_turn : le joueur 1 est sauté
+        self.assertEqual(sim.current[0], 2)
+        
+    def test_reverse_and_draw_two(self):
+        red_five = Card(Color.RED, CardType.NUMBER, 5)
+        sim = self._single_game(red_five, [Card(Color.RED, CardType.REVERSE), self.blue_one])
+        sim.step()
+        self.assertEqual(sim.direction[0], -1)
+        self.assertEqual(sim.current[0], 3)
+        
+        sim = self._single_game(red_five, [Card(Color.RED, CardType.DRAW_TWO), self.blue_one])
+        before = sim.hand_sizes[0, 1]
+        sim.step()
+        self.assertEqual(sim.hand_sizes[0, 1], before + 2)
+        self.assertEqual(sim.current[0], 2)
+        
+    def test_wild_declares_most_common_color(self):
+        red_five = Card(Color.RED, CardType.NUMBER, 5)
+        wild = Card(Color.BLACK, CardType.WILD)
+        blue = Card(Color.BLUE, CardType.NUMBER, 1)
+        sim = self._single_game(Card(Color.GREEN, CardType.NUMBER, 2), [wild, blue, blue, red_five])
+        sim.step()
+        
+        self.assertEqual(sim.top[0], wild.with_declared_color(Color.BLUE).id)
+        self.assertEqual(sim.top_base[0], wild.id)
+        
+    def test_matches_object_engine(self):
+        # Comparaison statistique avec GameManager : tours moyens et victoires du 1er siège
+        for difficulty in ("facile", "moyen"):
+            random.seed(1234)
+            games = [play_headless_game(difficulty) for _ in range(600)]
+            turns = np.array([g['turns'] for g in games], dtype=float)
+            first_seat = np.array([g['winner'] == 0 for g in games], dtype=float)
+            
+            result = BatchSimulator(6000, difficulty, seed=1234).run()
+            batch_turns = result['turns'].astype(float)
+            batch_first_seat = (result['winner'] == 0).astype(float)
+            
+            for ours, reference in ((batch_turns, turns), (batch_first_seat, first_seat)):
+                stderr = np.sqrt(ours.var() / len(ours) + reference.var() / len(reference))
+                self.assertLess(abs(ours.mean() - reference.mean()), 4 * stderr)
+                
+    def test_counting_strategy_is_rejected(self):
+        # « difficile » compte les cartes : seul le moteur objet la joue
+        with self.assertRaises(ValueError):
+            BatchSimulator(1, "difficile")
+        with self.assertRaises(ValueError):
+            simulate(4, difficulty="difficile", engine="numpy")
+                
+    def test_run_vector_batch_totals(self):
+        totals = run_vector_batch(300, "moyen", seed=3, batch_size=128)
+        
+        self.assertEqual(totals['games'], 300)
+        self.assertEqual(sum(totals['wins']) + totals['unfinished'], 300)
@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import Mock
+from src.game.ai_strategy import STRATEGIES, counting_color
+from src.game.beliefs import PILE, CardBeliefs
+from src.game.card import ALL_CARDS, Card, CardType, Color, PLAYABLE_COLORS
+from src.game.deck import DECK_TEMPLATE
+from src.game.events import CardPlayed, CardsDrawn
+from src.game.game_manager import GameManager
+from src.sim.headless import play_headless_game
+from src.ui.console_ui import ConsoleUI
+
+RED_5 = Card(Color.RED, CardType.NUMBER, 5)
+BLUE_5 = Card(Color.BLUE, CardType.NUMBER, 5)
+
+class TestCardBeliefs(unittest.TestCase):
+    def setUp(self):
+        self.game = GameManager("difficile", headless=True, ai_only=True, seed=11)
+        self.game.start_game()
+        self.beliefs = self.game.beliefs
+        self.me = self.game.players[0]
+
+    def test_only_counting_strategies_are_tracked(self):
+        self.assertIsInstance(self.beliefs, CardBeliefs)
+        game = GameManager("moyen", headless=True, ai_only=True, seed=1)
+        game.start_game()
+        self.assertIsNone(game.beliefs)
+        game.players[2].strategy = "difficile"
+        game.reset(1)
+        game.start_game()
+        self.assertIsNotNone(game.beliefs)
+
+    def test_probabilities_sum_to_one(self):
+        for color in PLAYABLE_COLORS:
+            card = Card(color, CardType.NUMBER, 3)
+            total = sum(self.beliefs.probability(self.me, card, holder) for holder in (1, 2, 3, PILE))
+            self.assertAlmostEqual(total, 1.0)
+            self.assertEqual(self.beliefs.probability(self.me, card, 0), 0.0)
+            expected = sum(self.beliefs.expected_color(self.me, holder, color) for holder in (1, 2, 3, PILE))
+            self.assertAlmostEqual(expected, self.beliefs.unseen_color(self.me, color))
+
+    def test_unseen_cards(self):
+        unseen = sum(self.beliefs.unseen(self.me, card) for card in set(DECK_TEMPLATE))
+        self.assertEqual(unseen, len(DECK_TEMPLATE) - 7 - 1)
+        top = self.game.deck.discard_pile[-1]
+        self.assertEqual(self.beliefs.unseen(self.me, top),
+                         DECK_TEMPLATE.count(top) - self.me.hand.count(top) - 1)
+
+    def test_forced_draw_reveals_missing_color(self):
+        game = self.game
+        top_color = game.top_card.color
+        card = Card(top_color, CardType.NUMBER, 1)
+        player = game.players[1]
+        game.current_player_index = 1
+        game._draw_card(player)
+        game.events.publish(CardsDrawn(player, 1))
+        # Seule la carte piochée peut être de la couleur visible
+        self.assertFalse(self.beliefs.lacks(1, top_color))
+        self.assertLess(self.beliefs.probability(self.me, card, 1),
+                        self.beliefs.probability(self.me, card, 2) / 4)
+        player.add_card(card)
+        player.remove_card(card)
+        game.events.publish(CardPlayed(player, card, None, len(player.hand)))
+        self.assertTrue(self.beliefs.lacks(1, top_color))
+        self.assertFalse(self.beliefs.lacks(1, Color.BLACK))  # une seule carte reçue depuis
+        self.assertEqual(self.beliefs._fresh[1][list(Color).index(Color.BLACK)], 1)
+        self.assertEqual(self.beliefs.probability(self.me, card, 1), 0.0)
+
+        # Une pénalité lui donne de nouvelles cartes, peut-être de cette couleur
+        game.current_player_index = 0
+        game._draw_cards(player, 2)
+        self.assertFalse(self.beliefs.lacks(1, top_color))
+        self.assertGreater(self.beliefs.probability(self.me, card, 1), 0.0)
+
+    def test_human_draw_by_choice_reveals_nothing(self):
+        game = GameManager("difficile", headless=True, seed=11)
+        game.ui = Mock(spec=ConsoleUI)
+        game.ui.get_player_move.return_value = -1  # pioche malgré une carte jouable
+        game.ui.ask_play_drawn_card.return_value = False
+        game.start_game()
+        human = game.players[0]
+        top_color = game.top_card.color
+        human.add_card(Card(top_color, CardType.NUMBER, 1))
+        game.beliefs.sync()
+        game.play_turn()
+        self.assertEqual(len(human.hand), 9)
+        self.assertFalse(game.beliefs._void[0][list(Color).index(top_color)])
+        self.assertFalse(game.beliefs._void[0][list(Color).index(Color.BLACK)])
+        card = Card(top_color, CardType.NUMBER, 2)
+        self.assertGreater(game.beliefs.probability(game.players[1], card, 0), 0.0)
+
+    def test_incremental_state_matches_the_table(self):
+        game = GameManager("difficile", headless=True, ai_only=True, seed=4)
+        game.start_game()
+        beliefs = game.beliefs
+        while not game.is_game_over():
+            game.play_turn()
+            self.assertEqual(beliefs._sizes, [len(p.hand) for p in game.players])
+            discard = [0] * len(ALL_CARDS)
+            for card in game.deck.discard_pile:
+                discard[card.id] += 1
+            self.assertEqual(beliefs._discard, discard)
+            for seat, player in enumerate(game.players):
+                for c, color in enumerate(Color):
+                    if beliefs._void[seat][c]:
+                        # Les cartes de cette couleur viennent des pioches suivantes
+                        self.assertLessEqual(player.hand.color_count(color), beliefs._fresh[seat][c])
+
+    def test_reshuffle_returns_discard_to_unseen(self):
+        game = self.game
+        for card in game.deck.cards[-20:]:
+            game.deck.cards.remove(card)
+            game.deck.discard_pile.insert(0, card)
+            game.events.publish(CardPlayed(game.players[1], card, None, 7))
+        unseen = sum(self.beliefs.unseen(self.me, card) for card in set(DECK_TEMPLATE))
+        self.assertEqual(unseen, len(DECK_TEMPLATE) - 7 - 21)
+        game.deck.discard_pile.extend(game.deck.cards)
+        game.deck.cards.clear()
+        game._draw_card(game.players[1])
+        unseen = sum(self.beliefs.unseen(self.me, card) for card in set(DECK_TEMPLATE))
+        self.assertEqual(unseen, len(DECK_TEMPLATE) - 7 - 1)
+
+    def test_hard_strategy_plays_the_color_the_next_player_lacks(self):
+        game = self.game
+        beliefs = self.beliefs
+        game.current_player_index = 0
+        game.direction = 1
+        game.deck.discard_pile.append(Card(Color.GREEN, CardType.NUMBER, 5))
+        beliefs.sync()
+        beliefs._void[1][list(Color).index(Color.RED)] = True  # a pioché sur du rouge
+        self.me.hand = [BLUE_5, RED_5]
+        self.assertIs(STRATEGIES["difficile"](game, self.me, [RED_5, BLUE_5]), RED_5)
+        beliefs._void[1][list(Color).index(Color.RED)] = False
+        beliefs._void[1][list(Color).index(Color.BLUE)] = True
+        self.assertIs(STRATEGIES["difficile"](game, self.me, [RED_5, BLUE_5]), BLUE_5)
+
+    def test_wild_color_prefers_own_cards_then_missing_colors(self):
+        game = self.game
+        wild = Card(Color.BLACK, CardType.WILD)
+        game.current_player_index = 0
+        game.direction = 1
+        self.me.hand = [wild, Card(Color.YELLOW, CardType.NUMBER, 1)]
+        self.assertEqual(counting_color(game, self.me, wild), Color.YELLOW)
+        self.me.hand = [wild, RED_5, BLUE_5]
+        self.beliefs._void[1][list(Color).index(Color.BLUE)] = True
+        self.beliefs._fresh[1][list(Color).index(Color.BLUE)] = 0
+        self.assertEqual(counting_color(game, self.me, wild), Color.BLUE)
+
+        game._play_card(self.me, wild)
+        self.assertEqual(game.declared_color, Color.BLUE)
+
+    def test_hard_games_are_reproducible(self):
+        first = GameManager("difficile", headless=True, ai_only=True)
+        second = GameManager("difficile", headless=True, ai_only=True)
+        for seed in range(10):
+            self.assertEqual(play_headless_game("difficile", seed=seed, game=first),
+                             play_headless_game("difficile", seed=seed))
+            play_headless_game("difficile", seed=seed, game=second)
+            self.assertEqual(first.game_stats, second.game_stats)
+
+if __name__ == '__main__':
+    unittest.main()
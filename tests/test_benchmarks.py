@@ -0,0 +1,40 @@
+import unittest
+from benchmarks.suite import BENCHMARKS, benchmark, compare, run_suite, select
+
+def results(**seconds) -> dict:
+    return {'results': {name: {'seconds_per_op': value} for name, value in seconds.items()}}
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def tearDown(self):
+        BENCHMARKS.pop("test.sum", None)
+
+    def test_run_registered_benchmark(self):
+        cleaned = []
+
+        @benchmark("test.sum", inner=10)
+        def bench_sum():
+            data = list(range(10))
+            yield lambda: sum(data)
+            cleaned.append(True)
+
+        document = run_suite(select(["test."]), repeat=2)
+
+        result = document['results']['test.sum']
+        self.assertEqual(result['group'], "micro")
+        self.assertGreater(result['ops_per_second'], 0)
+        self.assertEqual(cleaned, [True])
+        with self.assertRaises(ValueError):
+            benchmark("test.sum")(bench_sum)
+
+    def test_compare_flags_slowdowns(self):
+        baseline = results(a=1.0, b=1.0, c=1.0)
+        current = results(a=1.05, b=1.5, c=0.5, d=2.0)
+
+        rows = compare(baseline, current, threshold=0.10)
+
+        self.assertEqual([name for name, _, _ in rows], ["a", "b", "c"])
+        self.assertEqual([slower for _, _, slower in rows], [False, True, False])
+        self.assertAlmostEqual(rows[1][1], 1.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from src.game.card import Card, Color, CardType
+from src.game.card import Card, Color, CardType, ALL_CARDS, CARD_KINDS
 
 class TestCard(unittest.TestCase):
     def setUp(self):
@@ -22,3 +22,36 @@ class TestCard(unittest.TestCase):
         
         # Test carte noire
         self.assertTrue(self.wild_card.can_be_played_on(self.number_card))
+
+    def test_cards_are_interned(self):
+        self.assertIs(Card(Color.RED, CardType.NUMBER, 5), self.number_card)
+        self.assertIs(Card.from_id(self.number_card.id), self.number_card)
+        
+    def test_cards_are_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.wild_card.color = Color.RED
+            
+    def test_invalid_card(self):
+        with self.assertRaises(ValueError):
+            Card(Color.BLACK, CardType.NUMBER, 5)
+            
+    def test_card_ids(self):
+        self.assertEqual(CARD_KINDS, 54)
+        self.assertEqual([card.id for card in ALL_CARDS], list(range(len(ALL_CARDS))))
+        
+    def test_declared_color(self):
+        declared = self.wild_card.with_declared_color(Color.GREEN)
+        self.assertEqual(declared.color, Color.GREEN)
+        self.assertIs(declared.base, self.wild_card)
+        self.assertTrue(Card(Color.GREEN, CardType.NUMBER, 3).can_be_played_on(declared))
+        self.assertFalse(Card(Color.RED, CardType.NUMBER, 3).can_be_played_on(declared))
+        
+    def test_playability_table(self):
+        # La table précalculée doit respecter les règles du jeu pour toutes les paires
+        for card in ALL_CARDS:
+            for top in ALL_CARDS:
+                expected = (card.color == Color.BLACK or card.color == top.color or
+                            (card.card_type == top.card_type and card.card_type != CardType.NUMBER) or
+                            (card.card_type == CardType.NUMBER and top.card_type == CardType.NUMBER and
+                             card.value == top.value))
+                self.assertEqual(card.can_be_played_on(top), expected)
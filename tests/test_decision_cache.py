@@ -0,0 +1,131 @@
+import random
+import unittest
+from src.game.ai_strategy import (AIStrategy, CACHEABLE_STRATEGIES, STRATEGIES, register_strategy,
+                                  same_color_first)
+from src.game.card import ALL_CARDS, Card, CardType, Color
+from src.game.decision_cache import DecisionCache, hand_key
+from src.game.deck import DECK_TEMPLATE
+from src.game.game_manager import GameManager
+from src.sim.headless import play_headless_game
+
+class TestDecisionCache(unittest.TestCase):
+    def test_lru_eviction_and_counters(self):
+        cache = DecisionCache(maxsize=2)
+        red = Card(Color.RED, CardType.NUMBER, 1)
+        blue = Card(Color.BLUE, CardType.NUMBER, 2)
+        self.assertIs(cache.decide('a', lambda: red), red)
+        self.assertIs(cache.decide('b', lambda: blue), blue)
+        self.assertIs(cache.decide('a', lambda: blue), red)  # 'a' redevient le plus récent
+        cache.decide('c', lambda: None)  # 'b' est évincé ; None est une décision
+        self.assertIsNone(cache.decide('c', lambda: red))
+        self.assertIs(cache.decide('b', lambda: red), red)
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 4, 'size': 2, 'hit_rate': 2 / 6})
+
+    def test_hand_key_ignores_order(self):
+        hand = list(DECK_TEMPLATE[:7]) + [DECK_TEMPLATE[0]]
+        shuffled = list(hand)
+        random.Random(1).shuffle(shuffled)
+        self.assertEqual(hand_key(hand), hand_key(shuffled))
+        self.assertNotEqual(hand_key(hand), hand_key(hand[1:]))
+
+    def test_cached_games_match_uncached_games(self):
+        # « difficile » compte les cartes : sa décision dépend de toute la partie
+        self.assertNotIn(STRATEGIES["difficile"], CACHEABLE_STRATEGIES)
+        for difficulty in ("facile", "moyen"):
+            self.assertIn(STRATEGIES[difficulty], CACHEABLE_STRATEGIES)
+            plain = GameManager(difficulty, headless=True, ai_only=True)
+            cached = GameManager(difficulty, headless=True, ai_only=True)
+            cached.decision_cache = DecisionCache(maxsize=512)
+            for seed in range(40):
+                expected = play_headless_game(difficulty, seed=seed, game=plain)
+                self.assertEqual(play_headless_game(difficulty, seed=seed, game=cached), expected)
+                self.assertEqual(cached.game_stats, plain.game_stats)
+                self.assertEqual([list(p.hand) for p in cached.players],
+                                 [list(p.hand) for p in plain.players])
+            self.assertGreater(cached.decision_cache.hits, 0)
+
+    def test_ai_strategy_cached_matches_uncached(self):
+        rng = random.Random(0)
+        cache = DecisionCache(maxsize=256)
+        tops = [card for card in ALL_CARDS if card.color != Color.BLACK]
+        try:
+            for threshold in (2, 4, 2):
+                AIStrategy.configure(danger_threshold=threshold)
+                for _ in range(3000):
+                    hand = rng.sample(DECK_TEMPLATE, rng.randint(1, 10))
+                    top = rng.choice(tops)
+                    others = {f"IA {i}": rng.randint(1, 8) for i in range(3)}
+                    for difficulty in ("facile", "moyen", "difficile"):
+                        expected = AIStrategy.choose_card(difficulty, hand, top, others)
+                        self.assertIs(AIStrategy.choose_card(difficulty, hand, top, others, cache),
+                                      expected)
+                        # Même main dans un autre ordre : décision lue dans le cache
+                        shuffled = rng.sample(hand, len(hand))
+                        self.assertIs(AIStrategy.choose_card(difficulty, shuffled, top, others, cache),
+                                      expected)
+        finally:
+            AIStrategy.configure(danger_threshold=2)
+        self.assertGreaterEqual(cache.hits, 3 * 3000 * 3)
+
+    def test_changed_parameters_invalidate_decisions(self):
+        cache = DecisionCache()
+        hand = [Card(Color.RED, CardType.NUMBER, 5), Card(Color.RED, CardType.SKIP)]
+        top = Card(Color.RED, CardType.NUMBER, 1)
+        others = {"IA 2": 4}
+        try:
+            self.assertEqual(AIStrategy.choose_card("difficile", hand, top, others, cache), hand[0])
+            AIStrategy.configure(danger_threshold=4)
+            self.assertEqual(AIStrategy.choose_card("difficile", hand, top, others, cache), hand[1])
+        finally:
+            AIStrategy.configure(danger_threshold=2)
+        self.assertEqual(cache.misses, 2)
+        
+    def test_assigned_threshold_is_part_of_the_key(self):
+        cache = DecisionCache()
+        hand = [Card(Color.RED, CardType.NUMBER, 5), Card(Color.RED, CardType.SKIP)]
+        top = Card(Color.RED, CardType.NUMBER, 1)
+        others = {"IA 2": 4}
+        try:
+            AIStrategy.danger_threshold = 5
+            self.assertEqual(AIStrategy.choose_card("difficile", hand, top, others, cache), hand[1])
+            AIStrategy.danger_threshold = 3  # sans configure : version inchangée
+            self.assertEqual(AIStrategy.choose_card("difficile", hand, top, others, cache),
+                             AIStrategy.choose_card("difficile", hand, top, others))
+            self.assertEqual(AIStrategy.choose_card("difficile", hand, top, others, cache), hand[0])
+        finally:
+            AIStrategy.configure(danger_threshold=2)
+
+    def test_replaced_strategy_does_not_reuse_decisions(self):
+        game = GameManager("essai", headless=True, ai_only=True, seed=5)
+        game.decision_cache = DecisionCache()
+        try:
+            register_strategy("essai", cacheable=True)(lambda game, player, playable: playable[0])
+            play_headless_game("essai", seed=5, game=game)
+            register_strategy("essai", cacheable=True)(lambda game, player, playable: playable[-1])
+            plain = GameManager("essai", headless=True, ai_only=True)
+            misses = game.decision_cache.misses
+            self.assertEqual(play_headless_game("essai", seed=5, game=game),
+                             play_headless_game("essai", seed=5, game=plain))
+            self.assertGreater(game.decision_cache.misses, misses)
+        finally:
+            CACHEABLE_STRATEGIES.discard(STRATEGIES.pop("essai"))
+
+    def test_uncacheable_strategy_is_not_cached(self):
+        calls = []
+
+        def counting(game, player, playable):
+            calls.append(1)
+            return same_color_first(game, player, playable)
+
+        game = GameManager("compte", headless=True, ai_only=True)
+        game.decision_cache = DecisionCache()
+        try:
+            register_strategy("compte")(counting)
+            play_headless_game("compte", seed=1, game=game)
+        finally:
+            STRATEGIES.pop("compte")
+        self.assertEqual(len(game.decision_cache), 0)
+        self.assertTrue(calls)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
+import random
 import unittest
-from src.game.deck import Deck
+from src.game.deck import Deck, DECK_TEMPLATE
 
 class TestDeck(unittest.TestCase):
     def setUp(self):
@@ -23,4 +24,24 @@ class TestDeck(unittest.TestCase):
             
         # Tester le remélange
         self.deck._reshuffle_discard_pile()
-        self.assertGreater(len(self.deck.cards), 0) 
\ No newline at end of file
+        self.assertGreater(len(self.deck.cards), 0)
+        
+    def test_shuffle_uses_own_rng(self):
+        decks = [Deck(random.Random(7)) for _ in range(2)]
+        for deck in decks:
+            deck.shuffle()
+            
+        self.assertEqual(decks[0].cards, decks[1].cards)
+        self.assertNotEqual(decks[0].cards, Deck().cards)
+
+    def test_reset_reuses_lists(self):
+        cards, discard_pile = self.deck.cards, self.deck.discard_pile
+        self.deck.shuffle()
+        for _ in range(10):
+            discard_pile.append(self.deck.draw_card())
+        self.deck.reset()
+
+        self.assertIs(self.deck.cards, cards)
+        self.assertIs(self.deck.discard_pile, discard_pile)
+        self.assertEqual(self.deck.cards, list(DECK_TEMPLATE))
+        self.assertEqual(self.deck.discard_pile, [])
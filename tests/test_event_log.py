@@ -0,0 +1,139 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+from src.game.card import Card, CardType, Color
+from src.game.event_log import EventLogger, count_by, read_events, segments, summarize
+from src.game.events import CardEffect, DeckReshuffled
+from src.game.game_manager import GameManager
+from src.game.rules import Rules
+from src.sim.headless import play_headless_game
+from src.ui.recording_ui import RecordingUI
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def play(self, logger: EventLogger, seeds) -> GameManager:
+        game = GameManager("facile", headless=True, ai_only=True)
+        logger.attach(game)
+        for seed in seeds:
+            play_headless_game("facile", seed=seed, game=game)
+        logger.close()
+        return game
+
+    def test_game_is_logged_in_order(self):
+        logger = EventLogger(self.directory)
+        game = self.play(logger, [7])
+        events = list(read_events(self.directory))
+
+        self.assertEqual(events[0]['type'], 'deal')
+        self.assertEqual(events[0]['game'], 7)
+        self.assertEqual(len(events[0]['hands']), 4)
+        self.assertEqual(events[-1]['type'], 'win')
+        self.assertEqual(events[-1]['seat'], next(i for i, p in enumerate(game.players) if not p.hand))
+        self.assertEqual(logger.written, len(events))
+        self.assertEqual(logger.dropped, 0)
+        self.assertEqual(sum(1 for e in events if e['type'] == 'play'), game.game_stats['cards_played'])
+        self.assertEqual(sum(e['count'] for e in events if e['type'] == 'draw'),
+                         game.game_stats['cards_drawn'])
+        turns = [e['turn'] for e in events]
+        self.assertEqual(turns, sorted(turns))
+
+    def test_effects_and_colors(self):
+        logger = EventLogger(self.directory)
+        self.play(logger, range(20))
+        effects = count_by(read_events(self.directory, types=['effect']), 'effect')
+        self.assertEqual(set(effects), {'skip', 'reverse', 'draw_two', 'draw_four'})
+        plays = {(e['game'], e['turn']): e for e in read_events(self.directory, types=['play'])}
+        for color in read_events(self.directory, types=['color']):
+            self.assertIn(color['color'], {'rouge', 'bleu', 'vert', 'jaune'})
+            self.assertEqual(plays[(color['game'], color['turn'])]['seat'], color['seat'])
+
+    def test_reshuffle_is_published_before_the_draw(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=3)
+        game.start_game()
+        ui = RecordingUI()
+        game.ui = ui
+        game.deck.discard_pile.extend(game.deck.cards)
+        game.deck.cards.clear()
+        pile = len(game.deck.discard_pile) - 1
+        game._draw_cards(game.players[0], 2)
+
+        reshuffled = ui.of_type(DeckReshuffled)
+        self.assertEqual(len(reshuffled), 1)
+        self.assertEqual(reshuffled[0].draw_pile, pile)
+        self.assertIs(type(ui.events[0]), DeckReshuffled)
+
+    def test_effect_targets_next_player(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=3)
+        game.start_game()
+        effects = []
+        game.events.subscribe(CardEffect, effects.append)
+        game.current_player_index = 1
+        game.direction = -1
+        Rules.apply_card_effect(Card(Color.RED, CardType.DRAW_TWO), game)
+        self.assertEqual(effects[0].effect, 'draw_two')
+        self.assertIs(effects[0].target, game.players[0])
+
+    def test_compressed_log_matches_plain_log(self):
+        plain = self.directory / "plain"
+        compressed = self.directory / "gz"
+        self.play(EventLogger(plain), range(3))
+        self.play(EventLogger(compressed, compress=True), range(3))
+        self.assertTrue(all(path.suffix == '.gz' for path in segments(compressed)))
+        self.assertEqual(list(read_events(plain)), list(read_events(compressed)))
+
+    def test_segments_rotate_and_old_ones_are_removed(self):
+        logger = EventLogger(self.directory, max_bytes=4096, backups=2)
+        self.play(logger, range(10))
+        names = [path.name for path in segments(self.directory)]
+        self.assertEqual(len(names), 3)
+        self.assertEqual(names[-1], f"events-{logger._segment:05d}.jsonl")
+        self.assertGreater(logger._segment, 3)
+        kept = list(read_events(self.directory))
+        self.assertLess(len(kept), logger.written)
+        self.assertEqual(kept[-1]['type'], 'win')
+
+    def test_existing_log_is_continued(self):
+        self.play(EventLogger(self.directory), [1])
+        self.play(EventLogger(self.directory), [2])
+        self.assertEqual([path.name for path in segments(self.directory)],
+                         ["events-00001.jsonl", "events-00002.jsonl"])
+        self.assertEqual(summarize(read_events(self.directory))['games'], 2)
+
+    def test_full_queue_drops_events_without_blocking(self):
+        logger = EventLogger(self.directory, max_pending=10, flush_interval=3600)
+        game = GameManager("facile", headless=True, ai_only=True)
+        logger.attach(game)
+        play_headless_game("facile", seed=1, game=game)
+        self.assertGreater(logger.dropped, 0)
+        logger.close()
+        self.assertEqual(logger.written, 10)
+
+    def test_unfinished_compressed_segment_is_readable(self):
+        logger = EventLogger(self.directory, compress=True)
+        game = GameManager("facile", headless=True, ai_only=True)
+        logger.attach(game)
+        play_headless_game("facile", seed=1, game=game)
+        logger.flush()  # segment non fermé : pas de fin de flux gzip
+        path = segments(self.directory)[0]
+        with gzip.open(path, 'rt') as f:
+            self.assertRaises(EOFError, f.read)
+        self.assertEqual(len(list(read_events(path))), logger.written)
+        logger.close()
+
+    def test_summarize(self):
+        self.play(EventLogger(self.directory), range(5))
+        summary = summarize(read_events(self.directory))
+        self.assertEqual(summary['games'], 5)
+        self.assertEqual(sum(summary['wins'].values()), 5)
+        self.assertEqual(summary['lines'], sum(summary['types'].values()))
+        self.assertGreaterEqual(summary['max_hand'], 7)
+
+if __name__ == '__main__':
+    unittest.main()
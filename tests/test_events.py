@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import Mock
+from src.game.card import Card, Color, CardType
+from src.game.events import (EVENT_TYPES, EventStream, GameStarted, TurnStarted, CardPlayed,
+                             CardsDrawn, CardEffect, GameOver)
+from src.game.game_manager import GameManager
+from src.ui.console_ui import ConsoleUI
+from src.ui.null_ui import NullUI
+from src.ui.recording_ui import RecordingUI
+
+class TestEventStream(unittest.TestCase):
+    def test_subscriptions(self):
+        events = EventStream()
+        received = []
+        self.assertFalse(events.active)
+
+        events.subscribe(CardsDrawn, received.append)
+        self.assertTrue(events.active)
+        events.publish(CardsDrawn(None, 2))
+        events.publish(GameStarted(None))
+        self.assertEqual([type(event) for event in received], [CardsDrawn])
+
+        events.unsubscribe(CardsDrawn, received.append)
+        self.assertFalse(events.active)
+
+    def test_null_ui_subscribes_nothing(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=1)
+        self.assertIsInstance(game.ui, NullUI)
+        self.assertFalse(game.events.active)
+
+        game.ui = RecordingUI()
+        self.assertTrue(game.events.active)
+        game.ui = NullUI()
+        self.assertFalse(game.events.active)
+
+class TestGameEvents(unittest.TestCase):
+    def test_events_of_a_game(self):
+        ui = RecordingUI()
+        game = GameManager("moyen", headless=True, ai_only=True, seed=3, ui=ui)
+        game.start_game()
+        while not game.is_game_over():
+            game.play_turn()
+        game.end_game()
+
+        self.assertIsInstance(ui.events[0], GameStarted)
+        self.assertIsInstance(ui.events[-1], GameOver)
+        self.assertEqual(len(ui.events[-1].winner.hand), 0)
+        self.assertEqual(len(ui.of_type(TurnStarted)), game.game_stats['turns_played'])
+        self.assertEqual(len(ui.of_type(CardPlayed)), game.game_stats['cards_played'])
+        self.assertEqual(sum(event.count for event in ui.of_type(CardsDrawn)),
+                         game.game_stats['cards_drawn'])
+        for event in ui.of_type(CardPlayed):
+            self.assertEqual(event.color is not None, event.card.color == Color.BLACK)
+        effects = [event.card for event in ui.of_type(CardEffect)]
+        self.assertTrue(effects)
+        self.assertTrue(all(card.card_type not in (CardType.NUMBER, CardType.WILD)
+                            for card in effects))
+
+    def test_recording_ui_records_every_event_type(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=1, ui=RecordingUI())
+        self.assertTrue(all(game.events.wants(event_type) for event_type in EVENT_TYPES))
+
+    def test_console_ui_handlers(self):
+        ui = ConsoleUI()
+        ui.display_game_state = Mock()
+        ui.animate_card_play = Mock()
+        ui.animate_uno_call = Mock()
+        game = GameManager("facile", headless=True, seed=2, ui=ui)
+        game.start_game()
+        human = game.players[0]
+
+        game.events.publish(TurnStarted(game, human, game.top_card, 0))
+        game.events.publish(CardsDrawn(human, 1))
+        game.events.publish(CardsDrawn(game.players[1], 2))
+        self.assertEqual(ui.display_game_state.call_count, 2)
+
+        game.events.publish(CardPlayed(human, Card(Color.RED, CardType.NUMBER, 3), None, 1))
+        ui.animate_card_play.assert_called_once()
+        ui.animate_uno_call.assert_called_once_with(human.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock
 from src.game.game_manager import GameManager
 from src.ui.console_ui import ConsoleUI
+from src.game.card import Card, Color, CardType
 
 class TestGameManager(unittest.TestCase):
     def setUp(self):
@@ -28,3 +29,72 @@ class TestGameManager(unittest.TestCase):
         initial_direction = self.game.direction
         self.game.direction *= -1
         self.assertEqual(self.game.direction, -initial_direction)
+
+    def test_wild_color_is_game_state(self):
+        self.game.start_game()
+        player = self.game.players[1]
+        wild = Card(Color.BLACK, CardType.WILD)
+        player.hand = [wild, Card(Color.BLUE, CardType.NUMBER, 2)]
+        
+        self.game._play_card(player, wild)
+        
+        self.assertEqual(wild.color, Color.BLACK)
+        self.assertIs(self.game.deck.discard_pile[-1], wild)
+        self.assertEqual(self.game.declared_color, Color.BLUE)
+        self.assertEqual(self.game.top_card.color, Color.BLUE)
+
+    def test_same_seed_same_game(self):
+        games = [GameManager("difficile", headless=True, ai_only=True, seed=42) for _ in range(2)]
+        for game in games:
+            game.start_game()
+            while not game.is_game_over():
+                game.play_turn()
+                
+        first, second = (game.snapshot_state() for game in games)
+        self.assertEqual(first['players'], second['players'])
+        self.assertEqual(first['discard_pile'], second['discard_pile'])
+        self.assertEqual(first['game_stats'], second['game_stats'])
+        
+    def test_reset_replays_a_fresh_game(self):
+        fresh = GameManager("difficile", headless=True, ai_only=True, seed=42)
+        reused = GameManager("difficile", headless=True, ai_only=True, seed=7)
+        reused.start_game()
+        for _ in range(30):
+            reused.play_turn()
+        deck, players = reused.deck, list(reused.players)
+        reused.reset(42)
+        for game in (fresh, reused):
+            game.start_game()
+            while not game.is_game_over():
+                game.play_turn()
+
+        self.assertIs(reused.deck, deck)
+        self.assertEqual(reused.players, players)
+        first, second = fresh.snapshot_state(), reused.snapshot_state()
+        self.assertEqual(first['players'], second['players'])
+        self.assertEqual(first['draw_pile'], second['draw_pile'])
+        self.assertEqual(first['game_stats'], second['game_stats'])
+
+    def test_restore_state_reuses_players(self):
+        self.game.start_game()
+        state = self.game.snapshot_state()
+        players = list(self.game.players)
+        self.game.players[0].hand.clear()
+        self.game.restore_state(state)
+
+        self.assertEqual(self.game.players, players)
+        self.assertEqual(self.game.snapshot_state()['players'], state['players'])
+        self.assertEqual(self.game.snapshot_state()['draw_pile'], state['draw_pile'])
+
+    def test_commands_do_not_play_a_card(self):
+        self.game.start_game()
+        player = self.game.players[0]
+        hand_size = len(player.hand)
+        self.game.ui.get_player_move.side_effect = [-3, -1]
+        self.game.ui.ask_play_drawn_card.return_value = False
+        
+        self.game.play_turn()
+        
+        self.assertEqual(len(player.hand), hand_size + 1)
+        self.assertEqual(self.game.record.decisions[0], -1)
+        self.assertNotIn(-3, self.game.record.decisions)
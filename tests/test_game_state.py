@@ -0,0 +1,138 @@
+import random
+import unittest
+from src.game.card import Card, Color, CardType
+from src.game.game_manager import GameManager
+from src.game.game_state import DRAW, DRAW_KEEP, GameState, most_common_color
+
+RED_5 = Card(Color.RED, CardType.NUMBER, 5)
+RED_7 = Card(Color.RED, CardType.NUMBER, 7)
+BLUE_1 = Card(Color.BLUE, CardType.NUMBER, 1)
+GREEN_2 = Card(Color.GREEN, CardType.NUMBER, 2)
+WILD = Card(Color.BLACK, CardType.WILD)
+WILD_DRAW_FOUR = Card(Color.BLACK, CardType.WILD_DRAW_FOUR)
+
+class TestGameState(unittest.TestCase):
+    def make_state(self, first_hand, draw_pile=None):
+        hands = [first_hand, [BLUE_1, GREEN_2], [BLUE_1], [GREEN_2]]
+        draw_pile = [GREEN_2] * 10 if draw_pile is None else draw_pile
+        return GameState(hands, draw_pile, [RED_5], rng=random.Random(0))
+
+    def test_legal_moves(self):
+        state = self.make_state([BLUE_1])
+        self.assertEqual(state.legal_moves(), [DRAW, DRAW_KEEP])
+
+        state = self.make_state([Card(Color.RED, CardType.SKIP), WILD, BLUE_1])
+        moves = state.legal_moves()
+        self.assertIn((Card(Color.RED, CardType.SKIP), None), moves)
+        self.assertEqual(len(moves), 5)  # la carte rouge + une entrée par couleur annoncée
+
+    def test_clone_is_independent(self):
+        state = self.make_state([RED_7, BLUE_1])
+        clone = state.clone()
+        clone.apply_move((RED_7, None))
+        clone.apply_move(DRAW)
+
+        self.assertEqual(state.hands[0], (RED_7, BLUE_1))
+        self.assertEqual(state.hands[1], (BLUE_1, GREEN_2))
+        self.assertIs(state.top_card, RED_5)
+        self.assertEqual(len(state.draw_pile), 10)
+        self.assertEqual(state.current_player_index, 0)
+        self.assertEqual(clone.hands[0], (BLUE_1,))
+        self.assertEqual(len(clone.hands[1]), 3)
+        self.assertEqual(len(clone.draw_pile), 9)
+        self.assertEqual(clone.discard_pile, [RED_5, RED_7])
+
+        # Pioche vide : chaque copie remélange avec son propre générateur
+        state = GameState([[BLUE_1], [GREEN_2]], [], [WILD, GREEN_2, BLUE_1, RED_7, RED_5],
+                          rng=random.Random(0))
+        first, second = state.clone(), state.clone()
+        first.apply_move(DRAW)
+        state.apply_move(DRAW)
+        second.apply_move(DRAW)
+        self.assertEqual(first.reshuffles, 1)
+        self.assertEqual(state.hands[0], first.hands[0])
+        self.assertEqual(second.hands[0], first.hands[0])
+        self.assertEqual(state.draw_pile, first.draw_pile)
+
+    def test_card_effects(self):
+        state = self.make_state([Card(Color.RED, CardType.SKIP), BLUE_1])
+        state.apply_move((Card(Color.RED, CardType.SKIP), None))
+        self.assertEqual(state.current_player_index, 2)
+
+        state = self.make_state([Card(Color.RED, CardType.REVERSE), BLUE_1])
+        state.apply_move((Card(Color.RED, CardType.REVERSE), None))
+        self.assertEqual(state.direction, -1)
+        self.assertEqual(state.current_player_index, 3)
+
+        state = self.make_state([WILD_DRAW_FOUR, BLUE_1])
+        state.apply_move((WILD_DRAW_FOUR, Color.YELLOW))
+        self.assertEqual(len(state.hands[1]), 6)
+        self.assertEqual(state.current_player_index, 2)
+        self.assertEqual(state.top_card, Card(Color.YELLOW, CardType.WILD_DRAW_FOUR))
+
+    def test_draw_plays_playable_card(self):
+        state = self.make_state([BLUE_1], draw_pile=[RED_7])
+        state.apply_move(DRAW)
+
+        self.assertEqual(state.hands[0], (BLUE_1,))
+        self.assertIs(state.top_card, RED_7)
+
+    def test_draw_keep_and_declared_color(self):
+        # Le joueur humain peut garder la carte piochée (ask_play_drawn_card)
+        state = self.make_state([BLUE_1], draw_pile=[RED_7])
+        state.apply_move(DRAW_KEEP)
+        self.assertEqual(state.hands[0], (BLUE_1, RED_7))
+        self.assertIs(state.top_card, RED_5)
+        self.assertEqual(state.current_player_index, 1)
+
+        state = self.make_state([BLUE_1], draw_pile=[WILD])
+        state.apply_move((None, True, Color.GREEN))
+        self.assertEqual(state.hands[0], (BLUE_1,))
+        self.assertEqual(state.top_card, Card(Color.GREEN, CardType.WILD))
+
+    def test_reshuffle_and_winner(self):
+        state = self.make_state([RED_7, RED_5], draw_pile=[])
+        state.apply_move((RED_7, None))
+        state.current_player_index = 1
+        state.apply_move(DRAW)  # RED_5 revient dans la pioche, est piochée puis posée
+
+        self.assertEqual(state.reshuffles, 1)
+        self.assertEqual(state.discard_pile, [RED_7, RED_5])
+        self.assertEqual(state.hands[1], (BLUE_1, GREEN_2))
+
+        state.current_player_index = 0
+        state.apply_move((RED_5, None))
+        self.assertEqual(state.winner, 0)
+        with self.assertRaises(ValueError):
+            state.apply_move(DRAW)
+
+    def test_most_common_color(self):
+        self.assertEqual(most_common_color([BLUE_1, GREEN_2, BLUE_1, WILD]), Color.BLUE)
+        self.assertEqual(most_common_color([WILD]), Color.RED)
+
+    def test_matches_game_manager(self):
+        # Les coups de GameManager, couleur annoncée comprise, rejoués sur GameState
+        # donnent le même état
+        random.seed(3)
+        game = GameManager("moyen", headless=True, ai_only=True)
+        game.start_game()
+        state = GameState.from_game(game)
+        while not game.is_game_over():
+            reshuffles = game.deck.reshuffles
+            game.play_turn()
+            if game.deck.reshuffles != reshuffles:
+                break  # le remélange ne tire pas les mêmes cartes
+            card, color, drawn = game._turn_move
+            state.apply_move((None, card is not None, color) if drawn else (card, color))
+
+            for hand, player in zip(state.hands, game.players):
+                self.assertEqual(sorted(hand, key=id), sorted(player.hand, key=id))
+            self.assertEqual(state.draw_pile, game.deck.cards)
+            self.assertEqual(state.discard_pile, game.deck.discard_pile)
+            self.assertIs(state.top_card, game.top_card)
+            self.assertEqual(state.current_player_index, game.current_player_index)
+            self.assertEqual(state.direction, game.direction)
+        self.assertGreater(game.game_stats['turns_played'], 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from src.game.card import Card, Color, CardType
+from src.game.hand import Hand, playable_cards
+from src.game.player import Player
+
+class TestHand(unittest.TestCase):
+    def setUp(self):
+        self.red_five = Card(Color.RED, CardType.NUMBER, 5)
+        self.blue_five = Card(Color.BLUE, CardType.NUMBER, 5)
+        self.green_skip = Card(Color.GREEN, CardType.SKIP)
+        self.wild = Card(Color.BLACK, CardType.WILD)
+        self.hand = Hand([self.green_skip, self.red_five, self.blue_five, self.red_five])
+        
+    def test_ordered_view(self):
+        self.assertEqual(len(self.hand), 4)
+        self.assertEqual(list(self.hand), [self.green_skip, self.red_five, self.blue_five, self.red_five])
+        self.assertIs(self.hand[1], self.red_five)
+        
+    def test_remove_keeps_buckets(self):
+        self.hand.remove(self.red_five)
+        
+        self.assertEqual(self.hand.count(self.red_five), 1)
+        self.assertEqual(self.hand.color_count(Color.RED), 1)
+        self.assertEqual(self.hand.value_count(5), 2)
+        with self.assertRaises(ValueError):
+            self.hand.remove(self.wild)
+            
+    def test_playable_queries(self):
+        yellow_five = Card(Color.YELLOW, CardType.NUMBER, 5)
+        yellow_skip = Card(Color.YELLOW, CardType.SKIP)
+        yellow_two = Card(Color.YELLOW, CardType.NUMBER, 2)
+        
+        self.assertTrue(self.hand.has_playable(yellow_five))
+        self.assertEqual(self.hand.playable(yellow_five), [self.red_five, self.blue_five])
+        self.assertEqual(self.hand.playable(yellow_skip), [self.green_skip])
+        self.assertFalse(self.hand.has_playable(yellow_two))
+        
+        self.hand.append(self.wild)
+        self.assertTrue(self.hand.has_playable(yellow_two))
+        self.assertEqual(self.hand.playable(yellow_two), [self.wild])
+        
+    def test_playable_matches_scan(self):
+        hand_list = list(self.hand) + [self.wild]
+        hand = Hand(hand_list)
+        for top in (self.red_five, self.green_skip, self.wild.with_declared_color(Color.BLUE)):
+            self.assertEqual(hand.playable(top), playable_cards(hand_list, top))
+            self.assertEqual(hand.has_playable(top),
+                             any(c.can_be_played_on(top) for c in hand_list))
+            
+    def test_most_common_color(self):
+        self.assertEqual(self.hand.most_common_color(), Color.RED)
+        self.assertIsNone(Hand([self.wild]).most_common_color())
+        
+    def test_player_hand_assignment(self):
+        player = Player("Test")
+        player.hand = [self.red_five, self.wild]
+        
+        self.assertIsInstance(player.hand, Hand)
+        self.assertTrue(player.has_playable_card(self.green_skip))
+        player.remove_card(self.wild)
+        self.assertFalse(player.has_playable_card(self.green_skip))
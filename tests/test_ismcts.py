@@ -0,0 +1,90 @@
+import random
+import unittest
+from functools import partial
+from unittest.mock import patch
+from src.game import game_manager
+from src.game.card import Color
+from src.game.game_manager import GameManager
+from src.game.ismcts import ExpertAI, Observation, determinize, search
+
+class TestISMCTS(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.game = GameManager("expert", headless=True, ai_only=True)
+        self.game.start_game()
+        self.observation = Observation.from_game(self.game)
+
+    def test_determinization_is_consistent(self):
+        sim = determinize(self.observation, random.Random(1))
+
+        self.assertEqual([len(hand) for hand in sim.hands], self.observation.hand_sizes)
+        self.assertEqual(list(sim.hands[self.observation.player]), self.observation.hand)
+        total = sum(len(hand) for hand in sim.hands)
+        total += len(sim.draw_pile) + len(sim.discard_pile)
+        self.assertEqual(total, 108)
+        self.assertIs(sim.top_card, self.game.top_card)
+
+    def test_search_with_iteration_budget(self):
+        visits = search(self.observation, time_budget=None, iterations=50, seed=3)
+
+        self.assertEqual(sum(visits.values()), 50)
+        self.assertEqual(visits, search(self.observation, time_budget=None, iterations=50, seed=3))
+
+    def test_expert_ai_chooses_legal_move(self):
+        ai = ExpertAI(time_budget=None, iterations=50, seed=3)
+        move = ai.choose_move(self.observation)
+        card, color = move[0], move[-1]  # pioche : (None, poser, couleur)
+
+        self.assertIn(card, self.observation.hand + [None])
+        if card is not None:
+            self.assertTrue(card.can_be_played_on(self.observation.top_card))
+            self.assertEqual(color is not None, card.color == Color.BLACK)
+
+    def test_parallel_search(self):
+        ai = ExpertAI(time_budget=None, iterations=40, workers=2, seed=3)
+        try:
+            visits = ai._parallel_search(self.observation)
+        finally:
+            ai.close()
+
+        self.assertEqual(sum(visits.values()), 40)
+
+    def test_expert_game_manager_turn(self):
+        self.game.expert_ai = ExpertAI(time_budget=None, iterations=20, seed=3)
+        for _ in range(10):
+            if self.game.is_game_over():
+                break
+            self.game.play_turn()
+
+        self.assertEqual(self.game.game_stats['turns_played'], 10)
+        total = sum(len(p.hand) for p in self.game.players)
+        total += len(self.game.deck.cards) + len(self.game.deck.discard_pile)
+        self.assertEqual(total, 108)
+
+    def test_expert_workers_are_closed_with_the_game(self):
+        game = GameManager("expert", headless=True, ai_only=True, seed=3)
+        game.expert_workers = 2
+
+        def expert_with_pool() -> ExpertAI:
+            game.start_game()
+            while game.expert_ai is None or game.expert_ai._pool is None:
+                self.assertFalse(game.is_game_over())
+                game.play_turn()
+            self.assertEqual(game.expert_ai.workers, 2)
+            return game.expert_ai
+
+        fast_expert = partial(ExpertAI, time_budget=None, iterations=8)
+        with patch.object(game_manager, 'ExpertAI', fast_expert):
+            ai = expert_with_pool()
+            game.reset(4)  # partie abandonnée pour une nouvelle
+            self.assertIsNone(game.expert_ai)
+            self.assertIsNone(ai._pool)
+
+            ai = expert_with_pool()
+            game.players[0].hand.clear()
+            game.end_game()
+            self.assertIsNone(game.expert_ai)
+            self.assertIsNone(ai._pool)
+
+if __name__ == '__main__':
+    unittest.main()
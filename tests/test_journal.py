@@ -0,0 +1,113 @@
+import random
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.game.card import Card, Color, CardType
+from src.game.game_manager import GameManager
+from src.game.journal import MoveJournal, JournalRecord
+from src.ui.console_ui import ConsoleUI
+
+class TestMoveJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        random.seed(3)
+        
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        
+    def _journaled_game(self, compact_every: int = 1000) -> GameManager:
+        game = GameManager("moyen", headless=True, ai_only=True)
+        game.enable_journal(MoveJournal(self.temp_dir.name, compact_every=compact_every))
+        game.start_game()
+        return game
+        
+    def _resume(self) -> GameManager:
+        resumed = GameManager("facile", headless=True)
+        self.assertTrue(resumed.resume_journal(MoveJournal(self.temp_dir.name)))
+        return resumed
+        
+    def test_record_round_trip(self):
+        record = JournalRecord(2, Card(Color.BLACK, CardType.WILD), Color.GREEN, 1)
+        
+        self.assertEqual(len(record.pack()), 4)
+        self.assertEqual(JournalRecord.unpack(record.pack()), record)
+        self.assertEqual(JournalRecord.unpack(JournalRecord(0, None, None, 0).pack()).card, None)
+        
+    def test_resume_rebuilds_latest_state(self):
+        game = self._journaled_game()
+        for _ in range(25):
+            if game.is_game_over():
+                break
+            game.play_turn()
+        game.journal.close()
+        
+        resumed = self._resume()
+        self.assertEqual(resumed.snapshot_state(), game.snapshot_state())
+        
+    def test_log_is_compacted(self):
+        game = self._journaled_game(compact_every=3)
+        for _ in range(7):
+            game.play_turn()
+            
+        self.assertLess(game.journal.moves_since_snapshot, 3)
+        _, records = game.journal.load()
+        self.assertEqual(len(records), game.journal.moves_since_snapshot)
+        self.assertEqual(self._resume().snapshot_state(), game.snapshot_state())
+        
+    def test_reshuffle_forces_snapshot(self):
+        game = self._journaled_game()
+        game.play_turn()
+        # Vider la pioche : le prochain tirage remélange la défausse
+        game.deck.discard_pile[:0] = game.deck.cards
+        game.deck.cards = []
+        game.journal.compact(game.snapshot_state())
+        game.players[game.current_player_index].hand = [Card(Color.BLACK, CardType.WILD_DRAW_FOUR)] * 2
+        game.play_turn()
+        
+        self.assertEqual(game.deck.reshuffles, 1)
+        self.assertEqual(game.journal.moves_since_snapshot, 0)
+        self.assertEqual(self._resume().snapshot_state(), game.snapshot_state())
+        
+    def test_out_of_sync_journal_is_rejected(self):
+        game = self._journaled_game()
+        game.play_turn()
+        game.journal.close()
+        # Coup attribué à un autre joueur que celui de l'instantané
+        with game.journal.log_file.open('wb') as f:
+            f.write(JournalRecord(2, None, None, 1).pack())
+            
+        resumed = GameManager("facile", headless=True)
+        self.assertFalse(resumed.resume_journal(MoveJournal(self.temp_dir.name)))
+        
+    def test_truncated_record_ignored(self):
+        game = self._journaled_game()
+        game.play_turn()
+        game.journal.close()
+        with game.journal.log_file.open('ab') as f:
+            f.write(b"\x01\x02")
+            
+        _, records = game.journal.load()
+        self.assertEqual(len(records), 1)
+        
+    def test_discarded_at_end_of_game(self):
+        game = self._journaled_game()
+        game.players[0].hand = []
+        game.end_game()
+        
+        self.assertFalse(game.journal.exists())
+        
+    def test_quit_keeps_the_human_turn(self):
+        game = GameManager("moyen", headless=True)
+        game.ui = Mock(spec=ConsoleUI)
+        game.ui.get_player_move.return_value = -4
+        game.enable_journal(MoveJournal(self.temp_dir.name))
+        game.start_game()
+        game.play_turn()
+        game.end_game()
+        
+        self.assertTrue(game.quit_game)
+        self.assertEqual(game.current_player_index, 0)
+        resumed = self._resume()
+        self.assertEqual(resumed.current_player_index, 0)
+        self.assertFalse(resumed.players[0].is_ai)
+        self.assertEqual(resumed.snapshot_state()['players'], game.snapshot_state()['players'])
@@ -0,0 +1,103 @@
+import pickle
+import time
+import unittest
+from unittest.mock import Mock
+from src.game.game_manager import GameManager
+from src.game.profiler import Histogram, TurnProfiler
+from src.sim.headless import simulate
+from src.ui.console_ui import ConsoleUI
+
+class TestHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in range(1, 10001):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, 10000)
+        self.assertEqual((histogram.min, histogram.max), (1, 10000))
+        for percent, expected in ((50, 5000), (95, 9500), (99, 9900)):
+            self.assertAlmostEqual(histogram.percentile(percent), expected, delta=expected / 32)
+
+    def test_small_values_are_exact(self):
+        histogram = Histogram()
+        for value in (3, 3, 7, 40):
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(50), 3)
+        self.assertEqual(histogram.percentile(100), 40)
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(10)
+        second.record(1000000)
+        first.merge(second)
+
+        self.assertEqual(first.count, 2)
+        self.assertEqual(first.max, 1000000)
+        self.assertEqual(first.percentile(50), 10)
+
+class TestTurnProfiler(unittest.TestCase):
+    def test_disabled_by_default(self):
+        game = GameManager("facile", headless=True, ai_only=True)
+
+        self.assertIsNone(game.profiler)
+        self.assertNotIn('play_turn', vars(game))
+
+    def test_phases_of_ai_game(self):
+        game = GameManager("moyen", headless=True, ai_only=True, seed=4)
+        game.start_game()
+        profiler = game.enable_profiling()
+        for _ in range(20):
+            game.play_turn()
+
+        summary = profiler.summary()
+        self.assertEqual(summary['turn']['count'], 20)
+        self.assertEqual(summary['ai']['count'], 20)
+        self.assertNotIn('render', summary)  # aucun abonné : aucun événement diffusé
+        self.assertIn('draw', summary)
+        self.assertLessEqual(summary['turn']['p50_us'], summary['turn']['p99_us'])
+        self.assertEqual(game.game_stats['turns_played'], 20)
+
+        profiler.detach()
+        self.assertNotIn('play_turn', vars(game))
+
+    def test_nested_phases_are_exclusive(self):
+        profiler = TurnProfiler()
+        draw = profiler._timed('draw', lambda: time.sleep(0.02))
+        rules = profiler._timed('rules', draw)
+        profiler._timed_turn(rules)()
+
+        self.assertGreaterEqual(profiler.histograms['draw'].max, 20_000_000)
+        self.assertLess(profiler.histograms['rules'].max, 10_000_000)
+        self.assertGreaterEqual(profiler.histograms['turn'].max, 20_000_000)
+
+    def test_stats_command_shows_timings(self):
+        game = GameManager("facile", seed=2)
+        game.ui = Mock(spec=ConsoleUI)
+        game.ui.get_player_move.side_effect = [-1, -5, -1]
+        game.ui.ask_play_drawn_card.return_value = False
+        display_statistics = game.ui.display_statistics
+        game.start_game()
+        game.enable_profiling()
+
+        game.play_turn()
+        while game.current_player_index != 0:
+            game.play_turn()
+        game.play_turn()
+
+        stats, timings = display_statistics.call_args.args
+        self.assertIs(stats, game.game_stats)
+        self.assertGreater(stats['turns_played'], 0)
+        self.assertIn('turn', timings)
+        self.assertIn('input', timings)
+
+    def test_profiles_are_merged_across_workers(self):
+        totals = simulate(4, workers=2, difficulty="facile", seed=1, profile=True)
+        profiler = pickle.loads(pickle.dumps(totals['profile']))
+
+        self.assertEqual(profiler.summary()['turn']['count'], totals['turns'])
+        with self.assertRaises(ValueError):
+            simulate(4, engine="numpy", profile=True)
+
+if __name__ == '__main__':
+    unittest.main()
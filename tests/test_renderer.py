@@ -0,0 +1,86 @@
+import io
+import unittest
+from unittest.mock import Mock
+from colorama import Style
+from src.game.card import CardType, ALL_CARDS
+from src.game.game_manager import GameManager
+from src.ui.console_ui import ConsoleUI
+from src.ui.renderer import ERASE_BELOW, HOME, FrameRenderer, move_to
+
+class TestFrameRenderer(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.renderer = FrameRenderer(self.stream)
+        self.renderer._rows = lambda: 50
+
+    def output(self) -> str:
+        text = self.stream.getvalue()
+        self.stream.seek(0)
+        self.stream.truncate()
+        return text
+
+    def test_first_frame_is_complete(self):
+        self.renderer.render(["a", "b"])
+
+        text = self.output()
+        self.assertTrue(text.startswith(HOME))
+        self.assertIn("a", text)
+        self.assertIn("b", text)
+        self.assertTrue(text.endswith(ERASE_BELOW))
+
+    def test_only_changed_lines_are_written(self):
+        self.renderer.render(["titre", "ligne 1", "ligne 2"])
+        self.output()
+
+        self.renderer.render(["titre", "ligne 1", "ligne 2"])
+        self.assertEqual(self.output(), move_to(3) + ERASE_BELOW)
+
+        self.renderer.render(["titre", "modifiée", "ligne 2"])
+        text = self.output()
+        self.assertIn(move_to(1) + "modifiée", text)
+        self.assertNotIn("titre", text)
+        self.assertNotIn("ligne 2", text)
+
+    def test_invalidate_and_tall_frames_redraw_everything(self):
+        self.renderer.render(["a"])
+        self.output()
+        self.renderer.invalidate()
+        self.renderer.render(["a"])
+        self.assertTrue(self.output().startswith(HOME))
+
+        self.renderer.render(["x"] * 60)
+        self.renderer.render(["x"] * 60)
+        self.assertEqual(self.output().count(HOME), 2)
+
+    def test_single_write_per_frame(self):
+        stream = Mock()
+        renderer = FrameRenderer(stream)
+        renderer.render(["a", "b", "c"])
+        renderer.render(["a", "x", "c"])
+
+        self.assertEqual(stream.write.call_count, 2)
+
+class TestConsoleUIRendering(unittest.TestCase):
+    def test_card_strings_are_precomputed(self):
+        ui = ConsoleUI()
+        for card in ALL_CARDS:
+            color = ui.color_map[card.color]
+            label = card.value if card.card_type == CardType.NUMBER else card.card_type.value
+            self.assertEqual(ui._format_card(card),
+                             f"{color}[{card.color.value} {label}]{Style.RESET_ALL}")
+
+    def test_display_game_state_uses_renderer(self):
+        game = GameManager("facile", headless=True, seed=1)
+        game.start_game()
+        ui = ConsoleUI()
+        ui.renderer = Mock(spec=FrameRenderer)
+
+        ui.display_game_state(game.players[0], game.top_card, game)
+
+        lines = ui.renderer.render.call_args.args[0]
+        self.assertIn(f"║ {ui._format_card(game.top_card)} ║", lines)
+        self.assertIn("> Joueur: 7 cartes", lines)
+        self.assertEqual(sum(line.startswith("║ 1.") for line in lines), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import tempfile
+import unittest
+from functools import partial
+from pathlib import Path
+from unittest.mock import Mock, patch
+from src.game import game_manager
+from src.game.card import Color
+from src.game.game_manager import GameManager
+from src.game.events import GameOver, TurnStarted
+from src.game.ismcts import ExpertAI
+from src.game.replay import ReplayRecord, ReplayRunner
+from src.ui.console_ui import ConsoleUI
+from src.ui.recording_ui import RecordingUI
+
+def scripted_ui() -> Mock:
+    """Joueur humain qui pose sa première carte jouable, sinon pioche"""
+    ui = Mock(spec=ConsoleUI)
+
+    def get_player_move(player, top_card):
+        for index, card in enumerate(player.hand):
+            if card.can_be_played_on(top_card):
+                return index
+        return -1
+
+    ui.get_player_move.side_effect = get_player_move
+    ui.ask_play_drawn_card.return_value = True
+    ui.get_color_choice.return_value = Color.GREEN
+    return ui
+
+def play(game: GameManager, max_turns: int = 300) -> dict:
+    """Joue la partie en gardant l'état au début de chaque tour"""
+    states = {}
+    game.start_game()
+    while not game.is_game_over() and game.game_stats['turns_played'] < max_turns:
+        states[game.game_stats['turns_played']] = game.snapshot_state()
+        game.play_turn()
+    states[game.game_stats['turns_played']] = game.snapshot_state()
+    return states
+
+def board(state: dict) -> tuple:
+    return (
+        [p['hand'] for p in state['players']],
+        state['discard_pile'],
+        state['draw_pile'],
+        state['current_player'],
+        state['declared_color']
+    )
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.game = GameManager("moyen", headless=True, seed=11)
+        self.game.ui = scripted_ui()
+        self.states = play(self.game)
+        self.record = self.game.record
+
+    def test_record_roundtrip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "replays" / "partie.json"
+            self.record.save(path)
+            loaded = ReplayRecord.load(path)
+
+        self.assertEqual(loaded.to_dict(), self.record.to_dict())
+        self.assertEqual(loaded.turns, self.game.game_stats['turns_played'])
+        self.assertTrue(loaded.decisions)
+
+    def test_replay_reaches_same_states(self):
+        runner = ReplayRunner(self.record)
+        runner.seek(self.record.turns)
+        self.assertEqual(board(runner.game.snapshot_state()), board(self.states[self.record.turns]))
+
+        # Retour en arrière : la partie est rejouée depuis le début
+        runner.seek(10)
+        self.assertEqual(runner.turn, 10)
+        self.assertEqual(board(runner.game.snapshot_state()), board(self.states[10]))
+
+    def test_play_renders_from_turn(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=5)
+        play(game)
+        ui = RecordingUI()
+
+        ReplayRunner(game.record).play(from_turn=10, ui=ui)
+
+        turns = ui.of_type(TurnStarted)
+        self.assertEqual(len(turns), game.record.turns - 10)
+        self.assertEqual(turns[0].turn, 10)
+        self.assertEqual(len(ui.of_type(GameOver)), 1)
+
+    def test_expert_moves_are_recorded(self):
+        # Recherche minimale : la partie est assez longue pour remélanger la pioche,
+        # le replay doit suivre le générateur de la partie sans lancer la recherche
+        fast_expert = partial(ExpertAI, time_budget=None, iterations=1)
+        with patch.object(game_manager, 'ExpertAI', fast_expert):
+            game = GameManager("expert", headless=True, ai_only=True, seed=321)
+            states = play(game)
+        self.assertGreater(game.deck.reshuffles, 0)
+
+        runner = ReplayRunner(game.record)
+        runner.seek(game.record.turns)
+
+        self.assertEqual(board(runner.game.snapshot_state()), board(states[game.record.turns]))
+        self.assertIsNone(runner.game.expert_ai)
+
+    def test_incomplete_replay(self):
+        record = ReplayRecord(self.record.seed, "moyen", decisions=[], turns=self.record.turns)
+
+        with self.assertRaises(ValueError):
+            ReplayRunner(record).seek(record.turns)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from src.game.card import Card, Color, CardType
+from src.game.game_manager import GameManager
+from src.game.achievements import ACHIEVEMENT_RULES
+from src.game.save_format import ACHIEVEMENT_IDS, encode_state, decode_state
+from src.game.save_manager import SaveManager
+
+class TestSaveFormat(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.game = GameManager("moyen", headless=True, ai_only=True)
+        self.game.save_manager = SaveManager(self.temp_dir.name)
+        self.game.start_game()
+        for _ in range(5):
+            self.game.play_turn()
+                
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        
+    def test_round_trip(self):
+        state = self.game.snapshot_state()
+        state['achievements'] = ['first_win']
+        state['declared_color'] = Color.GREEN.value
+        decoded = decode_state(encode_state(state))
+        
+        for key in ('difficulty', 'current_player', 'direction', 'declared_color', 'scores',
+                    'players', 'discard_pile', 'draw_pile', 'achievements', 'game_stats'):
+            self.assertEqual(decoded[key], state[key], key)
+            
+    def test_achievements_round_trip(self):
+        state = self.game.snapshot_state()
+        state['achievements'] = ['veteran', 'first_win']
+        self.assertEqual(sorted(decode_state(encode_state(state))['achievements']),
+                         ['first_win', 'veteran'])
+        # Tout succès déclaré a son bit ; un succès inconnu n'est pas perdu en silence
+        self.assertLessEqual(set(ACHIEVEMENT_RULES), set(ACHIEVEMENT_IDS))
+        state['achievements'] = ['inconnu']
+        with self.assertRaises(ValueError):
+            encode_state(state)
+            
+    def test_corruption_detected(self):
+        data = bytearray(encode_state(self.game.snapshot_state()))
+        data[-3] ^= 0xFF
+        
+        with self.assertRaises(ValueError):
+            decode_state(bytes(data))
+            
+    def test_save_and_load_binary(self):
+        expected = self.game.snapshot_state()
+        self.assertTrue(self.game.save_current_game())
+        
+        saves = self.game.save_manager.list_saves()
+        self.assertTrue(saves[0]['filename'].endswith('.uno'))
+        loaded = GameManager("facile", headless=True)
+        loaded.save_manager = self.game.save_manager
+        self.assertTrue(loaded.load_game(saves[0]['filename']))
+        
+        state = loaded.snapshot_state()
+        for key in ('players', 'discard_pile', 'draw_pile', 'direction', 'game_stats'):
+            self.assertEqual(state[key], expected[key], key)
+            
+    def test_load_legacy_json_save(self):
+        def card_dict(card):
+            return {'color': card.color.value, 'type': card.card_type.value, 'value': card.value}
+            
+        red_wild = {'color': 'rouge', 'type': 'joker', 'value': None}
+        legacy = {
+            'difficulty': 'difficile',
+            'current_player': 2,
+            'direction': -1,
+            'scores': {p.name: 0 for p in self.game.players},
+            'stats': {'cards_played': 4},
+            'players': [
+                {'name': p.name, 'is_ai': p.is_ai, 'hand': [card_dict(c) for c in p.hand]}
+                for p in self.game.players
+            ],
+            'discard_pile': [card_dict(c) for c in self.game.deck.discard_pile] + [red_wild],
+            'achievements': ['comeback'],
+            'game_stats': {'cards_played': 4},
+            'metadata': {'timestamp': '20240101_120000', 'version': '1.0',
+                         'date_created': '2024-01-01T12:00:00'}
+        }
+        path = Path(self.temp_dir.name) / 'uno_save_20240101_120000.json.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(legacy, f, indent=2)
+            
+        loaded = GameManager("facile", headless=True)
+        loaded.save_manager = self.game.save_manager
+        self.assertTrue(loaded.load_game(path.name))
+        
+        self.assertEqual(loaded.difficulty, 'difficile')
+        self.assertEqual(loaded.direction, -1)
+        self.assertIs(loaded.deck.discard_pile[-1], Card(Color.BLACK, CardType.WILD))
+        self.assertEqual(loaded.top_card.color, Color.RED)
+        self.assertEqual(loaded.game_stats['cards_played'], 4)
+        self.assertIn('comeback', loaded.achievements.unlocked)
+        # La pioche reconstruite complète le paquet sans dupliquer de carte
+        in_play = sum(len(p.hand) for p in loaded.players) + len(loaded.deck.discard_pile)
+        self.assertEqual(in_play + len(loaded.deck.cards), 108)
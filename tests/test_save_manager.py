@@ -1,4 +1,7 @@
+import tempfile
 import unittest
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import patch
 from src.game.save_manager import SaveManager
 from src.game.game_manager import GameManager
@@ -10,8 +13,7 @@ class TestSaveManager(unittest.TestCase):
         
     def test_save_achievements(self):
         # Débloquer un achievement
-        self.game.game_stats['games_won'] = 1
-        self.game.achievements.check_achievement('first_win', self.game.game_stats)
+        self.game.achievements.unlocked.add('first_win')
         
         # Sauvegarder
         self.game.save_current_game()
@@ -41,4 +43,88 @@ class TestSaveManager(unittest.TestCase):
         # Vérifier que les stats sont correctement sauvegardées
         self.assertEqual(loaded_state['game_stats']['cards_played'], 10)
         self.assertEqual(loaded_state['game_stats']['special_cards_played'], 3)
-        self.assertEqual(loaded_state['game_stats']['max_cards_in_hand'], 8) 
\ No newline at end of file
+        self.assertEqual(loaded_state['game_stats']['max_cards_in_hand'], 8) 
+
+class TestSaveManifest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_manager = SaveManager(self.temp_dir.name)
+        self.game = GameManager("facile")
+        self.game.save_manager = self.save_manager
+        
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        
+    def test_manifest_written_on_save(self):
+        self.game.start_game()
+        self.assertTrue(self.game.save_current_game())
+        
+        self.assertTrue(self.save_manager.manifest_file.exists())
+        saves = SaveManager(self.temp_dir.name).list_saves()
+        self.assertEqual(len(saves), 1)
+        self.assertEqual([p['cards'] for p in saves[0]['players']], [7, 7, 7, 7])
+        self.assertIsNotNone(saves[0]['checksum'])
+        
+    def test_list_saves_reads_only_manifest(self):
+        self.game.save_current_game()
+        
+        with patch('src.game.save_manager.gzip.open') as mock_open:
+            saves = SaveManager(self.temp_dir.name).list_saves()
+        mock_open.assert_not_called()
+        self.assertEqual(len(saves), 1)
+        
+    def test_manifest_rebuilt_when_missing(self):
+        self.game.start_game()
+        with patch('src.game.save_manager.binary_format.decode_state') as decode_state:
+            self.game.save_current_game()
+        decode_state.assert_not_called()  # entrée écrite sans relire la sauvegarde
+        written = self.save_manager.list_saves()
+        self.save_manager.manifest_file.unlink()
+        
+        saves = SaveManager(self.temp_dir.name).list_saves()
+        self.assertEqual(saves, written)
+        self.assertTrue(self.save_manager.manifest_file.exists())
+        
+    def test_manifest_rebuilt_when_stale(self):
+        self.game.save_current_game()
+        save_file = Path(self.temp_dir.name) / self.save_manager.list_saves()[0]['filename']
+        save_file.unlink()
+        
+        self.assertEqual(SaveManager(self.temp_dir.name).list_saves(), [])
+        
+    def test_rotation_updates_manifest(self):
+        self.save_manager.max_saves = 2
+        for second in range(4):
+            with patch('src.game.save_manager.datetime') as mock_datetime:
+                mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, second)
+                self.save_manager.save_game({'players': []})
+                
+        saves = SaveManager(self.temp_dir.name).list_saves()
+        self.assertEqual([s['filename'] for s in saves],
+                         ['uno_save_20240101_120003.uno', 'uno_save_20240101_120002.uno'])
+        self.assertEqual(len(list(Path(self.temp_dir.name).glob("uno_save_*"))), 2)
+        
+    def test_rotation_removes_oldest_named_save(self):
+        self.save_manager.max_saves = 2
+        for second, name in enumerate(("table_1", None, None)):
+            with patch('src.game.save_manager.datetime') as mock_datetime:
+                mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, second)
+                self.save_manager.save_game({'players': []}, name)
+                
+        self.assertEqual([s['filename'] for s in self.save_manager.list_saves()],
+                         ['uno_save_20240101_120002.uno', 'uno_save_20240101_120001.uno'])
+        self.assertFalse(self.save_manager.save_path("table_1").exists())
+        
+    def test_save_games_named(self):
+        self.game.start_game()
+        state = self.game.snapshot_state()
+        self.save_manager.list_saves()
+        
+        with patch.object(self.save_manager, '_write_manifest') as write_manifest:
+            saved = self.save_manager.save_games([("table_1", state), ("table_2", state)])
+        self.assertEqual(saved, 2)
+        write_manifest.assert_called_once()
+        
+        self.assertTrue(self.save_manager.save_path("table_1").exists())
+        loaded = self.save_manager.load_game(self.save_manager.save_path("table_2").name)
+        self.assertEqual(loaded['players'][0]['hand'], state['players'][0]['hand'])
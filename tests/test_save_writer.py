@@ -0,0 +1,103 @@
+import copy
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+from src.game.game_manager import GameManager
+from src.game.save_manager import SaveManager
+from src.game.save_writer import SaveWriter
+
+class TestSaveWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_manager = SaveManager(self.temp_dir.name)
+        
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        
+    def test_background_save(self):
+        game = GameManager("facile", headless=True, ai_only=True)
+        game.save_manager = self.save_manager
+        game.start_game()
+        results = []
+        
+        future = game.save_current_game_async(results.append)
+        game.flush_saves()
+        
+        self.assertTrue(future.result(timeout=5))
+        self.assertEqual(results, [True])
+        self.assertEqual(len(self.save_manager.list_saves()), 1)
+        
+    def test_back_to_back_saves_are_merged(self):
+        release = threading.Event()
+        started = threading.Event()
+        saved = []
+        
+        def slow_save(state):
+            started.set()
+            release.wait(5)
+            saved.append(state['n'])
+            return True
+            
+        manager = Mock(spec=SaveManager)
+        manager.save_game.side_effect = slow_save
+        writer = SaveWriter(manager)
+        futures = [writer.submit({'n': 0})]
+        started.wait(5)
+        futures += [writer.submit({'n': n}) for n in range(1, 4)]
+        release.set()
+        writer.close()
+        
+        self.assertEqual(saved, [0, 3])
+        self.assertTrue(all(f.result(timeout=5) for f in futures))
+        
+    def test_failure_reported(self):
+        manager = Mock(spec=SaveManager)
+        manager.save_game.side_effect = OSError("disque plein")
+        writer = SaveWriter(manager)
+        results = []
+        
+        future = writer.submit({}, results.append)
+        writer.close()
+        
+        self.assertIsInstance(future.exception(timeout=5), OSError)
+        self.assertEqual(results, [False])
+        
+    def test_quit_drains_pending_saves(self):
+        game = GameManager("facile", headless=True)
+        game.save_manager = self.save_manager
+        game.start_game()
+        game.ui = Mock()
+        game.ui.get_player_move.side_effect = [-2, -4]
+        
+        game.play_turn()
+        
+        self.assertTrue(game.is_game_over())
+        self.assertIsNone(game.save_writer)
+        self.assertEqual(len(self.save_manager.list_saves()), 1)
+        game.end_game()
+        
+    def test_result_is_shown_on_the_game_thread(self):
+        game = GameManager("facile", headless=True)
+        game.save_manager = self.save_manager
+        game.start_game()
+        game.ui = Mock()
+        threads = []
+        game.ui.show_message.side_effect = lambda *args, **kwargs: threads.append(
+            threading.current_thread())
+        game.ui.get_player_move.side_effect = [-2, -2, -4]
+        
+        game.play_turn()
+        
+        self.assertEqual(game.ui.show_message.call_count, 2)
+        self.assertEqual(threads, [threading.main_thread()] * 2)
+        game.end_game()
+
+    def test_game_without_saves_can_be_copied(self):
+        # benchmarks/bench_game_state.py compare GameState à deepcopy(GameManager)
+        game = GameManager("facile", headless=True, ai_only=True)
+        game.start_game()
+
+        copied = copy.deepcopy(game)
+
+        self.assertEqual(copied.top_card, game.top_card)
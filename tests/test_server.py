@@ -0,0 +1,149 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from src.server.client import TableClient, play_game
+from src.server.server import GameServer
+from src.server.table import Table
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = await GameServer(self.temp_dir.name, move_timeout=5.0).start()
+        self.port = self.server.address[1]
+
+    async def asyncTearDown(self):
+        await self.server.shutdown()
+        self.temp_dir.cleanup()
+
+    async def connect(self) -> TableClient:
+        return await TableClient.connect(port=self.port)
+
+    async def join(self, **join) -> TableClient:
+        client = await self.connect()
+        await client.send(dict(type='join', **join))
+        joined = await client.receive()
+        self.assertEqual(joined['type'], 'joined')
+        return client
+
+    async def test_full_game(self):
+        client = await self.connect()
+        result = await play_game(client, "moyen", seed=4)
+        await client.close()
+
+        self.assertEqual(result['type'], 'game_over')
+        self.assertIn(result['winner'], range(4))
+        self.assertGreater(sum(result['scores'].values()), 0)
+
+    async def test_many_tables(self):
+        async def one(seed: int) -> str:
+            client = await self.connect()
+            try:
+                return (await play_game(client, seed=seed))['type']
+            finally:
+                await client.close()
+
+        results = await asyncio.gather(*(one(seed) for seed in range(200)))
+        self.assertEqual(results, ['game_over'] * 200)
+        self.assertEqual(self.server.tables, {})
+
+    async def test_invalid_moves_are_rejected(self):
+        client = await self.join(seed=1)
+        state = await client.receive()
+        self.assertEqual(state['type'], 'state')
+
+        await client.send({'type': 'play', 'card': len(state['hand'])})
+        self.assertEqual((await client.receive())['type'], 'error')
+        client.writer.write(b"pas du json\n")
+        self.assertEqual((await client.receive())['type'], 'error')
+
+        await client.send({'type': 'draw'})
+        self.assertEqual((await client.receive())['type'], 'state')
+        await client.close()
+
+    async def test_timeouts_draw_then_save(self):
+        self.server.move_timeout = 0.05
+        client = await self.join(seed=2)
+        types = []
+        while True:
+            message = await client.receive()
+            types.append(message['type'])
+            if message['type'] == 'saved':
+                break
+        await client.close()
+
+        self.assertEqual(types.count('timeout'), 2)
+        self.assertTrue((self.server.save_manager.save_dir / message['save']).exists())
+
+    async def test_shutdown_saves_and_resumes(self):
+        client = await self.join(seed=3)
+        state = await client.receive()
+
+        await self.server.shutdown()
+        self.assertEqual((await client.receive())['type'], 'saved')
+        save = self.server.save_manager.list_saves()[0]['filename']
+        await client.close()
+
+        self.server = await GameServer(self.temp_dir.name).start()
+        self.port = self.server.address[1]
+        client = await self.join(save=save)
+        resumed = await client.receive()
+        self.assertEqual(resumed['hand'], state['hand'])
+        self.assertEqual(resumed['top'], state['top'])
+        await client.close()
+
+    async def test_watch_table(self):
+        player = await self.join(seed=8)
+        state = await player.receive()
+        spectator = await self.connect()
+        await spectator.send({'type': 'watch', 'table': '1'})
+        snapshot = await spectator.receive()
+        self.assertEqual(snapshot['type'], 'snapshot')
+        self.assertEqual(snapshot['top'], state['top'])
+        self.assertNotIn('hand', snapshot)
+
+        await player.send({'type': 'draw'})
+        delta = await spectator.receive()
+        self.assertEqual(delta['type'], 'delta')
+        self.assertEqual(delta['seq'], snapshot['seq'] + 1)
+        await player.send({'type': 'quit'})
+        # Table fermée : le spectateur est déconnecté
+        while await spectator.receive() is not None:
+            pass
+        await player.close()
+        await spectator.close()
+
+        spectator = await self.connect()
+        await spectator.send({'type': 'watch', 'table': '1'})
+        self.assertEqual((await spectator.receive())['type'], 'error')
+        await spectator.close()
+
+    async def test_inbox_is_bounded(self):
+        self.server.max_pending = 4
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'{"type":"draw"}\n' * 100)
+        reader.feed_eof()
+        table = Table(self.server, "test", reader, writer=None)
+        reading = asyncio.create_task(table._read())
+        await asyncio.sleep(0.05)
+
+        # File pleine : la lecture du socket est suspendue
+        self.assertEqual(table.inbox.qsize(), 4)
+        self.assertFalse(reading.done())
+        messages = [await table.inbox.get() for _ in range(101)]
+        self.assertEqual(len([m for m in messages if m is not None]), 100)
+        self.assertIsNone(messages[-1])
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), "sockets Unix indisponibles")
+    async def test_unix_socket(self):
+        path = os.path.join(self.temp_dir.name, "uno.sock")
+        server = await GameServer(self.temp_dir.name).start(path=path)
+        client = await TableClient.connect(path=path)
+
+        result = await play_game(client, "facile", seed=6)
+        await client.close()
+        await server.shutdown()
+        self.assertEqual(result['type'], 'game_over')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from src.game.game_manager import GameManager
+from src.sim.headless import format_report, play_headless_game, run_batch, simulate
+from src.ui.null_ui import NullUI
+
+class TestSimulation(unittest.TestCase):
+    def test_headless_game_manager(self):
+        game = GameManager("moyen", headless=True, ai_only=True)
+        
+        self.assertIsInstance(game.ui, NullUI)
+        self.assertIsNone(game.save_manager)
+        self.assertTrue(all(player.is_ai for player in game.players))
+        self.assertFalse(game.save_current_game())
+        
+    def test_play_headless_game(self):
+        result = play_headless_game("difficile")
+        
+        self.assertGreater(result['turns'], 0)
+        if result['winner'] is not None:
+            self.assertIn(result['winner'], range(result['seats']))
+            
+    def test_run_batch_is_reproducible(self):
+        first = run_batch(20, "facile", seed=42)
+        second = run_batch(20, "facile", seed=42)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first['games'], 20)
+        self.assertEqual(sum(first['wins']) + first['unfinished'], 20)
+        
+    def test_cached_batch_plays_the_same_games(self):
+        plain = run_batch(20, "moyen", seed=42)
+        cached = simulate(20, workers=1, difficulty="moyen", seed=42, decision_cache=True)
+        
+        self.assertEqual(cached['wins'], plain['wins'])
+        self.assertEqual(cached['turns'], plain['turns'])
+        self.assertGreater(cached['cache_hits'], 0)
+        self.assertIn("cache", format_report(cached))
+        with self.assertRaises(ValueError):
+            simulate(4, engine="numpy", decision_cache=True)
+            
+    def test_simulate_with_workers(self):
+        totals = simulate(12, workers=2, difficulty="moyen", seed=7)
+        
+        self.assertEqual(totals['games'], 12)
+        self.assertEqual(totals['workers'], 2)
+        self.assertEqual(sum(totals['wins']) + totals['unfinished'], 12)
@@ -0,0 +1,82 @@
+import json
+import unittest
+from src.game.game_manager import GameManager
+from src.server.spectator import SpectatorFeed
+
+def play(game: GameManager):
+    while not game.is_game_over():
+        game.play_turn()
+    game.end_game()
+
+def messages(data: list) -> list:
+    return [json.loads(line) for line in data]
+
+class TestSpectatorFeed(unittest.TestCase):
+    def setUp(self):
+        self.game = GameManager("moyen", headless=True, ai_only=True, seed=7)
+        self.game.start_game()
+        for _ in range(5):
+            self.game.play_turn()
+        self.feed = SpectatorFeed(self.game, queue_limit=1000)
+
+    def test_deltas_rebuild_public_state(self):
+        subscriber = self.feed.subscribe()
+        play(self.game)
+        received = messages(subscriber.take())
+
+        state = received[0]
+        self.assertEqual(state['type'], 'snapshot')
+        hands = [p['cards'] for p in state['players']]
+        seq = state['seq']
+        for message in received[1:-1]:
+            self.assertEqual(message['type'], 'delta')
+            self.assertEqual(message['seq'], seq + 1)
+            seq = message['seq']
+            for seat, count in message.get('hands', []):
+                hands[seat] = count
+            if message.get('plays'):
+                state['top'] = message['plays'][-1][1]
+            state['direction'] = message.get('direction', state['direction'])
+
+        end = received[-1]
+        self.assertEqual(end['type'], 'end')
+        self.assertEqual(hands, [len(p.hand) for p in self.game.players])
+        self.assertEqual(state['top'], self.game.top_card.id)
+        self.assertEqual(state['direction'], self.game.direction)
+        self.assertEqual(hands[end['winner']], 0)
+        self.assertTrue(subscriber.closed)
+
+    def test_hands_are_redacted(self):
+        subscriber = self.feed.subscribe()
+        snapshot = messages(subscriber.take())[0]
+        self.assertNotIn('hand', snapshot)
+        for player in snapshot['players']:
+            self.assertEqual(set(player), {'name', 'cards'})
+
+    def test_one_encoding_per_move(self):
+        subscribers = [self.feed.subscribe() for _ in range(10)]
+        self.game.play_turn()
+        self.game.play_turn()
+        deltas = [subscriber.take()[1] for subscriber in subscribers]
+        self.assertTrue(all(delta is deltas[0] for delta in deltas))
+
+    def test_slow_subscriber_is_resynced_then_dropped(self):
+        feed = SpectatorFeed(self.game, queue_limit=3, max_resyncs=1)
+        fast = feed.subscribe()
+        slow = feed.subscribe()
+        while not slow.closed and not self.game.is_game_over():
+            self.game.play_turn()
+            fast.take()
+
+        self.assertTrue(slow.closed)
+        self.assertEqual(feed.resyncs, 1)
+        self.assertEqual(feed.dropped, 1)
+        self.assertNotIn(slow, feed.subscribers)
+        self.assertIn(fast, feed.subscribers)
+
+    def test_close_unsubscribes_from_game(self):
+        self.feed.close()
+        self.assertFalse(self.game.events.active)
+
+if __name__ == '__main__':
+    unittest.main()
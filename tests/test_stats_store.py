@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.game.game_manager import GameManager
+from src.game.stats_store import StatsStore
+from src.sim.headless import run_batch
+
+class TestStatsStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "stats.db")
+        self.store = StatsStore(self.path, batch_size=10)
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def play(self, seed: int, difficulty: str = "moyen") -> GameManager:
+        game = GameManager(difficulty, headless=True, seed=seed)
+        game.players[0].is_ai = True  # le joueur humain joue comme une IA
+        game.stats_store = self.store
+        game.start_game()
+        while not game.is_game_over():
+            game.play_turn()
+        game.end_game()
+        return game
+
+    def test_end_game_records_results(self):
+        games = [self.play(seed) for seed in range(3)]
+        self.store.flush()
+
+        career = self.store.career("Joueur")
+        self.assertEqual(career['moyen']['games'], 3)
+        wins = sum(1 for game in games if not game.players[0].hand)
+        self.assertEqual(career['moyen']['wins'], wins)
+
+        recent = self.store.recent_games("Joueur", "moyen")
+        self.assertEqual(len(recent), 3)
+        self.assertEqual(recent[0]['turns_played'], games[-1].game_stats['turns_played'])
+        self.assertEqual(recent[0]['cards_left'], len(games[-1].players[0].hand))
+        self.assertEqual(set(self.store.achievements("Joueur")), games[-1].achievements.unlocked)
+
+    def test_writes_are_batched(self):
+        for seed in range(9):
+            self.play(seed)
+        reader = sqlite3.connect(self.path)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM games").fetchone()[0], 0)
+        self.play(9)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM games").fetchone()[0], 10)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM results").fetchone()[0], 40)
+        self.assertEqual(reader.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        reader.close()
+
+    def test_leaderboard_by_difficulty(self):
+        easy = [self.play(seed, "facile") for seed in range(4)]
+        self.play(10, "difficile")
+        self.store.flush()
+
+        board = self.store.leaderboard()
+        self.assertEqual(sum(entry['games'] for entry in board), 20)
+        self.assertEqual(sum(entry['wins'] for entry in board), 5)
+        wins = [entry['wins'] for entry in board]
+        self.assertEqual(wins, sorted(wins, reverse=True))
+        hard = self.store.leaderboard("difficile")
+        self.assertEqual(sum(entry['wins'] for entry in hard), 1)
+        summary = self.store.difficulty_summary("facile")
+        self.assertEqual(summary['games'], 4)
+        self.assertAlmostEqual(summary['turns_played'],
+                               sum(game.game_stats['turns_played'] for game in easy) / 4)
+
+    def test_headless_batches_write_to_store(self):
+        self.store.close()
+        totals = run_batch(20, "facile", seed=3, stats_db=self.path)
+        self.store = StatsStore(self.path)
+        finished = totals['games'] - totals['unfinished']
+        self.assertEqual(sum(entry['wins'] for entry in self.store.leaderboard()), finished)
+        self.assertEqual(self.store.career("IA 1")['facile']['wins'], totals['wins'][0])
+
+if __name__ == '__main__':
+    unittest.main()
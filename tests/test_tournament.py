@@ -0,0 +1,103 @@
+import math
+import os
+import tempfile
+import time
+import unittest
+from src.game.ai_strategy import STRATEGIES, register_strategy
+from src.game.game_manager import GameManager
+from src.sim.tournament import (fit_ratings, confidence_intervals, play_match, play_pair,
+                                run_tournament, format_leaderboard, save_leaderboard)
+
+@register_strategy("test_erreur")
+def failing(game, player, playable):
+    raise RuntimeError("stratégie cassée")
+
+@register_strategy("test_lente")
+def slow(game, player, playable):
+    time.sleep(0.5)
+    return playable[0]
+
+@register_strategy("test_triche")
+def cheating(game, player, playable):
+    # Carte non jouable de la main si possible
+    for card in player.hand:
+        if card not in playable:
+            return card
+    return playable[0]
+
+class TestStrategies(unittest.TestCase):
+    def test_player_strategy_overrides_difficulty(self):
+        game = GameManager("facile", headless=True, ai_only=True, seed=5)
+        calls = []
+        register_strategy("test_espion")(lambda g, p, playable: calls.append(p) or playable[0])
+        try:
+            game.players[2].strategy = "test_espion"
+            game.start_game()
+            for _ in range(40):
+                if game.is_game_over():
+                    break
+                game.play_turn()
+        finally:
+            del STRATEGIES["test_espion"]
+        self.assertTrue(calls)
+        self.assertTrue(all(player is game.players[2] for player in calls))
+
+class TestTournament(unittest.TestCase):
+    def test_seats_are_rotated(self):
+        result = play_pair("moyen", "moyen", 20, seed=1)
+        self.assertEqual(result['games'], 20)
+        self.assertEqual(sum(result['wins']) + result['draws'], 20)
+        self.assertEqual(play_pair("moyen", "moyen", 20, seed=1), result)
+
+    def test_errors_are_forfeits(self):
+        result = play_pair("test_erreur", "facile", 4, seed=2)
+        self.assertEqual(result['errors'], [4, 0])
+        self.assertEqual(result['wins'], [0, 4])
+        self.assertIn("stratégie cassée", result['messages'][0])
+
+    def test_slow_move_is_interrupted(self):
+        start = time.perf_counter()
+        match = play_match(["test_lente", "facile"] * 2, seed=3, move_timeout=0.05)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(match['fault'], (0, "temps dépassé"))
+
+    def test_illegal_move_is_a_forfeit(self):
+        result = play_pair("facile", "test_triche", 10, seed=4)
+        self.assertGreater(result['errors'][1], 0)
+        self.assertEqual(result['errors'][0], 0)
+
+    def test_fit_ratings(self):
+        names = ["a", "b", "c"]
+        ratings = fit_ratings(names, {("a", "b"): [7500, 2500], ("b", "c"): [5000, 5000],
+                                      ("a", "c"): [7500, 2500]})
+        self.assertAlmostEqual(sum(ratings.values()) / 3, 1500)
+        self.assertAlmostEqual(ratings["a"] - ratings["b"], 400 * math.log10(3), delta=2)
+        self.assertAlmostEqual(ratings["b"], ratings["c"], delta=0.5)
+
+        low, high = confidence_intervals(names, {("a", "b"): [75, 25], ("b", "c"): [50, 50],
+                                                 ("a", "c"): [75, 25]}, samples=100)["a"]
+        self.assertLess(low, ratings["a"] - 20)
+        self.assertGreater(high, 1500)
+
+        # Une stratégie qui gagne toutes ses parties reste incertaine
+        low, high = confidence_intervals(["a", "b"], {("a", "b"): [40, 0]}, samples=100)["a"]
+        self.assertGreater(high - low, 20)
+
+    def test_run_tournament(self):
+        board = run_tournament(["facile", "difficile", "test_erreur"], games=6, workers=2,
+                               seed=5, modules=["tests.test_tournament"], chunk_size=2)
+        self.assertEqual(board['games'], 18)
+        self.assertEqual(board['ranking'][-1]['strategy'], "test_erreur")
+        self.assertEqual(board['ranking'][-1]['errors'], 12)
+        self.assertIn("test_erreur", format_leaderboard(board))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "classement.json")
+            save_leaderboard(board, path)
+            self.assertTrue(os.path.exists(path))
+
+        with self.assertRaises(ValueError):
+            run_tournament(["facile", "inconnue"])
+
+if __name__ == '__main__':
+    unittest.main()